@@ -0,0 +1,9 @@
+package apitypes
+
+// Revisions holds the revisions of the database tables
+type Revisions struct {
+	// Revision is the highest table revision, it increases on every change
+	Revision int64 `json:"revision" yaml:"revision"`
+	// Tables maps table names to the revision of their last change
+	Tables map[string]int64 `json:"tables" yaml:"tables"`
+}
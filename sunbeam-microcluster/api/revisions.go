@@ -0,0 +1,61 @@
+package api
+
+import (
+	"fmt"
+	"net/http"
+	"strconv"
+	"time"
+
+	"github.com/canonical/lxd/lxd/response"
+	"github.com/canonical/microcluster/v2/rest"
+	"github.com/canonical/microcluster/v2/state"
+
+	"github.com/canonical/snap-openstack/sunbeam-microcluster/access"
+	"github.com/canonical/snap-openstack/sunbeam-microcluster/sunbeam"
+)
+
+// revisionsMaxTimeout bounds how long a client may wait for changes
+const revisionsMaxTimeout = 60 * time.Second
+
+// /1.0/revisions endpoint.
+// GET returns the revisions of the database tables. With the since query
+// parameter, the request is held until the database revision is higher than
+// since or until timeout seconds (default and max 60) have elapsed.
+var revisionsCmd = rest.Endpoint{
+	Path: "revisions",
+
+	Get: access.ClusterCATrustedEndpoint(cmdRevisionsGet, true),
+}
+
+func cmdRevisionsGet(s state.State, r *http.Request) response.Response {
+	query := r.URL.Query()
+	if !query.Has("since") {
+		revisions, err := sunbeam.GetRevisions(r.Context(), s)
+		if err != nil {
+			return response.InternalError(err)
+		}
+
+		return response.SyncResponse(true, revisions)
+	}
+
+	since, err := strconv.ParseInt(query.Get("since"), 10, 64)
+	if err != nil {
+		return response.BadRequest(fmt.Errorf("Invalid since revision: %w", err))
+	}
+
+	timeout := revisionsMaxTimeout
+	if query.Has("timeout") {
+		seconds, err := strconv.ParseFloat(query.Get("timeout"), 64)
+		if err != nil || seconds < 0 {
+			return response.BadRequest(fmt.Errorf("Invalid timeout %q", query.Get("timeout")))
+		}
+		timeout = min(time.Duration(seconds*float64(time.Second)), revisionsMaxTimeout)
+	}
+
+	revisions, err := sunbeam.WaitRevisions(r.Context(), s, since, timeout)
+	if err != nil {
+		return response.InternalError(err)
+	}
+
+	return response.SyncResponse(true, revisions)
+}
@@ -33,6 +33,7 @@ var Servers = map[string]rest.Server{
 					storageBackendCmd,
 					featureGatesCmd,
 					featureGateCmd,
+					revisionsCmd,
 				},
 			},
 			{
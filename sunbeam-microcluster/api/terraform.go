@@ -3,6 +3,7 @@ package api
 import (
 	"bytes"
 	"encoding/json"
+	"fmt"
 	"net/http"
 	"net/url"
 
@@ -82,6 +83,19 @@ func cmdStateGet(s state.State, r *http.Request) response.Response {
 		return response.InternalError(err)
 	}
 
+	// Answer conditional requests without decompressing the state
+	ifNoneMatch := r.Header.Get("If-None-Match")
+	if ifNoneMatch != "" {
+		hash, err := sunbeam.GetTerraformStateHash(r.Context(), s, name)
+		if err == nil && ifNoneMatch == stateETag(hash) {
+			return response.ManualResponse(func(w http.ResponseWriter) error {
+				w.Header().Set("ETag", stateETag(hash))
+				w.WriteHeader(http.StatusNotModified)
+				return nil
+			})
+		}
+	}
+
 	state, err := sunbeam.GetTerraformState(r.Context(), s, name)
 	if err != nil {
 		if err, ok := err.(api.StatusError); ok {
@@ -92,19 +106,25 @@ func cmdStateGet(s state.State, r *http.Request) response.Response {
 		return response.InternalError(err)
 	}
 
-	var jsonState map[string]interface{}
-	err = json.Unmarshal([]byte(state), &jsonState)
-	if err != nil {
-		return response.InternalError(err)
+	if !json.Valid([]byte(state.Data)) {
+		return response.InternalError(fmt.Errorf("Invalid terraform state for %s", name))
 	}
 
 	// Just send state data instead of SyncResponse Json object as
 	// terraform expects just state data.
 	return response.ManualResponse(func(w http.ResponseWriter) error {
-		return util.WriteJSON(w, jsonState, nil)
+		w.Header().Set("Content-Type", "application/json")
+		w.Header().Set("ETag", stateETag(state.Hash))
+		_, err := w.Write([]byte(state.Data))
+		return err
 	})
 }
 
+// stateETag returns the ETag header value for a state digest
+func stateETag(hash string) string {
+	return `"` + hash + `"`
+}
+
 func cmdStatePut(s state.State, r *http.Request) response.Response {
 	var name string
 
@@ -0,0 +1,29 @@
+package database
+
+import (
+	"context"
+	"database/sql"
+	"fmt"
+)
+
+// GetRevisions returns the revision of every tracked table.
+func GetRevisions(ctx context.Context, tx *sql.Tx) (map[string]int64, error) {
+	rows, err := tx.QueryContext(ctx, "SELECT table_name, revision FROM revisions")
+	if err != nil {
+		return nil, fmt.Errorf("Failed to fetch revisions: %w", err)
+	}
+	defer func() { _ = rows.Close() }()
+
+	revisions := map[string]int64{}
+	for rows.Next() {
+		var table string
+		var revision int64
+		err = rows.Scan(&table, &revision)
+		if err != nil {
+			return nil, fmt.Errorf("Failed to scan revision: %w", err)
+		}
+		revisions[table] = revision
+	}
+
+	return revisions, rows.Err()
+}
@@ -4,6 +4,8 @@ package database
 import (
 	"context"
 	"database/sql"
+	"fmt"
+	"strings"
 
 	"github.com/canonical/lxd/lxd/db/schema"
 )
@@ -20,6 +22,7 @@ var SchemaExtensions = []schema.Update{
 	FeatureGatesSchemaUpdate,
 	AddArchAndIsDPUToNodes,
 	AddImageNameToNodes,
+	RevisionsSchemaUpdate,
 }
 
 // NodesSchemaUpdate is schema for table nodes
@@ -164,3 +167,55 @@ CREATE TABLE feature_gates (
 	_, err := tx.Exec(stmt)
 	return err
 }
+
+// RevisionTables are the tables whose changes are tracked in table revisions
+var RevisionTables = []string{
+	"config",
+	"feature_gates",
+	"jujuuser",
+	"manifest",
+	"nodes",
+	"storage_backends",
+}
+
+// RevisionsSchemaUpdate is schema for table revisions
+// Triggers bump the revision of a table on every change with the next value
+// of a sequence shared by all tables, so the highest revision is the revision
+// of the whole database.
+func RevisionsSchemaUpdate(_ context.Context, tx *sql.Tx) error {
+	stmt := `
+CREATE TABLE revisions (
+  table_name                    TEXT     PRIMARY KEY NOT NULL,
+  revision                      INTEGER  NOT NULL DEFAULT 0
+);
+  `
+
+	_, err := tx.Exec(stmt)
+	if err != nil {
+		return err
+	}
+
+	for _, table := range RevisionTables {
+		_, err = tx.Exec("INSERT INTO revisions (table_name) VALUES (?)", table)
+		if err != nil {
+			return err
+		}
+
+		for _, event := range []string{"INSERT", "UPDATE", "DELETE"} {
+			stmt = fmt.Sprintf(`
+CREATE TRIGGER %[1]s_revision_%[2]s AFTER %[3]s ON %[1]s
+BEGIN
+  UPDATE revisions SET revision = (SELECT MAX(revision) FROM revisions) + 1
+  WHERE table_name = '%[1]s';
+END;
+  `, table, strings.ToLower(event), event)
+
+			_, err = tx.Exec(stmt)
+			if err != nil {
+				return err
+			}
+		}
+	}
+
+	return nil
+}
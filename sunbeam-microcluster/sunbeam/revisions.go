@@ -0,0 +1,60 @@
+package sunbeam
+
+import (
+	"context"
+	"database/sql"
+	"time"
+
+	"github.com/canonical/microcluster/v2/state"
+
+	"github.com/canonical/snap-openstack/sunbeam-microcluster/api/apitypes"
+	"github.com/canonical/snap-openstack/sunbeam-microcluster/database"
+)
+
+// revisionsPollInterval is the interval between two database reads while
+// waiting for changes. Changes may be made through any cluster member, the
+// database is the only place to learn about them.
+const revisionsPollInterval = 250 * time.Millisecond
+
+// newRevisions builds Revisions from the table revisions
+func newRevisions(tables map[string]int64) apitypes.Revisions {
+	revisions := apitypes.Revisions{Tables: tables}
+	for _, revision := range tables {
+		revisions.Revision = max(revisions.Revision, revision)
+	}
+	return revisions
+}
+
+// GetRevisions returns the revisions of the database tables
+func GetRevisions(ctx context.Context, s state.State) (apitypes.Revisions, error) {
+	var tables map[string]int64
+
+	err := s.Database().Transaction(ctx, func(ctx context.Context, tx *sql.Tx) error {
+		var err error
+		tables, err = database.GetRevisions(ctx, tx)
+		return err
+	})
+	if err != nil {
+		return apitypes.Revisions{}, err
+	}
+
+	return newRevisions(tables), nil
+}
+
+// WaitRevisions returns the revisions of the database tables once the
+// database revision is higher than since, or when timeout expires.
+func WaitRevisions(ctx context.Context, s state.State, since int64, timeout time.Duration) (apitypes.Revisions, error) {
+	deadline := time.Now().Add(timeout)
+	for {
+		revisions, err := GetRevisions(ctx, s)
+		if err != nil || revisions.Revision > since || !time.Now().Before(deadline) {
+			return revisions, err
+		}
+
+		select {
+		case <-ctx.Done():
+			return revisions, ctx.Err()
+		case <-time.After(min(revisionsPollInterval, time.Until(deadline))):
+		}
+	}
+}
@@ -0,0 +1,27 @@
+package sunbeam
+
+import (
+	"testing"
+)
+
+// TestNewRevisions tests the database revision is the highest table revision
+func TestNewRevisions(t *testing.T) {
+	revisions := newRevisions(map[string]int64{"config": 7, "nodes": 12, "manifest": 0})
+
+	if revisions.Revision != 12 {
+		t.Errorf("Expected revision 12, got %d", revisions.Revision)
+	}
+
+	if len(revisions.Tables) != 3 {
+		t.Errorf("Expected 3 tables, got %d", len(revisions.Tables))
+	}
+}
+
+// TestNewRevisionsEmpty tests a database without changes has revision 0
+func TestNewRevisionsEmpty(t *testing.T) {
+	revisions := newRevisions(map[string]int64{})
+
+	if revisions.Revision != 0 {
+		t.Errorf("Expected revision 0, got %d", revisions.Revision)
+	}
+}
@@ -1,8 +1,16 @@
 package sunbeam
 
 import (
+	"bytes"
+	"compress/gzip"
 	"context"
+	"crypto/sha256"
+	"database/sql"
+	"encoding/base64"
+	"encoding/hex"
 	"encoding/json"
+	"fmt"
+	"io"
 	"net/http"
 	"strings"
 
@@ -10,11 +18,90 @@ import (
 	"github.com/canonical/microcluster/v2/state"
 
 	"github.com/canonical/snap-openstack/sunbeam-microcluster/api/apitypes"
+	"github.com/canonical/snap-openstack/sunbeam-microcluster/database"
 )
 
 const tfstatePrefix = "tfstate-"
 const tflockPrefix = "tflock-"
 
+// Terraform states can weigh megabytes and are replicated on every write,
+// they are stored gzip compressed and base64 encoded, prefixed with the
+// sha256 of the uncompressed document:
+// gzip+sha256:<hex digest>:<base64 compressed state>
+// States stored before compression was introduced are plain JSON documents.
+const tfstateEncodingPrefix = "gzip+sha256:"
+
+// TerraformState is a terraform state document along with its sha256 digest
+type TerraformState struct {
+	Data string
+	Hash string
+}
+
+func hashTerraformState(state string) string {
+	digest := sha256.Sum256([]byte(state))
+	return hex.EncodeToString(digest[:])
+}
+
+// encodeTerraformState compresses the state for storage in the database
+func encodeTerraformState(state string) (string, error) {
+	var buf bytes.Buffer
+
+	writer := gzip.NewWriter(&buf)
+	_, err := writer.Write([]byte(state))
+	if err != nil {
+		return "", err
+	}
+
+	err = writer.Close()
+	if err != nil {
+		return "", err
+	}
+
+	encoded := base64.StdEncoding.EncodeToString(buf.Bytes())
+	return tfstateEncodingPrefix + hashTerraformState(state) + ":" + encoded, nil
+}
+
+// storedTerraformStateHash returns the digest of a stored state without
+// decompressing it
+func storedTerraformStateHash(value string) string {
+	if !strings.HasPrefix(value, tfstateEncodingPrefix) {
+		return hashTerraformState(value)
+	}
+
+	hash, _, _ := strings.Cut(strings.TrimPrefix(value, tfstateEncodingPrefix), ":")
+	return hash
+}
+
+// decodeTerraformState decompresses a state stored in the database
+func decodeTerraformState(value string) (TerraformState, error) {
+	if !strings.HasPrefix(value, tfstateEncodingPrefix) {
+		return TerraformState{Data: value, Hash: hashTerraformState(value)}, nil
+	}
+
+	hash, encoded, found := strings.Cut(strings.TrimPrefix(value, tfstateEncodingPrefix), ":")
+	if !found {
+		return TerraformState{}, fmt.Errorf("Malformed terraform state encoding")
+	}
+
+	compressed, err := base64.StdEncoding.DecodeString(encoded)
+	if err != nil {
+		return TerraformState{}, err
+	}
+
+	reader, err := gzip.NewReader(bytes.NewReader(compressed))
+	if err != nil {
+		return TerraformState{}, err
+	}
+	defer reader.Close()
+
+	data, err := io.ReadAll(reader)
+	if err != nil {
+		return TerraformState{}, err
+	}
+
+	return TerraformState{Data: string(data), Hash: hash}, nil
+}
+
 // GetTerraformStates returns the list of terraform states from the database
 func GetTerraformStates(ctx context.Context, s state.State) ([]string, error) {
 	prefix := tfstatePrefix
@@ -32,10 +119,26 @@ func GetTerraformStates(ctx context.Context, s state.State) ([]string, error) {
 }
 
 // GetTerraformState returns the terraform state from the database
-func GetTerraformState(ctx context.Context, s state.State, name string) (string, error) {
+func GetTerraformState(ctx context.Context, s state.State, name string) (TerraformState, error) {
+	tfstateKey := tfstatePrefix + name
+	value, err := GetConfig(ctx, s, tfstateKey)
+	if err != nil {
+		return TerraformState{}, err
+	}
+
+	return decodeTerraformState(value)
+}
+
+// GetTerraformStateHash returns the digest of the terraform state from the
+// database without decompressing it
+func GetTerraformStateHash(ctx context.Context, s state.State, name string) (string, error) {
 	tfstateKey := tfstatePrefix + name
-	state, err := GetConfig(ctx, s, tfstateKey)
-	return state, err
+	value, err := GetConfig(ctx, s, tfstateKey)
+	if err != nil {
+		return "", err
+	}
+
+	return storedTerraformStateHash(value), nil
 }
 
 // UpdateTerraformState updates the terraform state record in the database
@@ -58,7 +161,19 @@ func UpdateTerraformState(ctx context.Context, s state.State, name string, lockI
 	}
 
 	tfstateKey := tfstatePrefix + name
-	err = UpdateConfig(ctx, s, tfstateKey, state)
+	storedState, err := GetConfig(ctx, s, tfstateKey)
+	if err == nil && storedTerraformStateHash(storedState) == hashTerraformState(state) {
+		// Terraform writes the state several times per apply, skip
+		// replicating unchanged documents
+		return dbLock, nil
+	}
+
+	encodedState, err := encodeTerraformState(state)
+	if err != nil {
+		return dbLock, err
+	}
+
+	err = UpdateConfig(ctx, s, tfstateKey, encodedState)
 	if err != nil {
 		return dbLock, err
 	}
@@ -97,6 +212,9 @@ func GetTerraformLock(ctx context.Context, s state.State, name string) (string,
 }
 
 // UpdateTerraformLock updates the terraform lock record in the database
+//
+// The lock is read and created in a single transaction, so that concurrent
+// requests for a free lock cannot all acquire it
 func UpdateTerraformLock(ctx context.Context, s state.State, name string, lock string) (apitypes.Lock, error) {
 	var reqLock apitypes.Lock
 	var dbLock apitypes.Lock
@@ -106,26 +224,33 @@ func UpdateTerraformLock(ctx context.Context, s state.State, name string, lock s
 		return dbLock, err
 	}
 
-	tflockKey := tflockPrefix + name
-	lockInDb, err := GetConfig(ctx, s, tflockKey)
+	j, err := json.Marshal(reqLock)
 	if err != nil {
-		if err, ok := err.(api.StatusError); ok {
-			// No Lock exists, add lock details in DB
-			if err.Status() == http.StatusNotFound {
-				j, err := json.Marshal(reqLock)
-				if err != nil {
-					return dbLock, err
-				}
+		return dbLock, err
+	}
 
-				err = UpdateConfig(ctx, s, tflockKey, string(j))
-				return dbLock, err
+	tflockKey := tflockPrefix + name
+	acquired := false
+	err = s.Database().Transaction(ctx, func(ctx context.Context, tx *sql.Tx) error {
+		record, err := database.GetConfigItem(ctx, tx, tflockKey)
+		if err != nil {
+			if err, ok := err.(api.StatusError); ok {
+				// No Lock exists, add lock details in DB
+				if err.Status() == http.StatusNotFound {
+					_, err := database.CreateConfigItem(ctx, tx, database.ConfigItem{Key: tflockKey, Value: string(j)})
+					if err != nil {
+						return fmt.Errorf("Failed to record config item: %w", err)
+					}
+					acquired = true
+					return nil
+				}
 			}
+			return err
 		}
-		return dbLock, err
-	}
 
-	err = json.Unmarshal([]byte(lockInDb), &dbLock)
-	if err != nil {
+		return json.Unmarshal([]byte(record.Value), &dbLock)
+	})
+	if err != nil || acquired {
 		return dbLock, err
 	}
 
@@ -139,6 +264,9 @@ func UpdateTerraformLock(ctx context.Context, s state.State, name string, lock s
 }
 
 // DeleteTerraformLock deletes the terraform lock from the database
+//
+// The lock is checked and deleted in a single transaction, so that a lock
+// acquired meanwhile by another request is never deleted
 func DeleteTerraformLock(ctx context.Context, s state.State, name string, lock string) (apitypes.Lock, error) {
 	var reqLock apitypes.Lock
 	var dbLock apitypes.Lock
@@ -149,28 +277,31 @@ func DeleteTerraformLock(ctx context.Context, s state.State, name string, lock s
 	}
 
 	tflockKey := tflockPrefix + name
-	lockInDb, err := GetConfig(ctx, s, tflockKey)
-	if err != nil {
-		if err, ok := err.(api.StatusError); ok {
-			// No Lock exists to unlock, send 200: OK
-			if err.Status() == http.StatusNotFound {
-				return dbLock, nil
+	err = s.Database().Transaction(ctx, func(ctx context.Context, tx *sql.Tx) error {
+		record, err := database.GetConfigItem(ctx, tx, tflockKey)
+		if err != nil {
+			if err, ok := err.(api.StatusError); ok {
+				// No Lock exists to unlock, send 200: OK
+				if err.Status() == http.StatusNotFound {
+					return nil
+				}
 			}
+			return err
 		}
-		return dbLock, err
-	}
 
-	err = json.Unmarshal([]byte(lockInDb), &dbLock)
-	if err != nil {
-		return dbLock, err
-	}
+		err = json.Unmarshal([]byte(record.Value), &dbLock)
+		if err != nil {
+			return err
+		}
 
-	// If the lock from DB and request are same, clear the lock from DB
-	if dbLock.ID == reqLock.ID && dbLock.Operation == reqLock.Operation && dbLock.Who == reqLock.Who {
-		err = DeleteConfig(ctx, s, tflockKey)
-		return dbLock, err
-	}
+		// If the lock from DB and request are same, clear the lock from DB
+		if dbLock.ID == reqLock.ID && dbLock.Operation == reqLock.Operation && dbLock.Who == reqLock.Who {
+			return database.DeleteConfigItem(ctx, tx, tflockKey)
+		}
 
-	// Request has different lock id than in database, send http 409
-	return dbLock, api.StatusErrorf(http.StatusConflict, "Conflict in Lock ID")
+		// Request has different lock id than in database, send http 409
+		return api.StatusErrorf(http.StatusConflict, "Conflict in Lock ID")
+	})
+
+	return dbLock, err
 }
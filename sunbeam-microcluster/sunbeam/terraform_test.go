@@ -0,0 +1,69 @@
+package sunbeam
+
+import (
+	"strings"
+	"testing"
+)
+
+const testTerraformState = `{"version": 4, "serial": 3, "resources": []}`
+
+// TestTerraformStateEncoding tests states survive a storage round trip
+func TestTerraformStateEncoding(t *testing.T) {
+	encoded, err := encodeTerraformState(testTerraformState)
+	if err != nil {
+		t.Fatalf("Failed to encode state: %v", err)
+	}
+
+	if !strings.HasPrefix(encoded, tfstateEncodingPrefix) {
+		t.Errorf("Expected encoded state to start with %q, got %q", tfstateEncodingPrefix, encoded)
+	}
+
+	decoded, err := decodeTerraformState(encoded)
+	if err != nil {
+		t.Fatalf("Failed to decode state: %v", err)
+	}
+
+	if decoded.Data != testTerraformState {
+		t.Errorf("Expected state %q, got %q", testTerraformState, decoded.Data)
+	}
+
+	if decoded.Hash != hashTerraformState(testTerraformState) {
+		t.Errorf("Expected hash %q, got %q", hashTerraformState(testTerraformState), decoded.Hash)
+	}
+
+	if storedTerraformStateHash(encoded) != decoded.Hash {
+		t.Errorf("Expected stored hash %q, got %q", decoded.Hash, storedTerraformStateHash(encoded))
+	}
+}
+
+// TestTerraformStateLegacyDecoding tests plain states stored before compression
+func TestTerraformStateLegacyDecoding(t *testing.T) {
+	decoded, err := decodeTerraformState(testTerraformState)
+	if err != nil {
+		t.Fatalf("Failed to decode state: %v", err)
+	}
+
+	if decoded.Data != testTerraformState {
+		t.Errorf("Expected state %q, got %q", testTerraformState, decoded.Data)
+	}
+
+	if storedTerraformStateHash(testTerraformState) != decoded.Hash {
+		t.Errorf("Expected stored hash %q, got %q", decoded.Hash, storedTerraformStateHash(testTerraformState))
+	}
+}
+
+// TestTerraformStateMalformedDecoding tests corrupted states are reported
+func TestTerraformStateMalformedDecoding(t *testing.T) {
+	testCases := []string{
+		tfstateEncodingPrefix + "abc",
+		tfstateEncodingPrefix + "abc:not base64!",
+		tfstateEncodingPrefix + "abc:bm90IGd6aXA=",
+	}
+
+	for _, value := range testCases {
+		_, err := decodeTerraformState(value)
+		if err == nil {
+			t.Errorf("Expected error decoding %q", value)
+		}
+	}
+}
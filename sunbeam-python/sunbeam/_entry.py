@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+"""Console script entrypoint of the sunbeam CLI.
+
+Commands are handed over to the daemon before the CLI is imported, so a
+forwarded command does not pay the import cost. This module must only use
+the standard library.
+"""
+
+import sys
+
+from sunbeam import daemon
+
+
+def main() -> None:
+    exit_code = daemon.forward(sys.argv)
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from sunbeam.main import main as cli_main  # noqa: PLC0415
+
+    cli_main()
@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+"""Asynchronous client for the sunbeam clusterd API.
+
+The client keeps a single httpx connection pool, requests issued concurrently
+(e.g. with asyncio.gather) are in flight at the same time instead of being
+serialized. Over https, HTTP/2 is negotiated when the h2 package is available
+so concurrent requests are multiplexed over one TLS connection.
+
+httpx clients are bound to the event loop they are used in, use AsyncClient as
+an async context manager within a single asyncio.run.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import ssl
+from typing import Any, Union
+from urllib.parse import unquote
+
+import httpx
+from snaphelpers import Snap
+
+from sunbeam.clusterd.service import (
+    ClusterServiceUnavailableException,
+    raise_remote_exception,
+)
+
+LOG = logging.getLogger(__name__)
+
+UNIX_SCHEME = "http+unix://"
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def _memfd_path(name: str, content: str) -> tuple[int, str]:
+    """Write content to an anonymous memory file, return its fd and path."""
+    fd = os.memfd_create(name, os.MFD_CLOEXEC)
+    os.write(fd, content.encode())
+    return fd, f"/proc/self/fd/{fd}"
+
+
+def ssl_context(
+    certificate_authority: str, certificate: str, private_key: str
+) -> ssl.SSLContext:
+    """Return a mTLS context for the clusterd certificates.
+
+    The certificate pair is loaded from memory files, nothing is written to
+    disk.
+    """
+    ctx = ssl.create_default_context(cadata=certificate_authority)
+    ctx.verify_mode = ssl.CERT_REQUIRED
+    # Microcluster cluster certificate does not respect hostname
+    # The certificate is shared by every member of the cluster
+    ctx.check_hostname = False
+    cert_fd, cert_path = _memfd_path("sunbeam-clusterd.crt", certificate)
+    key_fd, key_path = _memfd_path("sunbeam-clusterd.key", private_key)
+    try:
+        ctx.load_cert_chain(cert_path, key_path)
+    finally:
+        os.close(cert_fd)
+        os.close(key_fd)
+    return ctx
+
+
+class AsyncBaseService:
+    """Base class for the asynchronous clusterd services."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self._client = client
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        if not path.startswith("/"):
+            path = "/" + path
+        LOG.debug("[%s] %s, args=%s", method, path, kwargs)
+        try:
+            response = await self._client.request(method, path, **kwargs)
+        except httpx.TransportError as e:
+            msg = str(e)
+            if isinstance(e, httpx.ConnectError) and (
+                "No such file or directory" in msg
+            ):
+                raise ClusterServiceUnavailableException(
+                    "Sunbeam Cluster socket not found, is clusterd running ?"
+                    " Check with 'snap services openstack.clusterd'",
+                ) from e
+            raise ClusterServiceUnavailableException(msg) from e
+        LOG.debug("Response(%s) = %s", response, response.text)
+
+        if response.is_error:
+            try:
+                body = response.json()
+            except ValueError:
+                body = None
+            raise_remote_exception(body)
+            response.raise_for_status()
+        return response.json()
+
+    async def _get(self, path: str, **kwargs) -> Any:
+        return await self._request("GET", path, **kwargs)
+
+    async def _put(self, path: str, **kwargs) -> Any:
+        return await self._request("PUT", path, **kwargs)
+
+    async def _delete(self, path: str, **kwargs) -> Any:
+        return await self._request("DELETE", path, **kwargs)
+
+
+class AsyncClusterService(AsyncBaseService):
+    """Asynchronous variant of ClusterService, for read-mostly bulk queries."""
+
+    async def get_cluster_members(self) -> list:
+        """List members in the cluster."""
+        cluster = await self._get("/core/1.0/cluster")
+        keys = ["name", "address", "status"]
+        return [
+            {k: v for k, v in member.items() if k in keys}
+            for member in cluster.get("metadata", {})
+        ]
+
+    async def list_nodes(self) -> list[dict]:
+        """List nodes."""
+        nodes = await self._get("/1.0/nodes")
+        return nodes.get("metadata")
+
+    async def list_nodes_by_role(self, role: Union[str, list[str]]) -> list:
+        """List nodes by role."""
+        params = {"role": role}
+        nodes = await self._get("/1.0/nodes", params=params)
+        return nodes.get("metadata")
+
+    async def get_node_info(self, name: str) -> dict:
+        """Fetch node info."""
+        node = await self._get(f"/1.0/nodes/{name}")
+        return node.get("metadata")
+
+    async def get_nodes_info(self, names: list[str]) -> list[dict]:
+        """Fetch the info of several nodes, with requests in flight together."""
+        return list(await asyncio.gather(*map(self.get_node_info, names)))
+
+    async def get_config(self, key: str) -> Any:
+        """Fetch configuration from database."""
+        config = await self._get(f"/1.0/config/{key}")
+        return config.get("metadata")
+
+    async def get_configs(self, keys: list[str]) -> list[Any]:
+        """Fetch several configuration keys, with requests in flight together."""
+        return list(await asyncio.gather(*map(self.get_config, keys)))
+
+    async def update_config(self, key: str, value: Any):
+        """Update configuration in database, create if missing."""
+        await self._put(f"/1.0/config/{key}", content=value)
+
+    async def delete_config(self, key: str):
+        """Remove configuration from database."""
+        await self._delete(f"/1.0/config/{key}")
+
+    async def get_status(self) -> dict[str, dict]:
+        """Get status of the cluster members."""
+        status = await self._get("/1.0/status")
+        return status.get("metadata")
+
+
+class AsyncClient:
+    """An asynchronous client for interacting with the remote client API."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        certificate_authority: str | None = None,
+        certificate: str | None = None,
+        private_key: str | None = None,
+        timeout: int | float | None = None,
+    ):
+        self._endpoint = endpoint
+        if endpoint.startswith(UNIX_SCHEME):
+            transport = httpx.AsyncHTTPTransport(
+                uds=unquote(endpoint[len(UNIX_SCHEME) :])
+            )
+            base_url = "http://clusterd"
+        else:
+            if (
+                certificate_authority is None
+                or certificate is None
+                or private_key is None
+            ):
+                raise ValueError(
+                    "Certificate, private key and certificate authority"
+                    " are required http mode."
+                )
+            transport = httpx.AsyncHTTPTransport(
+                verify=ssl_context(certificate_authority, certificate, private_key),
+                http2=HTTP2,
+            )
+            base_url = endpoint
+        self._client = httpx.AsyncClient(
+            transport=transport, base_url=base_url, timeout=timeout
+        )
+        self.cluster = AsyncClusterService(self._client)
+
+    async def aclose(self) -> None:
+        """Close the connections of the client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        """Close the client when leaving its context."""
+        await self.aclose()
+
+    @classmethod
+    def from_socket(cls) -> "AsyncClient":
+        """Return a client initialized to the clusterd socket."""
+        return cls(UNIX_SCHEME + str(Snap().paths.common / "state" / "control.socket"))
+
+    @classmethod
+    def from_http(
+        cls,
+        endpoint: str,
+        certificate_authority: str | None = None,
+        certificate: str | None = None,
+        private_key: str | None = None,
+    ) -> "AsyncClient":
+        """Return a client initialized to the clusterd http endpoint."""
+        return cls(endpoint, certificate_authority, certificate, private_key)
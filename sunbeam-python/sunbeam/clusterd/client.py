@@ -5,6 +5,7 @@ import atexit
 import os
 import ssl
 import tempfile
+import threading
 from urllib.parse import quote
 
 import requests
@@ -41,6 +42,16 @@ class MTLSAdapter(requests.adapters.HTTPAdapter):
         )
 
 
+_CLIENTS: dict[tuple[str, str | None, str | None, str | None], "Client"] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def clear_client_cache() -> None:
+    """Forget the clients cached by Client.from_socket and Client.from_http."""
+    with _CLIENTS_LOCK:
+        _CLIENTS.clear()
+
+
 def to_file_path_certs(certificate: str, private_key: str) -> tuple[str, str]:
     """Template certpair in tmp files, return the path."""
     cert_fd, cert_path = tempfile.mkstemp(suffix=".crt")
@@ -90,13 +101,34 @@ class Client:
 
         self.cluster = ClusterService(self._session, self._endpoint, self._certs)
 
+    @classmethod
+    def _cached(
+        cls,
+        endpoint: str,
+        certificate_authority: str | None = None,
+        certificate: str | None = None,
+        private_key: str | None = None,
+    ) -> "Client":
+        """Return the process-wide client for the endpoint and credentials.
+
+        Clients keep their session, and with it their connection pool, for the
+        lifetime of the process instead of being rebuilt by every caller.
+        """
+        key = (endpoint, certificate_authority, certificate, private_key)
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                client = cls(endpoint, certificate_authority, certificate, private_key)
+                _CLIENTS[key] = client
+        return client
+
     @classmethod
     def from_socket(cls) -> "Client":
         """Return a client initialized to the clusterd socket."""
         escaped_socket_path = quote(
             str(Snap().paths.common / "state" / "control.socket"), safe=""
         )
-        return cls("http+unix://" + escaped_socket_path)
+        return cls._cached("http+unix://" + escaped_socket_path)
 
     @classmethod
     def from_http(
@@ -111,4 +143,4 @@ class Client:
         If both certificate and private_key are provided, the client will
         use them to authenticate to the server.
         """
-        return cls(endpoint, certificate_authority, certificate, private_key)
+        return cls._cached(endpoint, certificate_authority, certificate, private_key)
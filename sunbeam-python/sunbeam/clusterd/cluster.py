@@ -1,10 +1,12 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import base64
+import binascii
 import json
 import logging
 import secrets
-from typing import Any, Union
+from typing import Any, Iterator, Union
 
 from requests import codes
 from requests.models import HTTPError
@@ -13,6 +15,24 @@ from sunbeam.clusterd import models, service
 
 LOG = logging.getLogger(__name__)
 
+# Seconds clusterd holds a revisions long-poll request without changes, the
+# client waits a bit longer for the response.
+WATCH_TIMEOUT = 30
+WATCH_TIMEOUT_MARGIN = 10
+
+
+def _decode_lock(response) -> dict:
+    """Decode the lock returned by clusterd on lock conflicts.
+
+    clusterd returns the lock held in database as a base64 encoded JSON
+    document.
+    """
+    try:
+        return json.loads(base64.b64decode(response.json()))
+    except (TypeError, ValueError, binascii.Error):
+        LOG.debug("Failed to decode terraform lock from response", exc_info=True)
+        return {}
+
 
 class MicroClusterService(service.BaseService):
     """Client for default MicroCluster Service API."""
@@ -210,6 +230,25 @@ class ExtendedAPIService(service.BaseService):
         plans = self._get("/1.0/terraformstate")
         return plans.get("metadata")
 
+    def get_terraform_state(
+        self, plan: str, etag: str | None = None
+    ) -> tuple[dict | None, str | None]:
+        """Get the terraform state document of plan along with its ETag.
+
+        When etag matches the stored state, the document is not downloaded
+        again and None is returned in its place.
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self._get(
+            f"/1.0/terraformstate/{plan}",
+            headers=headers,
+            redact_response=True,
+            raw_response=True,
+        )
+        if response.status_code == codes.not_modified:
+            return None, etag
+        return response.json(), response.headers.get("ETag")
+
     def list_terraform_locks(self) -> list[str]:
         """List all locks."""
         locks = self._get("/1.0/terraformlock")
@@ -220,6 +259,27 @@ class ExtendedAPIService(service.BaseService):
         lock = self._get(f"/1.0/terraformlock/{plan}")
         return json.loads(lock)
 
+    def lock_terraform_plan(self, plan: str, lock: dict) -> None:
+        """Lock plan.
+
+        Succeeds if the plan is unlocked or already locked with the same lock.
+        Raises TerraformLockConflictException if the plan is locked by another
+        holder, the current lock is attached to the exception when available.
+        """
+        try:
+            self._put(f"/1.0/terraformlock/{plan}", data=json.dumps(lock))
+        except HTTPError as e:
+            if e.response is None:
+                raise e
+            if e.response.status_code == codes.locked:
+                # Lock already held with the same lock information
+                return
+            if e.response.status_code == codes.conflict:
+                raise service.TerraformLockConflictException(
+                    f"Plan {plan!r} is locked", _decode_lock(e.response)
+                ) from e
+            raise e
+
     def unlock_terraform_plan(self, plan: str, lock: dict) -> None:
         """Unlock plan."""
         self._put(f"/1.0/terraformunlock/{plan}", data=json.dumps(lock))
@@ -351,6 +411,48 @@ class ExtendedAPIService(service.BaseService):
         }
         self._put(f"/1.0/feature-gates/{gate_key}", data=json.dumps(data))
 
+    def get_revisions(self) -> models.Revisions:
+        """Get the revisions of the cluster database tables.
+
+        A single small request, use it to check whether data cached from the
+        cluster database is still current.
+        """
+        revisions = self._get("/1.0/revisions")
+        return models.Revisions(**revisions.get("metadata", {}))
+
+    def wait_revisions(
+        self, since_revision: int, timeout: float = WATCH_TIMEOUT
+    ) -> models.Revisions:
+        """Wait for the cluster database revision to exceed since_revision.
+
+        clusterd holds the request until a change is made through any cluster
+        member, or until timeout seconds have elapsed. The current revisions
+        are returned in both cases.
+        """
+        revisions = self._get(
+            "/1.0/revisions",
+            params={"since": since_revision, "timeout": timeout},
+            timeout=timeout + WATCH_TIMEOUT_MARGIN,
+        )
+        return models.Revisions(**revisions.get("metadata", {}))
+
+    def watch(
+        self, since_revision: int | None = None, timeout: float = WATCH_TIMEOUT
+    ) -> Iterator[models.Revisions]:
+        """Yield the revisions of the cluster database each time it changes.
+
+        Starts watching from since_revision, or from the current revision when
+        not provided. Use Revisions.changed_since to find the changed tables.
+        timeout bounds each long-poll request, the iterator never ends.
+        """
+        if since_revision is None:
+            since_revision = self.get_revisions().revision
+        while True:
+            revisions = self.wait_revisions(since_revision, timeout)
+            if revisions.revision > since_revision:
+                since_revision = revisions.revision
+                yield revisions
+
 
 class ClusterService(MicroClusterService, ExtendedAPIService):
     """Lists and manages cluster."""
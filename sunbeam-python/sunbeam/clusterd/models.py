@@ -45,3 +45,22 @@ class FeatureGate(pydantic.BaseModel):
 
 class FeatureGates(pydantic.RootModel[list[FeatureGate]]):
     """Feature gates model."""
+
+
+class Revisions(pydantic.BaseModel):
+    """Revisions of the cluster database tables.
+
+    Every change to a table bumps its revision to the next value of a sequence
+    shared by all tables, revision is the highest of them.
+    """
+
+    revision: int
+    tables: dict[str, int]
+
+    def changed_since(self, previous: "Revisions") -> set[str]:
+        """Return the tables changed since previous revisions."""
+        return {
+            table
+            for table, revision in self.tables.items()
+            if revision != previous.tables.get(table)
+        }
@@ -3,6 +3,7 @@
 
 import logging
 from abc import ABC
+from typing import Any
 
 from requests.exceptions import ConnectionError, HTTPError
 from requests.sessions import Session
@@ -92,6 +93,14 @@ class URLNotFoundException(RemoteException):
     pass
 
 
+class TerraformLockConflictException(RemoteException):
+    """Raised when a terraform lock is already held by another holder."""
+
+    def __init__(self, message: str, lock: dict | None = None):
+        super().__init__(message)
+        self.lock = lock or {}
+
+
 class StorageBackendException(RemoteException):
     """Base exception for storage backend operations."""
 
@@ -100,6 +109,52 @@ class StorageBackendNotFoundException(StorageBackendException):
     """Raised when storage backend is not found."""
 
 
+def raise_remote_exception(body: Any) -> None:
+    """Raise the RemoteException matching a clusterd error response.
+
+    Returns without raising when the error is not a known one, it is up to the
+    caller to raise the original HTTP error.
+    """
+    # Some endpoints (e.g. terraform locks) answer errors with a raw
+    # JSON document instead of a microcluster error response.
+    error = (body.get("error") or "") if isinstance(body, dict) else ""
+    if "remote with name" in error:
+        raise NodeAlreadyExistsException("Already node exists in the sunbeam cluster")
+    elif "not found" == error:
+        raise URLNotFoundException("URL not found")
+    elif "No remote exists with the given name" in error:
+        raise NodeNotExistInClusterException(
+            "Node does not exist in the sunbeam cluster"
+        )
+    elif "Node not found" in error:
+        raise NodeNotExistInClusterException(
+            "Node does not exist in the sunbeam cluster"
+        )
+    elif "Failed to join cluster with the given join token" in error:
+        raise NodeJoinException("Join node to cluster failed with the given token")
+    elif "UNIQUE constraint failed: internal_token_records.name" in error:
+        raise TokenAlreadyGeneratedException("Token already generated for the node")
+    elif "Database is not yet initialized" in error:
+        raise ClusterServiceUnavailableException("Sunbeam Cluster not initialized")
+    elif "InternalTokenRecord not found" in error:
+        raise TokenNotFoundException("Token not found for the node")
+    elif (
+        "Cannot remove cluster members, there are no remaining non-pending members"
+    ) in error:
+        raise LastNodeRemovalFromClusterException(
+            "Cannot remove cluster member as there are no remaining "
+            "non-pending members. Reset the last node instead."
+        )
+    elif "already running" in error:
+        raise ClusterAlreadyBootstrappedException("Already cluster is bootstrapped.")
+    elif "ConfigItem not found" in error:
+        raise ConfigItemNotFoundException("ConfigItem not found")
+    elif "ManifestItem not found" in error:
+        raise ManifestItemNotFoundException("ManifestItem not found")
+    elif "StorageBackend not found" in error:
+        raise StorageBackendNotFoundException("Storage backend not found")
+
+
 class BaseService(ABC):
     """BaseService is the base service class for sunbeam clusterd services."""
 
@@ -134,19 +189,21 @@ class BaseService(ABC):
         """Set the timeout for the service."""
         self._timeout = timeout
 
-    def _request(self, method, path, **kwargs):  # noqa: C901 too complex
+    def _request(self, method, path, **kwargs):
         if path.startswith("/"):
             path = path[1:]
         netloc = self._endpoint
         url = f"{netloc}/{path}"
         redact_response = kwargs.pop("redact_response", False)
+        raw_response = kwargs.pop("raw_response", False)
+        timeout = kwargs.pop("timeout", self._timeout)
         try:
             LOG.debug("[%s] %s, args=%s", method, url, kwargs)
             response = self.__session.request(
                 method=method,
                 url=url,
                 cert=self._certs,
-                timeout=self._timeout,
+                timeout=timeout,
                 **kwargs,
             )
             output = response.text
@@ -166,55 +223,11 @@ class BaseService(ABC):
             response.raise_for_status()
         except HTTPError as e:
             # Do some nice translating to sunbeamdexceptions
-            error = response.json().get("error")
-            if "remote with name" in error:
-                raise NodeAlreadyExistsException(
-                    "Already node exists in the sunbeam cluster"
-                )
-            elif "not found" == error:
-                raise URLNotFoundException("URL not found")
-            elif "No remote exists with the given name" in error:
-                raise NodeNotExistInClusterException(
-                    "Node does not exist in the sunbeam cluster"
-                )
-            elif "Node not found" in error:
-                raise NodeNotExistInClusterException(
-                    "Node does not exist in the sunbeam cluster"
-                )
-            elif "Failed to join cluster with the given join token" in error:
-                raise NodeJoinException(
-                    "Join node to cluster failed with the given token"
-                )
-            elif "UNIQUE constraint failed: internal_token_records.name" in error:
-                raise TokenAlreadyGeneratedException(
-                    "Token already generated for the node"
-                )
-            elif "Database is not yet initialized" in error:
-                raise ClusterServiceUnavailableException(
-                    "Sunbeam Cluster not initialized"
-                )
-            elif "InternalTokenRecord not found" in error:
-                raise TokenNotFoundException("Token not found for the node")
-            elif (
-                "Cannot remove cluster members, there are no remaining "
-                "non-pending members"
-            ) in error:
-                raise LastNodeRemovalFromClusterException(
-                    "Cannot remove cluster member as there are no remaining "
-                    "non-pending members. Reset the last node instead."
-                )
-            elif "already running" in error:
-                raise ClusterAlreadyBootstrappedException(
-                    "Already cluster is bootstrapped."
-                )
-            elif "ConfigItem not found" in error:
-                raise ConfigItemNotFoundException("ConfigItem not found")
-            elif "ManifestItem not found" in error:
-                raise ManifestItemNotFoundException("ManifestItem not found")
-            elif "StorageBackend not found" in error:
-                raise StorageBackendNotFoundException("Storage backend not found")
+            raise_remote_exception(response.json())
             raise e
 
+        if raw_response:
+            return response
         return response.json()
 
     def _get(self, path, **kwargs):
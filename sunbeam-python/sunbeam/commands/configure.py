@@ -4,6 +4,7 @@
 import json
 import logging
 import os
+import threading
 import typing
 from pathlib import Path
 
@@ -25,6 +26,7 @@ from sunbeam.core.terraform import (
     TerraformException,
     TerraformHelper,
     TerraformInitStep,
+    TerraformStateLockedException,
 )
 from sunbeam.steps.configure import CLOUD_CONFIG_SECTION
 
@@ -32,6 +34,10 @@ PCI_CONFIG_SECTION = "PCI"
 DPDK_CONFIG_SECTION = "DPDK"
 
 LOG = logging.getLogger(__name__)
+
+# Admin credentials retrieved by this process, keyed by deployment and model.
+_ADMIN_CREDENTIALS: dict[tuple[str, str], dict] = {}
+_ADMIN_CREDENTIALS_LOCK = threading.Lock()
 console = Console()
 
 
@@ -83,6 +89,21 @@ def dpdk_questions():
     }
 
 
+def clear_admin_credentials(
+    deployment: Deployment | None = None, model: str | None = None
+) -> None:
+    """Forget the cached admin credentials.
+
+    Only the credentials of the given deployment and model are dropped when
+    they are provided.
+    """
+    with _ADMIN_CREDENTIALS_LOCK:
+        if deployment is None or model is None:
+            _ADMIN_CREDENTIALS.clear()
+        else:
+            _ADMIN_CREDENTIALS.pop((deployment.name, model), None)
+
+
 def retrieve_admin_credentials(
     jhelper: JujuHelper, deployment: Deployment, model: str
 ) -> dict:
@@ -91,7 +112,24 @@ def retrieve_admin_credentials(
     Retrieve cloud admin credentials from keystone and
     return as a dict suitable for use with subprocess
     commands.  Variables are prefixed with OS_.
+
+    Credentials are cached for the lifetime of the process, use
+    clear_admin_credentials when they are rejected.
     """
+    key = (deployment.name, model)
+    # Concurrent callers wait for the first retrieval instead of running the
+    # keystone actions again.
+    with _ADMIN_CREDENTIALS_LOCK:
+        if key not in _ADMIN_CREDENTIALS:
+            _ADMIN_CREDENTIALS[key] = _retrieve_admin_credentials(
+                jhelper, deployment, model
+            )
+        return dict(_ADMIN_CREDENTIALS[key])
+
+
+def _retrieve_admin_credentials(
+    jhelper: JujuHelper, deployment: Deployment, model: str
+) -> dict:
     app = "keystone"
     action_cmd = "get-admin-account"
 
@@ -290,9 +328,9 @@ class DemoSetup(BaseStep):
         )
         self.tfhelper.write_tfvars(self.variables, self.answer_file)
         try:
-            self.tfhelper.apply(reporter=context.reporter)
+            self.tfhelper.apply_waiting_for_lock(self.client, reporter=context.reporter)
             return Result(ResultType.COMPLETED)
-        except TerraformException as e:
+        except (TerraformException, TerraformStateLockedException) as e:
             LOG.warning("Error configuring cloud: %r", e)
             return Result(ResultType.FAILED, str(e))
 
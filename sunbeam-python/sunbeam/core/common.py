@@ -741,45 +741,3 @@ def convert_retry_failure_as_result(retry_state: RetryCallState) -> Result:
         return Result(ResultType.FAILED, str(retry_state.outcome.exception()))
     else:
         return Result(ResultType.FAILED)
-
-
-def friendly_terraform_lock_retry_callback(retry_state: RetryCallState) -> Result:
-    """Friendly retry callback for Terraform state lock exceptions.
-
-    Shows user-friendly messages during lock retries
-    instead of verbose Terraform output.
-    """
-    from sunbeam.core.terraform import TerraformStateLockedException
-
-    if retry_state.outcome is not None:
-        exception = retry_state.outcome.exception()
-        if isinstance(exception, TerraformStateLockedException):
-            # Extract lock ID from the error message if possible
-            lock_id = "unknown"
-            error_str = str(exception)
-            if "ID:" in error_str:
-                try:
-                    # Extract lock ID from Terraform output
-                    lines = error_str.split("\n")
-                    for line in lines:
-                        if "ID:" in line:
-                            lock_id = line.split("ID:")[1].strip()
-                            break
-                except Exception:
-                    LOG.debug(
-                        "Failed to extract lock ID from Terraform output: %s",
-                        error_str,
-                    )
-                    pass
-
-            return Result(
-                ResultType.FAILED,
-                f"Terraform state is locked (ID: {lock_id}). "
-                f"This usually resolves automatically. "
-                f"If it persists, use 'sunbeam plans unlock <plan>' to "
-                f"clear stale locks.",
-            )
-        else:
-            return Result(ResultType.FAILED, str(exception))
-    else:
-        return Result(ResultType.FAILED, "Operation failed after retries")
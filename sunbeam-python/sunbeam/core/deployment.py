@@ -5,7 +5,6 @@ import copy
 import enum
 import logging
 import pathlib
-import shutil
 from typing import TYPE_CHECKING, Type
 from urllib.request import proxy_bypass
 
@@ -31,6 +30,7 @@ from sunbeam.core.manifest import (
     FeatureGroupManifest,
     FeatureManifest,
     Manifest,
+    ManifestCache,
     StorageBackendManifests,
     StorageInstanceManifest,
     StorageManifest,
@@ -38,7 +38,7 @@ from sunbeam.core.manifest import (
 )
 from sunbeam.core.openstack import REGION_CONFIG_KEY
 from sunbeam.core.proxy import patch_process_env, should_bypass
-from sunbeam.core.terraform import TerraformHelper
+from sunbeam.core.terraform import TerraformHelper, sync_plan_directory
 from sunbeam.versions import MANIFEST_ATTRIBUTES_TFVAR_MAP, TERRAFORM_DIR_NAMES
 
 if TYPE_CHECKING:
@@ -347,9 +347,10 @@ class Deployment(pydantic.BaseModel):
             return self._manifest
 
         feature_manager = self.get_feature_manager()
-        manifest = Manifest(features=feature_manager.get_all_feature_manifests())
 
         override_manifest = None
+        cache = None
+        cache_key = None
         if manifest_file is not None:
             manifest_dict = yaml.safe_load(manifest_file.read_text("utf-8"))
             override_manifest = self.parse_manifest(manifest_dict)
@@ -357,8 +358,18 @@ class Deployment(pydantic.BaseModel):
         else:
             try:
                 client = self.get_client()
+                latest_manifest = client.cluster.get_latest_manifest()
+                if manifest_id := latest_manifest.get("manifestid"):
+                    snap = Snap()
+                    cache = ManifestCache(snap, self.name)
+                    cache_key = ManifestCache.key(
+                        manifest_id, snap, feature_manager.features()
+                    )
+                    if cached_manifest := cache.load(cache_key):
+                        self._manifest = cached_manifest
+                        return cached_manifest
                 override_manifest = self.parse_manifest(
-                    yaml.safe_load(client.cluster.get_latest_manifest()["data"])
+                    yaml.safe_load(latest_manifest["data"])
                 )
                 LOG.debug("Manifest loaded from clusterd")
             except ClusterServiceUnavailableException:
@@ -388,10 +399,13 @@ class Deployment(pydantic.BaseModel):
                     )
                     LOG.debug("Manifest loaded from embedded manifest")
 
+        manifest = Manifest(features=feature_manager.get_all_feature_manifests())
         if override_manifest is not None:
             override_manifest.validate_against_default(manifest)
             manifest = manifest.merge(override_manifest)
 
+        if cache is not None and cache_key is not None:
+            cache.save(cache_key, manifest)
         self._manifest = manifest
         return manifest
 
@@ -440,8 +454,7 @@ class Deployment(pydantic.BaseModel):
             tfplan_dir = TERRAFORM_DIR_NAMES.get(tfplan, tfplan)
             src = tf_manifest.source
             dst = self.plans_directory / tfplan_dir
-            LOG.debug("Updating %s from %s", dst, src)
-            shutil.copytree(src, dst, dirs_exist_ok=True)
+            source_hash = sync_plan_directory(src, dst)
 
             self._tfhelpers[tfplan] = TerraformHelper(
                 path=dst,
@@ -450,6 +463,7 @@ class Deployment(pydantic.BaseModel):
                 backend="http",
                 env=env,
                 clusterd_address=self.get_clusterd_http_address(),
+                source_hash=source_hash,
             )
 
     @property
@@ -3,6 +3,7 @@
 
 import base64
 import contextlib
+import copy
 import functools
 import ipaddress
 import json
@@ -162,6 +163,108 @@ class ApplicationStatusOverlay(TypedDict, total=False):
     workload_status_message: list[str] | None
 
 
+def _is_unit_of(unit: str, app: str) -> bool:
+    """Whether the unit name belongs to the application."""
+    return unit.partition("/")[0] == app
+
+
+class _AppStatusMatcher:
+    """Precompiled readiness predicate for a single application.
+
+    Expected values are frozen into sets once, and the last result is cached
+    against a snapshot of the relevant unit statuses so applications whose
+    status did not change since the previous tick are not re-evaluated.
+    """
+
+    def __init__(
+        self,
+        units: Collection[str] | None,
+        expected_status: Collection[str],
+        expected_agent_status: Collection[str] | None = None,
+        expected_workload_status_message: Collection[str] | None = None,
+    ):
+        self.units = frozenset(units) if units else None
+        self.expected_status = frozenset(expected_status)
+        self.expected_agent_status = (
+            None if expected_agent_status is None else frozenset(expected_agent_status)
+        )
+        self.expected_workload_status_message = (
+            None
+            if expected_workload_status_message is None
+            else frozenset(expected_workload_status_message)
+        )
+        self._snapshot: tuple | None = None
+        self._ready = False
+
+    def _take_snapshot(
+        self, application_status: "jubilant.statustypes.AppStatus"
+    ) -> tuple:
+        units = application_status.units
+        if self.units is None:
+            # scale is 0 on machine models
+            expected_unit_count = application_status.scale
+            selected = list(units.values())
+        else:
+            expected_unit_count = len(self.units)
+            selected = [unit for name, unit in units.items() if name in self.units]
+
+        # Application is a subordinate, collect status from app instead of units
+        # as units is empty dictionary.
+        if application_status.subordinate_to:
+            subordinate_status = str(application_status.app_status.current)
+            unit_states: tuple = ()
+        else:
+            subordinate_status = None
+            unit_states = tuple(
+                (
+                    unit.workload_status.current,
+                    unit.workload_status.message,
+                    unit.juju_status.current,
+                )
+                for unit in selected
+            )
+        return (expected_unit_count, len(selected), subordinate_status, unit_states)
+
+    def _evaluate(self, snapshot: tuple) -> bool:
+        expected_unit_count, unit_count, subordinate_status, unit_states = snapshot
+        if expected_unit_count != 0 and expected_unit_count != unit_count:
+            return False
+
+        if subordinate_status is not None:
+            app_status = {subordinate_status}
+            agent_status: set[str] = set()
+            workload_status_message: set[str] = set()
+        else:
+            app_status = {current for current, _, _ in unit_states if current}
+            workload_status_message = {
+                message for _, message, _ in unit_states if message
+            }
+            agent_status = {agent for _, _, agent in unit_states if agent}
+
+        return (
+            bool(app_status)
+            and app_status <= self.expected_status
+            and (
+                self.expected_agent_status is None
+                or agent_status <= self.expected_agent_status
+            )
+            and (
+                self.expected_workload_status_message is None
+                # No status message on workload
+                or not workload_status_message
+                or workload_status_message <= self.expected_workload_status_message
+            )
+        )
+
+    def matches(self, application_status: "jubilant.statustypes.AppStatus") -> bool:
+        """Whether the application reached the desired status."""
+        snapshot = self._take_snapshot(application_status)
+        if snapshot != self._snapshot:
+            self._ready = self._evaluate(snapshot)
+            self._snapshot = snapshot
+        return self._ready
+
+
 def build_pre_status_overlay(
     apps: list[str],
     pre_status: dict[str, str],
@@ -258,6 +361,20 @@ class JujuHelper:
         self.controller: str = controller.name
         self._juju = jubilant.Juju()
 
+    def for_worker(self) -> "JujuHelper":
+        """Return a helper to run commands from a worker thread.
+
+        Commands select their model on the juju client, which therefore must
+        not be shared between threads. The returned helper has its own juju
+        client and shares the model lookups of this helper.
+        """
+        helper = copy.copy(self)
+        helper._juju = jubilant.Juju(
+            wait_timeout=self._juju.wait_timeout, cli_binary=self._juju.cli_binary
+        )
+        helper.get_model = self.get_model  # type: ignore[method-assign]
+        return helper
+
     def cli(
         self,
         *args: str,
@@ -679,6 +796,19 @@ class JujuHelper:
         with self._model(model) as juju:
             juju.remove_unit(unit)
 
+    def remove_units(self, units: typing.Sequence[str], model: str):
+        """Remove units, of any application, with a single request.
+
+        :units: Unit tags
+        :model: Name of the model where the units are located
+        """
+        if not units:
+            return
+        for unit in units:
+            self._validate_unit(unit)
+        with self._model(model) as juju:
+            juju.remove_unit(*units)
+
     def show_unit(self, model: str, unit_name: str) -> dict:
         """Show information about a unit.
 
@@ -1402,53 +1532,12 @@ class JujuHelper:
         :expected_agent_status: Expected agent status values.
         :expected_workload_status_message: Expected workload status messages.
         """
-        units = application_status.units
-        app_status: set[str] = set()
-        agent_status: set[str] = set()
-        workload_status_message: set[str] = set()
-        # Application is a subordinate, collect status from app instead of units
-        # as units is empty dictionary.
-        if application_status.subordinate_to:
-            app_status = {str(application_status.app_status.current)}
-        else:
-            for name, unit in units.items():
-                if len(unit_list) == 0 or name in unit_list:
-                    if unit.workload_status.current:
-                        app_status.add(unit.workload_status.current)
-                    if unit.workload_status.message:
-                        workload_status_message.add(unit.workload_status.message)
-                    if unit.juju_status.current:
-                        agent_status.add(unit.juju_status.current)
-
-        if len(unit_list) == 0:
-            # scale is 0 on machine models
-            expected_unit_count = application_status.scale
-            unit_count = len(units)
-        else:
-            expected_unit_count = len(unit_list)
-            unit_count = len([unit for unit in units if unit in unit_list])
-
-        has_expected_unit_count = (
-            expected_unit_count == 0 or expected_unit_count == unit_count
-        )
-        has_expected_app_status = len(app_status) > 0 and app_status.issubset(
-            expected_status
-        )
-        has_expected_agent_status = (
-            expected_agent_status is None
-            or agent_status.issubset(expected_agent_status)
-        )
-        has_expected_workload_status_message = (
-            expected_workload_status_message is None
-            or len(workload_status_message) == 0  # No status message on workload
-            or workload_status_message.issubset(expected_workload_status_message)
-        )
-        return (
-            has_expected_unit_count
-            and has_expected_app_status
-            and has_expected_agent_status
-            and has_expected_workload_status_message
-        )
+        return _AppStatusMatcher(
+            unit_list,
+            expected_status,
+            expected_agent_status,
+            expected_workload_status_message,
+        ).matches(application_status)
 
     def wait_until_desired_status(
         self,
@@ -1491,7 +1580,7 @@ class JujuHelper:
                 unused_overlay_keys,
             )
 
-        app_params = {}
+        matchers: dict[str, _AppStatusMatcher] = {}
         for app in apps:
             app_overlay = overlay.get(app, {})
             unit_list: list[str] | None = None
@@ -1501,11 +1590,13 @@ class JujuHelper:
                 unit_list = (
                     []
                     if overlay_units is None
-                    else [u for u in overlay_units if app in u]
+                    else [u for u in overlay_units if _is_unit_of(u, app)]
                 )
             else:
                 unit_list = (
-                    None if units is None else [unit for unit in units if app in unit]
+                    None
+                    if units is None
+                    else [unit for unit in units if _is_unit_of(unit, app)]
                 )
 
             # Resolve status
@@ -1530,35 +1621,33 @@ class JujuHelper:
                     app_wl_status,
                 )
 
-            app_params[app] = (
-                unit_list or [],
+            matchers[app] = _AppStatusMatcher(
+                unit_list,
                 app_wl_status,
                 app_agent_status,
                 app_wl_msg,
             )
 
+        # Apps are checked in this order, the last app found not ready is
+        # moved first so the next tick can bail out early.
+        order = list(matchers)
+
         def _wait_until_status(status: "jubilant.statustypes.Status"):
             """Check if all applications are in the desired status."""
             ready = True
-            for app, (
-                unit_list,
-                expected_status,
-                expected_agent_status,
-                expected_workload_status_message,
-            ) in app_params.items():
-                if JujuHelper._is_desired_status_achieved(
-                    status.apps[app],
-                    unit_list,
-                    expected_status,
-                    expected_agent_status,
-                    expected_workload_status_message,
-                ):
+            for app in order:
+                if matchers[app].matches(status.apps[app]):
                     if queue is not None:
                         queue.put_nowait((STATUS_READY, app))
-                else:
-                    if queue is not None:
-                        queue.put_nowait((STATUS_NOT_READY, app))
-                    ready = False
+                    continue
+
+                ready = False
+                if queue is None:
+                    # Nobody tracks per app progress, one app not ready is enough.
+                    order.remove(app)
+                    order.insert(0, app)
+                    break
+                queue.put_nowait((STATUS_NOT_READY, app))
             return ready
 
         with self._model(model) as juju:
@@ -3,6 +3,8 @@
 
 import copy
 import logging
+import pickle  # noqa: S403
+import shutil
 import typing
 from pathlib import Path
 from typing import Any
@@ -586,6 +588,61 @@ def check_storage_modifications_in_manifest(
     return modified
 
 
+class ManifestCache:
+    """On disk cache of fully merged deployment manifests.
+
+    Building the manifest means loading every feature defaults, parsing and
+    validating the clusterd manifest and merging both. The merged manifest
+    only changes when a new manifest is added, the snap is refreshed or the
+    set of features changes, which together form the cache key.
+    """
+
+    def __init__(self, snap: Snap, name: str):
+        self.path = self.directory(snap) / f"{name}.pickle"
+
+    @staticmethod
+    def directory(snap: Snap) -> Path:
+        """Directory holding the cached manifests."""
+        return snap.paths.user_common / "cache" / "manifests"
+
+    @staticmethod
+    def key(manifest_id: str, snap: Snap, features: typing.Iterable[str]) -> str:
+        """Cache key of the manifest."""
+        return ":".join([manifest_id, str(snap.revision), ",".join(sorted(features))])
+
+    def load(self, key: str) -> "Manifest | None":
+        """Return the cached manifest, None if missing or stale."""
+        try:
+            with self.path.open("rb") as file:
+                # The cache lives in the user snap directory, written by us
+                cached = pickle.load(file)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception:
+            LOG.debug("Failed to load cached manifest %s", self.path, exc_info=True)
+            return None
+        if not isinstance(cached, dict) or cached.get("key") != key:
+            return None
+        LOG.debug("Manifest loaded from cache")
+        return cached.get("manifest")
+
+    def save(self, key: str, manifest: "Manifest") -> None:
+        """Cache manifest under key."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with tmp.open("wb") as file:
+                pickle.dump({"key": key, "manifest": manifest}, file)
+            tmp.replace(self.path)
+        except Exception:
+            LOG.debug("Failed to cache manifest %s", self.path, exc_info=True)
+
+    @classmethod
+    def invalidate(cls, snap: Snap) -> None:
+        """Drop every cached manifest."""
+        shutil.rmtree(cls.directory(snap), ignore_errors=True)
+
+
 class AddManifestStep(BaseStep):
     """Add Manifest file to cluster database.
 
@@ -655,6 +712,7 @@ class AddManifestStep(BaseStep):
             id = self.client.cluster.add_manifest(
                 data=yaml.safe_dump(self.manifest_content)
             )
+            ManifestCache.invalidate(self.snap)
             return Result(ResultType.COMPLETED, id)
         except Exception as e:
             LOG.debug("Failed to add manifest to cluster db: %r", e)
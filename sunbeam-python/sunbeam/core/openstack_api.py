@@ -4,15 +4,20 @@
 import logging
 import typing
 
-from sunbeam.commands.configure import retrieve_admin_credentials
+from sunbeam.commands.configure import (
+    clear_admin_credentials,
+    retrieve_admin_credentials,
+)
 from sunbeam.core.deployment import Deployment
 from sunbeam.core.juju import JujuHelper
 from sunbeam.core.openstack import OPENSTACK_MODEL
 from sunbeam.lazy import LazyImport
 
 if typing.TYPE_CHECKING:
+    import keystoneauth1.exceptions as ks_exceptions
     import openstack
 else:
+    ks_exceptions = LazyImport("keystoneauth1.exceptions")
     openstack = LazyImport("openstack")
 
 LOG = logging.getLogger(__name__)
@@ -23,11 +28,26 @@ def get_admin_connection(
 ) -> "openstack.connection.Connection":
     """Return a connection to keystone using admin credentials.
 
+    The admin credentials are cached for the process, when keystone rejects
+    them they are retrieved again and the connection retried once.
+
     :param jhelper: Juju helpers for retrieving admin credentials
     :raises: openstack.exceptions.SDKException
     """
-    admin_auth_info = retrieve_admin_credentials(jhelper, deployment, OPENSTACK_MODEL)
-    conn = openstack.connect(
+    conn = _connect(retrieve_admin_credentials(jhelper, deployment, OPENSTACK_MODEL))
+    try:
+        conn.session.get_token()
+    except ks_exceptions.Unauthorized:
+        LOG.debug("Admin credentials rejected by keystone, retrieving them again")
+        clear_admin_credentials(deployment, OPENSTACK_MODEL)
+        conn = _connect(
+            retrieve_admin_credentials(jhelper, deployment, OPENSTACK_MODEL)
+        )
+    return conn
+
+
+def _connect(admin_auth_info: dict) -> "openstack.connection.Connection":
+    return openstack.connect(
         auth_url=admin_auth_info.get("OS_AUTH_URL"),
         username=admin_auth_info.get("OS_USERNAME"),
         password=admin_auth_info.get("OS_PASSWORD"),
@@ -35,7 +55,6 @@ def get_admin_connection(
         user_domain_name=admin_auth_info.get("OS_USER_DOMAIN_NAME"),
         project_domain_name=admin_auth_info.get("OS_PROJECT_DOMAIN_NAME"),
     )
-    return conn
 
 
 def guests_on_hypervisor(
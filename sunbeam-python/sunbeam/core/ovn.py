@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from collections.abc import Iterable
+from typing import Any
 
 from sunbeam.clusterd.client import Client
 from sunbeam.core.common import Role
@@ -12,16 +13,77 @@ DEFAULT_ARCHITECTURE = "amd64"
 ARM64_ARCHITECTURE = "arm64"
 
 
+MICROOVN_ROLES = (Role.CONTROL, Role.COMPUTE, Role.NETWORK)
+
+
+class NodeSnapshot:
+    """Cluster nodes indexed by role, machine ID and architecture.
+
+    Nodes without a machine ID are not indexed.
+    """
+
+    def __init__(self, nodes: list[dict[str, Any]]):
+        self.nodes = nodes
+        self.machine_ids_by_role: dict[str, set[str]] = {}
+        self.architectures: dict[str, str] = {}
+        for node in nodes:
+            machineid = node.get("machineid")
+            if machineid in (-1, None):
+                continue
+            machine_id = str(machineid)
+            self.architectures[machine_id] = node.get("arch") or DEFAULT_ARCHITECTURE
+            for role in node.get("role") or []:
+                self.machine_ids_by_role.setdefault(role, set()).add(machine_id)
+
+    def machine_ids(
+        self, roles: Iterable[Role], architecture: str | None = None
+    ) -> set[str]:
+        """Return machine IDs of nodes with any of roles.
+
+        :param roles: roles to look up
+        :param architecture: if set, only return machines with this arch
+        """
+        machine_ids: set[str] = set()
+        for role in roles:
+            machine_ids.update(self.machine_ids_by_role.get(role.name.lower(), ()))
+        if architecture is None:
+            return machine_ids
+        return {
+            machine_id
+            for machine_id in machine_ids
+            if self.architectures[machine_id] == architecture
+        }
+
+
 class OvnManager:
+    """Answer MicroOVN placement queries from a snapshot of the cluster nodes.
+
+    The snapshot is fetched with a single clusterd call on first use and kept
+    for the lifetime of the manager, usually the plan it was created for. Call
+    refresh when the nodes changed in between.
+    """
+
     def __init__(self, client: Client):
         self.client = client
+        self._snapshot: NodeSnapshot | None = None
+
+    @property
+    def snapshot(self) -> NodeSnapshot:
+        """Return the node snapshot, fetch it if needed."""
+        if self._snapshot is None:
+            self._snapshot = NodeSnapshot(self.client.cluster.list_nodes())
+        return self._snapshot
+
+    def refresh(self) -> None:
+        """Drop the node snapshot, the next query fetches the nodes again."""
+        self._snapshot = None
 
     def get_roles_for_microovn(self) -> set[Role]:
         """Get list of roles where microovn is necessary.
 
         :return: set of roles
         """
-        return {Role.CONTROL, Role.COMPUTE, Role.NETWORK}
+        return set(MICROOVN_ROLES)
 
     def is_microovn_necessary(self, roles: Iterable[Role]) -> bool:
         """Check if microovn is necessary for the given roles.
@@ -43,25 +105,10 @@ class OvnManager:
         """
         return (nb_network + nb_compute + nb_control) > 0
 
-    def _list_microovn_nodes(self) -> list[dict]:
-        """Collect cluster nodes that should run MicroOVN."""
-        return (
-            self.client.cluster.list_nodes_by_role("control")
-            + self.client.cluster.list_nodes_by_role("compute")
-            + self.client.cluster.list_nodes_by_role("network")
-        )
-
     def get_token_distributor_machines(self) -> list[str]:
         """Get machine IDs for MicroOVN helper applications."""
-        for role in (Role.CONTROL, Role.COMPUTE, Role.NETWORK):
-            machine_ids: set[str] = set()
-            for node in self.client.cluster.list_nodes_by_role(role.name.lower()):
-                machineid = node.get("machineid")
-                if machineid in (-1, None):
-                    continue
-                arch = node.get("arch") or DEFAULT_ARCHITECTURE
-                if arch == DEFAULT_ARCHITECTURE:
-                    machine_ids.add(str(machineid))
+        for role in MICROOVN_ROLES:
+            machine_ids = self.snapshot.machine_ids([role], DEFAULT_ARCHITECTURE)
             if machine_ids:
                 return sorted(machine_ids)
 
@@ -73,25 +120,14 @@ class OvnManager:
         :param architecture: if set, only return machines with this arch
         :return: list of machine IDs as strings
         """
-        machine_ids: set[str] = set()
-        for node in self._list_microovn_nodes():
-            machineid = node.get("machineid")
-            if machineid in (-1, None):
-                continue
-            arch = node.get("arch") or DEFAULT_ARCHITECTURE
-            if architecture is None or arch == architecture:
-                machine_ids.add(str(machineid))
-        return sorted(machine_ids)
+        return sorted(self.snapshot.machine_ids(MICROOVN_ROLES, architecture))
 
     def get_machines_by_architecture(self) -> dict[str, list[str]]:
         """Get MicroOVN machine IDs grouped by architecture."""
         machine_ids_by_arch: dict[str, set[str]] = {}
-        for node in self._list_microovn_nodes():
-            machineid = node.get("machineid")
-            if machineid in (-1, None):
-                continue
-            arch = node.get("arch") or DEFAULT_ARCHITECTURE
-            machine_ids_by_arch.setdefault(arch, set()).add(str(machineid))
+        for machine_id in self.snapshot.machine_ids(MICROOVN_ROLES):
+            arch = self.snapshot.architectures[machine_id]
+            machine_ids_by_arch.setdefault(arch, set()).add(machine_id)
         return {
             arch: sorted(machine_ids)
             for arch, machine_ids in machine_ids_by_arch.items()
@@ -3,12 +3,12 @@
 
 import abc
 import logging
+import threading
 import typing
 
-import tenacity
-
 from sunbeam.clusterd.client import Client
 from sunbeam.clusterd.service import (
+    ClusterServiceUnavailableException,
     ConfigItemNotFoundException,
 )
 from sunbeam.core.common import (
@@ -17,7 +17,6 @@ from sunbeam.core.common import (
     ResultType,
     Role,
     StepContext,
-    convert_retry_failure_as_result,
     read_config,
     roles_to_str_list,
 )
@@ -55,6 +54,11 @@ else:
 
 LOG = logging.getLogger(__name__)
 
+# Time given to MetalLB to allocate the IPs of services moved to another pool
+LB_IP_POOL_ALLOCATION_TIMEOUT = 300
+# Time given to a watch thread to exit once its client is closed
+WATCH_STOP_TIMEOUT = 10
+
 
 class DeployMachineApplicationStep(BaseStep):
     """Base class to deploy machine application using Terraform cloud."""
@@ -94,6 +98,14 @@ class DeployMachineApplicationStep(BaseStep):
         """Extra args for the terraform apply command."""
         return []
 
+    def scoped_tfvars(self) -> dict[str, list[str]]:
+        """Terraform vars only affecting some resources of the plan.
+
+        When only these tfvars changed, e.g. machine_ids on a node join,
+        the apply is targeted at the listed resources.
+        """
+        return {"machine_ids": [f"juju_application.{self.application}"]}
+
     def get_application_timeout(self) -> int:
         """Application timeout in seconds."""
         return 600
@@ -102,12 +114,6 @@ class DeployMachineApplicationStep(BaseStep):
         """Accepted status to pass wait_application_ready function."""
         return ["active", "unknown"]
 
-    @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
-        stop=tenacity.stop_after_delay(300),
-        retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
-        retry_error_callback=convert_retry_failure_as_result,
-    )
     def run(self, context: StepContext) -> Result:
         """Apply terraform configuration to deploy sunbeam machine."""
         try:
@@ -143,8 +149,9 @@ class DeployMachineApplicationStep(BaseStep):
                 override_tfvars=extra_tfvars,
                 tf_apply_extra_args=self.tf_apply_extra_args(),
                 reporter=context.reporter,
+                scoped_tfvars=self.scoped_tfvars(),
             )
-        except TerraformException as e:
+        except (TerraformException, TerraformStateLockedException) as e:
             return Result(ResultType.FAILED, str(e))
 
         # Note(gboutry): application is in state unknown when it's deployed
@@ -240,11 +247,9 @@ class RemoveMachineUnitsStep(BaseStep):
         """Remove unit from machine application on Juju model."""
         try:
             self.update_status(context, "Removing units")
-            for unit in self.units_to_remove:
-                LOG.debug(
-                    "Removing unit %s from application %s", unit, self.application
-                )
-                self.jhelper.remove_unit(self.application, unit, self.model)
+            units = sorted(self.units_to_remove)
+            LOG.debug("Removing units %s from application %s", units, self.application)
+            self.jhelper.remove_units(units, self.model)
             self.update_status(context, "Waiting for units to be removed")
             self.jhelper.wait_units_gone(
                 list(self.units_to_remove), self.model, self.get_unit_timeout()
@@ -316,10 +321,9 @@ class DestroyMachineApplicationStep(BaseStep):
                 ResultType.COMPLETED or ResultType.FAILED otherwise
         """
         try:
-            state = self.tfhelper.pull_state()
-            self._has_tf_resources = bool(state.get("resources"))
-        except TerraformException:
-            LOG.debug("Failed to pull state", exc_info=True)
+            self._has_tf_resources = bool(self.tfhelper.state_index(self.client))
+        except (TerraformException, ClusterServiceUnavailableException):
+            LOG.debug("Failed to read state", exc_info=True)
 
         try:
             _has_juju_resources = len(self._list_applications(self.model)) > 0
@@ -332,12 +336,6 @@ class DestroyMachineApplicationStep(BaseStep):
 
         return Result(ResultType.COMPLETED)
 
-    @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
-        stop=tenacity.stop_after_delay(300),
-        retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
-        retry_error_callback=convert_retry_failure_as_result,
-    )
     def run(self, context: StepContext) -> Result:
         """Destroy machine application using Terraform."""
         if self._has_tf_resources:
@@ -352,7 +350,7 @@ class DestroyMachineApplicationStep(BaseStep):
                     tf_apply_extra_args=["-destroy"],
                     reporter=context.reporter,
                 )
-            except TerraformException as e:
+            except (TerraformException, TerraformStateLockedException) as e:
                 return Result(ResultType.FAILED, str(e))
 
         timeout_factor = 0.8
@@ -724,36 +722,76 @@ class PatchLoadBalancerServicesIPPoolStep(BaseStep, abc.ABC):
 
         return False
 
-    @tenacity.retry(
-        wait=tenacity.wait_fixed(10),
-        stop=tenacity.stop_after_delay(300),
-        retry=tenacity.retry_if_exception_type(ValueError),
-        reraise=True,
-    )
-    def _wait_for_ip_allocated_from_pool_annotation_update(
-        self, service_name: str, pool_name: str
-    ):
-        """Wait until metallb.io/ip-allocated-from-pool is updated.
+    def _wait_for_ip_allocated_from_pool(
+        self,
+        service_names: typing.Iterable[str],
+        pool_name: str,
+        timeout: float = LB_IP_POOL_ALLOCATION_TIMEOUT,
+    ) -> set[str]:
+        """Wait until metallb.io/ip-allocated-from-pool is updated to pool_name.
 
-        Wait until the ip-allocated-from-pool annotation is updated to pool_name
-        for the service
+        A single watch on the services of the model namespace is shared by all
+        services, with one deadline. Return the services still not allocated
+        from pool_name at the deadline.
         Raises ApiError from lightkube if not connected to k8s
         """
-        service = self._get_service(service_name, find_lb=False)
-        LOG.debug("Waiting for service %s annotations to get updated", service)
-
-        if not service.metadata:
-            raise ValueError(f"Service {service_name} has no metadata")
-
-        service_annotations = service.metadata.annotations
-        if service_annotations is None:
-            service_annotations = {}
+        pending = set(service_names)
+        if not pending:
+            return pending
+        lock = threading.Lock()
+        errors: list[Exception] = []
+        done = threading.Event()
+        stop = threading.Event()
+        # lightkube re-opens a watch closed by the server without yielding, the
+        # watch gets its own client, closed at the deadline so it cannot
+        # outlive the step. The server closes the watch regularly so the thread
+        # notices the closed client even without events.
+        watch_client = l_client.Client(
+            l_kubeconfig.KubeConfig.from_dict(self.kubeconfig),
+            self.model(),
+            trust_env=False,
+        )
 
-        if service_annotations.get(self.lb_allocated_pool_annotation) != pool_name:
-            raise ValueError(
-                f"Service {service_name} annotation {self.lb_allocated_pool_annotation}"
-                f" is not updated to {pool_name}"
-            )
+        def _watch() -> None:
+            try:
+                for _, service in watch_client.watch(
+                    core_v1.Service,
+                    namespace=self.model(),
+                    server_timeout=WATCH_STOP_TIMEOUT,
+                ):
+                    if stop.is_set():
+                        return
+                    if not service.metadata:
+                        continue
+                    annotations = service.metadata.annotations or {}
+                    if annotations.get(self.lb_allocated_pool_annotation) != pool_name:
+                        continue
+                    with lock:
+                        pending.discard(str(service.metadata.name))
+                        if not pending:
+                            return
+            except Exception as e:  # noqa: BLE001
+                if not stop.is_set():
+                    errors.append(e)
+            finally:
+                done.set()
+
+        LOG.debug(
+            "Waiting for services %r %s annotation to get updated",
+            sorted(pending),
+            self.lb_allocated_pool_annotation,
+        )
+        thread = threading.Thread(target=_watch, name="lb-ip-pool-watch", daemon=True)
+        thread.start()
+        done.wait(timeout)
+        with lock:
+            stop.set()
+            result = set(pending)
+        watch_client.close()
+        thread.join(WATCH_STOP_TIMEOUT)
+        if errors:
+            raise errors[0]
+        return result
 
     def is_skip(self, context: StepContext) -> Result:
         """Determines if the step should be skipped or not.
@@ -783,6 +821,7 @@ class PatchLoadBalancerServicesIPPoolStep(BaseStep, abc.ABC):
 
     def run(self, context: StepContext) -> Result:  # noqa: C901
         """Patch LoadBalancer services annotations with LB IP pool."""
+        patched: list[str] = []
         for service_name in self.services():
             try:
                 service = self._get_service(service_name, find_lb=True)
@@ -862,13 +901,18 @@ class PatchLoadBalancerServicesIPPoolStep(BaseStep, abc.ABC):
                 # https://github.com/kubernetes/kubernetes/issues/105610
                 service.metadata.managedFields = None
                 self.kube.apply(service, field_manager="sunbeam")
+                patched.append(service_name)
 
-                try:
-                    self._wait_for_ip_allocated_from_pool_annotation_update(
-                        service_name, self.pool_name
-                    )
-                except ValueError as e:
-                    return Result(ResultType.FAILED, str(e))
+        # MetalLB reconciles all the patched services together, wait for them
+        # at once rather than one after the other.
+        pending = self._wait_for_ip_allocated_from_pool(patched, self.pool_name)
+        if pending:
+            return Result(
+                ResultType.FAILED,
+                f"Services {', '.join(sorted(pending))} annotation "
+                f"{self.lb_allocated_pool_annotation} is not updated to "
+                f"{self.pool_name}",
+            )
 
         return Result(ResultType.COMPLETED)
 
@@ -2,11 +2,16 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import contextlib
+import hashlib
 import json
 import logging
 import os
+import random
+import shutil
 import subprocess
 import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from string import Template
@@ -14,7 +19,11 @@ from string import Template
 from snaphelpers import Snap
 
 from sunbeam.clusterd.client import Client
-from sunbeam.clusterd.service import ConfigItemNotFoundException
+from sunbeam.clusterd.service import (
+    ClusterServiceUnavailableException,
+    ConfigItemNotFoundException,
+    URLNotFoundException,
+)
 from sunbeam.core.common import (
     BaseStep,
     Result,
@@ -29,6 +38,15 @@ from sunbeam.versions import VarMap
 
 LOG = logging.getLogger(__name__)
 TERRAFORM_APPLY_TIMEOUT = 1200  # 20 minutes
+TERRAFORM_LOCK_WAIT_TIMEOUT = 1800  # 30 minutes
+# Same threshold as `sunbeam plans unlock` uses before asking for confirmation
+TERRAFORM_LOCK_STALE_AGE = 3600  # 1 hour
+# Targeted applies skip parts of the plan, force a full apply at least this often
+TERRAFORM_FULL_APPLY_INTERVAL = 86400  # 1 day
+TERRAFORM_FULL_APPLY_KEY = "TerraformLastFullApply"
+# Records of the plan sources synced into, and initialised in, a plan directory
+PLAN_SYNC_RECORD = ".sunbeam-sync.json"
+PLAN_INIT_RECORD = ".sunbeam-init"
 _TF_UI_EVENT_TYPES = {
     "apply_start",
     "apply_complete",
@@ -60,6 +78,63 @@ provider_installation {
 """
 
 
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        for chunk in iter(lambda: file.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _plan_files(src: Path) -> list[Path]:
+    return sorted(path.relative_to(src) for path in src.rglob("*") if path.is_file())
+
+
+def sync_plan_directory(src: Path, dst: Path) -> str:
+    """Synchronise terraform plan sources into a plan directory.
+
+    Plan sources only change on snap refresh, the sync is skipped entirely
+    when the source tree (paths, sizes and modification times) matches the
+    last sync. Otherwise only the files whose content changed are copied,
+    leaving terraform caches in the plan directory untouched.
+
+    Returns the hash of the source tree.
+    """
+    if not src.is_dir():
+        raise FileNotFoundError(f"Terraform plan sources not found at {src}")
+
+    files = _plan_files(src)
+    tree = hashlib.sha256()
+    for file in files:
+        stat = (src / file).stat()
+        tree.update(f"{file}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode())
+    tree_hash = tree.hexdigest()
+
+    dst.mkdir(parents=True, exist_ok=True)
+    record_path = dst / PLAN_SYNC_RECORD
+    try:
+        record = json.loads(record_path.read_text())
+    except (FileNotFoundError, ValueError):
+        record = {}
+    if record.get("tree") == tree_hash and all((dst / file).exists() for file in files):
+        LOG.debug("Plan directory %s up to date with %s", dst, src)
+        return tree_hash
+
+    synced = record.get("files", {})
+    digests = {}
+    for file in files:
+        digest = _file_digest(src / file)
+        digests[str(file)] = digest
+        if synced.get(str(file)) == digest and (dst / file).exists():
+            continue
+        LOG.debug("Updating %s from %s", dst / file, src / file)
+        (dst / file).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src / file, dst / file)
+
+    record_path.write_text(json.dumps({"tree": tree_hash, "files": digests}))
+    return tree_hash
+
+
 class TerraformException(Exception):
     """Terraform related exceptions."""
 
@@ -84,6 +159,203 @@ class TerraformStateLockedException(Exception):
         return self.message
 
 
+class TerraformLockWaiter:
+    """Wait for a plan state lock held in clusterd to be released.
+
+    Waiters poll the lock with a capped exponential backoff and full jitter,
+    so concurrent waiters spread their attempts instead of retrying in lock
+    step. The lock holder and lock age are reported while waiting, locks
+    older than the stale age are reported as such.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        plan: str,
+        timeout: int = TERRAFORM_LOCK_WAIT_TIMEOUT,
+        initial_interval: float = 1,
+        max_interval: float = 30,
+        stale_age: int = TERRAFORM_LOCK_STALE_AGE,
+    ):
+        self.client = client
+        self.plan = plan
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.stale_age = stale_age
+        self.deadline = time.monotonic() + timeout
+
+    def expired(self) -> bool:
+        """Whether the waiter ran out of time."""
+        return time.monotonic() > self.deadline
+
+    def get_lock(self) -> dict | None:
+        """Return the lock held on the plan, None if unlocked."""
+        try:
+            return self.client.cluster.get_terraform_lock(self.plan)
+        except (ConfigItemNotFoundException, URLNotFoundException):
+            return None
+
+    @staticmethod
+    def lock_age(lock: dict) -> float | None:
+        """Return the age of the lock in seconds."""
+        try:
+            created = datetime.fromisoformat(lock["Created"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return (datetime.now(tz=timezone.utc) - created).total_seconds()
+
+    def _report(self, reporter: ProgressReporter | None, lock: dict) -> None:
+        who = lock.get("Who") or "unknown"
+        operation = lock.get("Operation") or "unknown operation"
+        message = f"{self.plan}: waiting for lock held by {who} ({operation})"
+        event_type = "lock_wait"
+        age = self.lock_age(lock)
+        if age is not None:
+            message += f" for {int(age)}s"
+            if age > self.stale_age:
+                event_type = "lock_stale"
+                message += (
+                    ", lock might be stale, consider"
+                    f" `sunbeam plans unlock {self.plan}`"
+                )
+        LOG.debug(message)
+        if reporter is not None:
+            reporter.report(
+                ProgressEvent(
+                    source="terraform",
+                    event_type=event_type,
+                    message=message,
+                    timestamp=datetime.now(tz=timezone.utc),
+                    metadata=lock,
+                )
+            )
+
+    def wait(self, reporter: ProgressReporter | None = None) -> None:
+        """Wait until the plan lock is released.
+
+        Raises TerraformStateLockedException if the lock is still held when
+        the waiter times out.
+        """
+        interval = self.initial_interval
+        while lock := self.get_lock():
+            self._report(reporter, lock)
+            if self.expired():
+                raise TerraformStateLockedException(
+                    f"Timed out waiting for {self.plan} lock held by"
+                    f" {lock.get('Who') or 'unknown'} (ID: {lock.get('ID')})"
+                )
+            time.sleep(random.uniform(0, interval))  # noqa: S311
+            interval = min(interval * 2, self.max_interval)
+
+
+def _index_key_suffix(index_key) -> str:
+    if index_key is None:
+        return ""
+    return f"[{json.dumps(index_key)}]"
+
+
+@dataclass(frozen=True)
+class TerraformStateIndex:
+    """Compact index of the resources recorded in a terraform state.
+
+    Only the resource addresses are kept, attributes are dropped once the
+    index is built. Addresses follow the `terraform state list` format.
+    """
+
+    serial: int
+    lineage: str
+    # resource address -> resource type
+    types: dict[str, str] = field(default_factory=dict)
+    # resource address -> instance addresses
+    instances: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_state(cls, state: dict) -> "TerraformStateIndex":
+        """Build the index out of a terraform state document."""
+        types = {}
+        instances = {}
+        for resource in state.get("resources", []):
+            address = f"{resource['type']}.{resource['name']}"
+            if resource.get("mode") == "data":
+                address = f"data.{address}"
+            if module := resource.get("module"):
+                address = f"{module}.{address}"
+            types[address] = resource["type"]
+            instances[address] = [
+                address + _index_key_suffix(instance.get("index_key"))
+                for instance in resource.get("instances", [])
+            ]
+        return cls(
+            serial=state.get("serial", 0),
+            lineage=state.get("lineage", ""),
+            types=types,
+            instances=instances,
+        )
+
+    def __contains__(self, address: str) -> bool:
+        """Whether the resource or resource instance is in the state."""
+        base = address.partition("[")[0]
+        return base in self.types and (
+            base == address or address in self.instances[base]
+        )
+
+    def __bool__(self) -> bool:
+        """Whether the state holds any resource."""
+        return bool(self.types)
+
+    def addresses(self) -> list[str]:
+        """List resource instance addresses, like `terraform state list`."""
+        return [address for resource in self.instances.values() for address in resource]
+
+    def by_type(self, resource_type: str) -> list[str]:
+        """List the addresses of resources of the given type."""
+        return [
+            address for address, type_ in self.types.items() if type_ == resource_type
+        ]
+
+
+class TerraformStateReader:
+    """Read terraform states straight from clusterd.
+
+    Saves starting terraform and initialising its providers when only the
+    recorded resources are needed. Indexes are cached per plan: unchanged
+    states are not downloaded again thanks to their ETag, and indexes are
+    only rebuilt when the state serial changes.
+    """
+
+    def __init__(self, client: Client):
+        self.client = client
+        self._cache: dict[str, tuple[str | None, TerraformStateIndex]] = {}
+        self._lock = threading.Lock()
+
+    def read(self, plan: str) -> TerraformStateIndex:
+        """Return the state index of the plan.
+
+        An empty index is returned when the plan has no state yet.
+        """
+        with self._lock:
+            etag, cached = self._cache.get(plan, (None, None))
+        try:
+            state, etag = self.client.cluster.get_terraform_state(plan, etag)
+        except ConfigItemNotFoundException:
+            LOG.debug("No terraform state recorded for plan %s", plan)
+            return TerraformStateIndex(serial=0, lineage="")
+
+        with self._lock:
+            if state is None and cached is not None:
+                LOG.debug("Terraform state of plan %s not modified", plan)
+                return cached
+            state = state or {}
+            if (
+                cached is None
+                or cached.serial != state.get("serial")
+                or cached.lineage != state.get("lineage")
+            ):
+                cached = TerraformStateIndex.from_state(state)
+            self._cache[plan] = (etag, cached)
+        return cached
+
+
 class TerraformHelper:
     """Helper for interaction with Terraform."""
 
@@ -96,6 +368,7 @@ class TerraformHelper:
         parallelism: int | None = None,
         backend: str | None = None,
         clusterd_address: str | None = None,
+        source_hash: str | None = None,
     ):
         self.snap = Snap()
         self.path = path
@@ -106,6 +379,8 @@ class TerraformHelper:
         self.backend = backend or "local"
         self.terraform = str(self.snap.paths.snap / "bin" / "terraform")
         self.clusterd_address = clusterd_address
+        self.source_hash = source_hash
+        self._state_reader: TerraformStateReader | None = None
 
     def backend_config(self) -> dict:
         """Get backend configuration for terraform."""
@@ -180,6 +455,19 @@ class TerraformHelper:
             backend_updated = self.write_backend_tf()
         self.write_terraformrc()
 
+        fingerprint = self._init_fingerprint()
+        init_record = self.path / PLAN_INIT_RECORD
+        if (
+            fingerprint is not None
+            and not backend_updated
+            and (self.path / ".terraform").is_dir()
+            and init_record.exists()
+            and init_record.read_text() == fingerprint
+        ):
+            LOG.debug("Plan %s already initialised, skipping init", self.plan)
+            return
+        init_record.unlink(missing_ok=True)
+
         try:
             cmd = [self.terraform, "init", "-upgrade", "-no-color"]
             if backend_updated:
@@ -201,6 +489,24 @@ class TerraformHelper:
             LOG.exception("Terraform init failed: %s", e.stderr)
             raise TerraformException(str(e))
 
+        if fingerprint is not None:
+            init_record.write_text(fingerprint)
+
+    def _init_fingerprint(self) -> str | None:
+        """Fingerprint of everything terraform init depends on.
+
+        Plan sources, backend configuration and the snap revision, which
+        ships terraform and its providers. None when the plan sources
+        are not tracked.
+        """
+        if self.source_hash is None:
+            return None
+        fingerprint = hashlib.sha256()
+        fingerprint.update(self.source_hash.encode())
+        fingerprint.update(json.dumps(self.backend_config(), sort_keys=True).encode())
+        fingerprint.update(str(self.snap.revision).encode())
+        return fingerprint.hexdigest()
+
     def apply(
         self,
         extra_args: list | None = None,
@@ -223,6 +529,34 @@ class TerraformHelper:
             cmd.append(f"-parallelism={self.parallelism}")
         self._run_terraform_command(cmd, os_env, reporter=reporter)
 
+    def apply_waiting_for_lock(
+        self,
+        client: Client,
+        extra_args: list | None = None,
+        reporter: ProgressReporter | None = None,
+        timeout: int = TERRAFORM_LOCK_WAIT_TIMEOUT,
+    ):
+        """Terraform apply, waiting for the state lock when already held.
+
+        Only the http backend stores its lock in clusterd, other backends
+        apply directly.
+        """
+        if self.backend != "http":
+            self.apply(extra_args, reporter=reporter)
+            return
+
+        waiter = TerraformLockWaiter(client, self.plan, timeout=timeout)
+        while True:
+            try:
+                self.apply(extra_args, reporter=reporter)
+                return
+            except TerraformStateLockedException:
+                if waiter.expired():
+                    raise
+                LOG.debug("Plan %s is locked, waiting for lock release", self.plan)
+            # Another waiter can grab the lock first, wait again in that case
+            waiter.wait(reporter)
+
     def destroy(self, reporter: ProgressReporter | None = None):
         """Terraform destroy."""
         os_env = os.environ.copy()
@@ -308,6 +642,18 @@ class TerraformHelper:
             LOG.exception("Terraform state pull failed: %s", e.stderr)
             raise TerraformException(str(e))
 
+    def state_index(self, client: Client) -> TerraformStateIndex:
+        """Index the resources in the plan state.
+
+        With the http backend, the state is read from clusterd directly
+        instead of running terraform.
+        """
+        if self.backend != "http":
+            return TerraformStateIndex.from_state(self.pull_state())
+        if self._state_reader is None or self._state_reader.client is not client:
+            self._state_reader = TerraformStateReader(client)
+        return self._state_reader.read(self.plan)
+
     def state_list(self) -> list:
         """List the Terraform state."""
         os_env = os.environ.copy()
@@ -409,7 +755,7 @@ class TerraformHelper:
 
         self.write_tfvars(updated_tfvars)
         LOG.debug("Applying plan %s with tfvars %s", self.plan, updated_tfvars)
-        self.apply(tf_apply_extra_args, reporter=reporter)
+        self.apply_waiting_for_lock(client, tf_apply_extra_args, reporter=reporter)
 
     def update_tfvars_and_apply_tf(
         self,
@@ -419,6 +765,7 @@ class TerraformHelper:
         override_tfvars: dict | None = None,
         tf_apply_extra_args: list | None = None,
         reporter: ProgressReporter | None = None,
+        scoped_tfvars: dict[str, list[str]] | None = None,
     ) -> None:
         """Updates terraform vars and Apply the terraform.
 
@@ -433,11 +780,13 @@ class TerraformHelper:
         :param tfvar_config: TerraformVar key name used to save tfvar in clusterdb
         :param override_tfvars: Terraform vars to override (computed/runtime)
         :param tf_apply_extra_args: Extra args to terraform apply command
+        :param scoped_tfvars: Mapping of tfvar names to the resource addresses
+            they alone affect. When only scoped tfvars changed since the last
+            run, the apply targets those resources instead of the whole plan.
         """
         # Step 1: Load and filter DB values
-        computed_keys, updated_tfvars = self._load_and_filter_db_tfvars(
-            client, tfvar_config
-        )
+        stored_data = self._read_stored_tfvars(client, tfvar_config)
+        computed_keys, updated_tfvars = self._filter_db_tfvars(stored_data)
 
         # Step 2: Apply manifest values (manifest > DB)
         tfvars_from_manifest = self._get_tfvars(manifest)
@@ -459,42 +808,120 @@ class TerraformHelper:
             update_config(client, tfvar_config, data_to_save)
 
         self.write_tfvars(updated_tfvars)
+        target_args = []
+        # Callers passing their own targets or destroying know what to apply
+        already_scoped = any(
+            arg == "-destroy" or arg.startswith("-target")
+            for arg in tf_apply_extra_args or []
+        )
+        if scoped_tfvars and stored_data is not None and not already_scoped:
+            previous_tfvars = {
+                k: v for k, v in stored_data.items() if k != "_computed_keys"
+            }
+            target_args = self._targeted_apply_args(
+                client, previous_tfvars, updated_tfvars, scoped_tfvars
+            )
         LOG.debug("Applying plan %s with tfvars %s", self.plan, updated_tfvars)
-        self.apply(tf_apply_extra_args, reporter=reporter)
+        self.apply_waiting_for_lock(
+            client, (tf_apply_extra_args or []) + target_args, reporter=reporter
+        )
+        if scoped_tfvars and not target_args and not already_scoped:
+            self._record_full_apply(client)
 
-    def _load_and_filter_db_tfvars(
+    def _full_apply_key(self) -> str:
+        return f"{TERRAFORM_FULL_APPLY_KEY}-{self.plan}"
+
+    def _is_full_apply_due(self, client: Client) -> bool:
+        """Whether the plan has not been fully applied recently."""
+        try:
+            last = read_config(client, self._full_apply_key())
+            applied_at = datetime.fromisoformat(last["timestamp"])
+        except (ConfigItemNotFoundException, KeyError, TypeError, ValueError):
+            return True
+        age = (datetime.now(timezone.utc) - applied_at).total_seconds()
+        return age >= TERRAFORM_FULL_APPLY_INTERVAL
+
+    def _record_full_apply(self, client: Client) -> None:
+        update_config(
+            client,
+            self._full_apply_key(),
+            {"timestamp": datetime.now(timezone.utc).isoformat()},
+        )
+
+    def _targeted_apply_args(
+        self,
+        client: Client,
+        previous_tfvars: dict,
+        tfvars: dict,
+        scoped_tfvars: dict[str, list[str]],
+    ) -> list[str]:
+        """Compute apply args restricting the apply to the changed resources.
+
+        Returns an empty list when a full apply is required: unscoped tfvars
+        changed, nothing changed at all, a target is missing from the state,
+        or the plan has not been fully applied for a while.
+        """
+        changed = {
+            key
+            for key in previous_tfvars.keys() | tfvars.keys()
+            if previous_tfvars.get(key) != tfvars.get(key)
+        }
+        if not changed or not changed.issubset(scoped_tfvars):
+            return []
+
+        targets = sorted({address for key in changed for address in scoped_tfvars[key]})
+        if self._is_full_apply_due(client):
+            LOG.debug("Full apply of plan %s is due, not targeting", self.plan)
+            return []
+
+        try:
+            state = self.state_index(client)
+        except (TerraformException, ClusterServiceUnavailableException):
+            LOG.debug("Failed to read state of plan %s, not targeting", self.plan)
+            return []
+        if not all(target in state for target in targets):
+            LOG.debug("Targets %s not all in state of plan %s", targets, self.plan)
+            return []
+
+        LOG.debug("Targeting plan %s apply to %s", self.plan, targets)
+        return [f"-target={target}" for target in targets] + ["-refresh=false"]
+
+    def _read_stored_tfvars(
         self, client: Client, tfvar_config: str | None
-    ) -> tuple[set, dict]:
-        """Load tfvars from DB and filter based on source tracking.
+    ) -> dict | None:
+        """Read the tfvars stored in DB, None if there are none."""
+        if not tfvar_config:
+            return None
+
+        try:
+            return read_config(client, tfvar_config)
+        except ConfigItemNotFoundException:
+            return None
+
+    def _filter_db_tfvars(self, stored_data: dict | None) -> tuple[set, dict]:
+        """Filter tfvars stored in DB based on source tracking.
 
         Returns tuple of (computed_keys, filtered_tfvars).
         """
         computed_keys: set = set()
         updated_tfvars: dict = {}
 
-        if not tfvar_config:
+        if stored_data is None:
             return computed_keys, updated_tfvars
 
-        try:
-            stored_data = read_config(client, tfvar_config)
-            computed_keys = set(stored_data.get("_computed_keys", []))
+        computed_keys = set(stored_data.get("_computed_keys", []))
 
-            # Migration: use preserve list if no computed_keys yet
-            if not computed_keys and "_computed_keys" not in stored_data:
-                computed_keys = set(self.tfvar_map.get("preserve", []))
+        # Migration: use preserve list if no computed_keys yet
+        if not computed_keys and "_computed_keys" not in stored_data:
+            computed_keys = set(self.tfvar_map.get("preserve", []))
 
-            # Filter: keep computed or non-manifest-derivable values
-            current_tfvars = {
-                k: v for k, v in stored_data.items() if k != "_computed_keys"
-            }
-            manifest_derivable = set(self._get_tfvar_names())
-
-            for key, value in current_tfvars.items():
-                if key in computed_keys or key not in manifest_derivable:
-                    updated_tfvars[key] = value
+        # Filter: keep computed or non-manifest-derivable values
+        current_tfvars = {k: v for k, v in stored_data.items() if k != "_computed_keys"}
+        manifest_derivable = set(self._get_tfvar_names())
 
-        except ConfigItemNotFoundException:
-            pass
+        for key, value in current_tfvars.items():
+            if key in computed_keys or key not in manifest_derivable:
+                updated_tfvars[key] = value
 
         return computed_keys, updated_tfvars
 
@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
-from typing import TYPE_CHECKING, Any, Iterable
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 import tenacity
 from rich.status import Status
@@ -10,6 +12,7 @@ from rich.status import Status
 from sunbeam.core.common import BaseStep, SunbeamException
 from sunbeam.core.deployment import Deployment
 from sunbeam.core.openstack_api import get_admin_connection
+from sunbeam.core.progress import ProgressEvent, ProgressReporter
 from sunbeam.lazy import LazyImport
 
 if TYPE_CHECKING:
@@ -29,6 +32,11 @@ WATCHER_APPLICATION = "watcher"
 WAIT_TIMEOUT = 60 * 3
 # Sleep interval (in seconds) between querying watcher resources.
 WAIT_SLEEP_INTERVAL = 5
+# Bounds (in seconds) of the adaptive interval between polls of watcher actions.
+WAIT_MIN_INTERVAL = 1
+WAIT_MAX_INTERVAL = 30
+# Pending actions are fetched one by one up to this count, listed above it.
+PENDING_ACTIONS_GET_THRESHOLD = 5
 ENABLE_MAINTENANCE_AUDIT_TEMPLATE_NAME = "Sunbeam Cluster Maintaining Template"
 ENABLE_MAINTENANCE_STRATEGY_NAME = "host_maintenance"
 ENABLE_MAINTENANCE_GOAL_NAME = "cluster_maintaining"
@@ -102,7 +110,7 @@ def get_workload_balancing_audit_template(
 @tenacity.retry(
     reraise=True,
     stop=tenacity.stop_after_delay(WAIT_TIMEOUT),
-    wait=tenacity.wait_fixed(WAIT_SLEEP_INTERVAL),
+    wait=tenacity.wait_exponential(min=WAIT_MIN_INTERVAL, max=WAIT_SLEEP_INTERVAL),
 )
 def _wait_resource_in_target_state(
     client: "watcher_client.Client",
@@ -188,64 +196,161 @@ def _exec_plan(client: "watcher_client.Client", action_plan: "watcher.ActionPlan
     LOG.debug("Start Watcher action plan %s", action_plan.uuid)
 
 
+class WatcherActionPoller:
+    """Poll the actions of an audit until they all reach an expected state.
+
+    Completed actions are never queried again. While many actions are pending
+    they are refreshed with a single short listing of the audit actions, once
+    few remain they are fetched one by one. The polling interval is reset to
+    min_interval whenever an action changes state and doubles up to
+    max_interval while nothing changes, long running migrations are polled
+    less often without delaying the detection of the next completion.
+    """
+
+    def __init__(
+        self,
+        client: "watcher_client.Client",
+        audit: "watcher.Audit",
+        expected_state: Iterable[str] = ("SUCCEEDED",),
+        reporter: ProgressReporter | None = None,
+        min_interval: float = WAIT_MIN_INTERVAL,
+        max_interval: float = WAIT_MAX_INTERVAL,
+    ):
+        self.client = client
+        self.audit = audit
+        self.expected_state = set(expected_state)
+        self.reporter = reporter
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.states: dict[str, str] = {}
+        self.pending: set[str] = set()
+
+    @property
+    def nb_actions(self) -> int:
+        """Number of actions of the audit."""
+        return len(self.states)
+
+    @property
+    def nb_completed_actions(self) -> int:
+        """Number of actions in an expected state."""
+        return len(self.states) - len(self.pending)
+
+    def _fetch_pending(self) -> list["watcher.Action"]:
+        if len(self.pending) <= PENDING_ACTIONS_GET_THRESHOLD:
+            return [self.client.action.get(uuid) for uuid in sorted(self.pending)]
+        return [
+            action
+            for action in self.client.action.list(audit=self.audit.uuid, limit=0)
+            if action.uuid in self.pending
+        ]
+
+    def _report(self, action: "watcher.Action") -> None:
+        if self.reporter is None:
+            return
+        action_type = getattr(action, "action_type", None) or "action"
+        self.reporter.report(
+            ProgressEvent(
+                source="watcher",
+                event_type="action_state",
+                message=(
+                    f"{action_type} {action.uuid}: {action.state}"
+                    f" ({self.nb_completed_actions}/{self.nb_actions})"
+                ),
+                timestamp=datetime.now(tz=timezone.utc),
+                metadata={
+                    "uuid": action.uuid,
+                    "action_type": action_type,
+                    "state": action.state,
+                },
+            )
+        )
+
+    def _update(self, actions: Iterable["watcher.Action"]) -> bool:
+        """Record the state of actions, return whether any of them changed."""
+        changed = False
+        for action in actions:
+            if self.states.get(action.uuid) == action.state:
+                continue
+            changed = True
+            self.states[action.uuid] = action.state
+            LOG.debug("Watcher action %s is in %s state.", action.uuid, action.state)
+            if action.state in self.expected_state:
+                self.pending.discard(action.uuid)
+            self._report(action)
+            if action.state == "FAILED":
+                raise WatcherActionFailedException(
+                    f"Watcher action {action.uuid} failed"
+                )
+        return changed
+
+    def wait(
+        self,
+        timeout: float | None = None,
+        on_progress: Callable[["WatcherActionPoller"], None] | None = None,
+    ) -> None:
+        """Wait until all the actions of the audit reach an expected state.
+
+        :param timeout: seconds to wait, defaults to WAIT_TIMEOUT per action
+        :param on_progress: called each time an action changes state
+        """
+        actions = self.client.action.list(audit=self.audit.uuid, limit=0)
+        self.states = {}
+        self.pending = {action.uuid for action in actions}
+        if timeout is None:
+            timeout = WAIT_TIMEOUT * len(actions)
+        deadline = time.monotonic() + timeout
+        interval = self.min_interval
+        changed = self._update(actions)
+        while True:
+            if changed and on_progress is not None:
+                on_progress(self)
+            if not self.pending:
+                break
+            if time.monotonic() > deadline:
+                raise SunbeamException(
+                    "Not all actions completed: {}".format(
+                        ",".join(sorted(self.pending))
+                    )
+                )
+            time.sleep(interval)
+            changed = self._update(self._fetch_pending())
+            if changed:
+                interval = self.min_interval
+            else:
+                interval = min(interval * 2, self.max_interval)
+        LOG.debug(
+            "All actions for Watcher audit %s have been successfully completed.",
+            self.audit.uuid,
+        )
+
+
 def wait_until_action_state(
     step: BaseStep,
     audit: "watcher.Audit",
     client: "watcher_client.Client",
     status: Status | None,
     expected_state: Iterable[str] = ["SUCCEEDED"],
+    reporter: ProgressReporter | None = None,
 ):
-    actions = get_actions(client=client, audit=audit)
-    nb_completed_actions = 0
-    nb_actions = len(actions)
-    completed_actions = dict.fromkeys([action.uuid for action in actions], False)
-
     message = (
         step.status
         + "waiting for actions to become expected state"
         + " ({nb_completed_actions}/{nb_actions})"
     )
 
-    timeout = WAIT_TIMEOUT * nb_actions
-    for attempt in tenacity.Retrying(
-        stop=tenacity.stop_after_delay(timeout),
-        wait=tenacity.wait_fixed(WAIT_SLEEP_INTERVAL),
-        retry=tenacity.retry_if_not_exception_type(WatcherActionFailedException),
-        reraise=True,
-    ):
-        with attempt:
-            actions = get_actions(client=client, audit=audit)
-            for action in actions:
-                if completed_actions.get(action.uuid) is True:
-                    continue
-                LOG.debug(
-                    "Watcher action %s is in %s state.", action.uuid, action.state
-                )
-                if action.state == "FAILED":
-                    raise WatcherActionFailedException
-                if action.state in expected_state:
-                    completed_actions[action.uuid] = True
-                    nb_completed_actions = sum(completed_actions.values())
-                    if status is not None:
-                        status.update(
-                            message.format(
-                                nb_completed_actions=nb_completed_actions,
-                                nb_actions=nb_actions,
-                            )
-                        )
-            if nb_completed_actions < nb_actions:
-                raise SunbeamException(
-                    "Not all actions completed: {}".format(
-                        ",".join(
-                            [
-                                action.uuid
-                                for action in actions
-                                if action.state not in expected_state
-                            ]
-                        )
-                    )
+    def _update_status(poller: WatcherActionPoller) -> None:
+        if status is not None:
+            status.update(
+                message.format(
+                    nb_completed_actions=poller.nb_completed_actions,
+                    nb_actions=poller.nb_actions,
                 )
-            LOG.debug(
-                "All actions for Watcher audit %s have been successfully completed.",
-                audit.uuid,
             )
+
+    poller = WatcherActionPoller(
+        client=client,
+        audit=audit,
+        expected_state=expected_state,
+        reporter=reporter,
+    )
+    poller.wait(on_progress=_update_status)
@@ -0,0 +1,326 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+"""Optional per-user daemon amortizing the sunbeam CLI startup cost.
+
+When ``SUNBEAM_DAEMON=1`` is set in the environment, non-interactive
+``sunbeam`` invocations are forwarded to a long-lived daemon which keeps the
+CLI and its third-party libraries imported. For each request the daemon forks a
+child which takes over the client's stdin, stdout and stderr (passed over the
+unix socket), its argv, environment and working directory, and runs the
+regular CLI entrypoint. The exit code is sent back to the client.
+
+Commands are registered in the forked child, as they depend on the current
+deployment and enabled features. Interactive invocations (stdin attached to a
+terminal) always run in-process, since the forked child has no controlling
+terminal to prompt for passwords.
+
+The daemon exits after ``DAEMON_IDLE_TIMEOUT`` seconds without requests, or
+as soon as a client runs from another snap revision. Any failure to reach the
+daemon falls back to in-process execution.
+
+Forwarding happens in ``sunbeam._entry``, before the CLI is imported, so
+this module must only use the standard library.
+"""
+
+import contextlib
+import fcntl
+import importlib
+import json
+import logging
+import os
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import time
+import traceback
+from pathlib import Path
+
+LOG = logging.getLogger(__name__)
+
+DAEMON_ENV = "SUNBEAM_DAEMON"
+DAEMON_IDLE_TIMEOUT = 600
+DAEMON_SOCKET = "sunbeam-daemon.sock"
+DAEMON_LOCK = "sunbeam-daemon.lock"
+
+# Modules kept warm by the daemon, the CLI with its command modules and the
+# heavy third-party libraries. Consoles created at import time are re-detected
+# against the client's terminal in the forked child.
+PRELOAD_MODULES = [
+    "sunbeam.main",
+    "click",
+    "jinja2",
+    "jubilant",
+    "lightkube",
+    "lightkube.resources.core_v1",
+    "openstack",
+    "pydantic",
+    "requests",
+    "rich.console",
+    "rich.progress",
+    "rich.table",
+    "snaphelpers",
+    "tenacity",
+    "yaml",
+]
+
+_ACCEPTED = b"ok"
+_REFUSED = b"stale"
+_MAX_REQUEST = 1024 * 1024
+
+
+def socket_path() -> Path | None:
+    """Return the daemon socket path, None when not running from the snap."""
+    user_common = os.environ.get("SNAP_USER_COMMON")
+    if not user_common:
+        return None
+    return Path(user_common) / DAEMON_SOCKET
+
+
+def _spawn_daemon(path: Path) -> None:
+    """Start the daemon in the background for the next invocations."""
+    with contextlib.suppress(OSError):
+        subprocess.Popen(
+            [sys.executable, "-m", "sunbeam.daemon", str(path)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True,
+        )
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run the command through the daemon.
+
+    Returns the command exit code, or None when the command must run
+    in-process.
+    """
+    if os.environ.get(DAEMON_ENV) != "1" or os.isatty(0):
+        return None
+    path = socket_path()
+    if path is None:
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        _spawn_daemon(path)
+        return None
+
+    with sock, sock.makefile("rb") as replies:
+        request = {
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+        }
+        try:
+            socket.send_fds(sock, [json.dumps(request).encode() + b"\n"], [0, 1, 2])
+            reply = replies.readline().strip()
+        except OSError:
+            return None
+        if not reply.startswith(_ACCEPTED):
+            # The daemon refused the request before running anything.
+            return None
+
+        child = int(reply.split()[1])
+
+        def _relay(signum, frame):
+            with contextlib.suppress(OSError):
+                os.kill(child, signum)
+
+        for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+            signal.signal(signum, _relay)
+
+        status = replies.readline().strip()
+        if not status:
+            print("Error: sunbeam daemon terminated unexpectedly", file=sys.stderr)
+            return 1
+        return int(status)
+
+
+def _preload() -> None:
+    for module in PRELOAD_MODULES:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            # Left to the forked child, which reports the failure.
+            LOG.debug("Failed to preload %s", module, exc_info=True)
+
+
+def _redetect_consoles() -> None:
+    """Detect the client's terminal in consoles created by the daemon.
+
+    Consoles probe their output when created, the daemon's is not a terminal.
+    """
+    console_module = sys.modules.get("rich.console")
+    if console_module is None:
+        return
+    for name, module in list(sys.modules.items()):
+        if not name.startswith(("sunbeam", "rich")):
+            continue
+        for value in list(vars(module).values()):
+            if isinstance(value, console_module.Console):
+                value._color_system = value._detect_color_system()
+
+
+def _peer_uid(conn: socket.socket) -> int:
+    creds = conn.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid
+
+
+def _run_child(
+    conn: socket.socket, request: dict, fds: list[int], inherited: list
+) -> None:
+    """Run the CLI for a request, in the forked child. Never returns."""
+    code = 1
+    try:
+        # Do not hold the daemon socket and lock while the command runs.
+        for obj in inherited:
+            obj.close()
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdin = open(0, closefd=False)
+        sys.stdout = open(1, "w", buffering=1 if os.isatty(1) else -1, closefd=False)
+        sys.stderr = open(2, "w", buffering=1, closefd=False)
+
+        os.environ.clear()
+        os.environ.update(request["env"])
+        # The child runs the command itself.
+        os.environ.pop(DAEMON_ENV, None)
+        os.chdir(request["cwd"])
+        sys.argv = request["argv"]
+        _redetect_consoles()
+        # Accepted, let the client relay signals to this process.
+        conn.sendall(_ACCEPTED + f" {os.getpid()}\n".encode())
+
+        from sunbeam.main import main  # noqa: PLC0415
+
+        try:
+            main()
+            code = 0
+        except SystemExit as e:
+            if e.code is None:
+                code = 0
+            elif isinstance(e.code, int):
+                code = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        with contextlib.suppress(Exception):
+            # os._exit skips the atexit hooks, flush the log queue here.
+            logging.shutdown()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        with contextlib.suppress(OSError):
+            conn.sendall(f"{code}\n".encode())
+        os._exit(code)
+
+
+def _handle(conn: socket.socket, revision: str | None, inherited: list) -> bool:
+    """Handle a client connection, return False when the daemon must exit."""
+    with conn:
+        if _peer_uid(conn) != os.getuid():
+            return True
+        msg, fds, _, _ = socket.recv_fds(conn, _MAX_REQUEST, 3)
+        while not msg.endswith(b"\n"):
+            chunk = conn.recv(_MAX_REQUEST)
+            if not chunk:
+                break
+            msg += chunk
+        try:
+            request = json.loads(msg)
+        except ValueError:
+            request = None
+
+        if (
+            request is None
+            or len(fds) != 3
+            or request["env"].get("SNAP_REVISION") != revision
+        ):
+            for fd in fds:
+                os.close(fd)
+            conn.sendall(_REFUSED + b"\n")
+            # A client from another snap revision means this daemon is stale.
+            return request is None or len(fds) != 3
+
+        if os.fork() == 0:
+            _run_child(conn, request, fds, inherited)
+        for fd in fds:
+            os.close(fd)
+    return True
+
+
+def _reap() -> bool:
+    """Reap finished children, return whether some are still running."""
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return False
+        if pid == 0:
+            return True
+
+
+def serve(path: Path, idle_timeout: int = DAEMON_IDLE_TIMEOUT) -> None:
+    """Serve requests on the unix socket until idle."""
+    lock = open(path.with_name(DAEMON_LOCK), "w")
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        # Another daemon is already serving.
+        lock.close()
+        return
+
+    _preload()
+    revision = os.environ.get("SNAP_REVISION")
+    # Bind aside and move the socket in place once listening, so clients
+    # never find a socket refusing connections.
+    bind_path = path.with_suffix(".new")
+    with contextlib.suppress(FileNotFoundError):
+        bind_path.unlink()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(str(bind_path))
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    bind_path.rename(path)
+    server.settimeout(1)
+
+    last_request = time.monotonic()
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except TimeoutError:
+                if not _reap() and time.monotonic() - last_request > idle_timeout:
+                    break
+                continue
+            conn.settimeout(None)
+            last_request = time.monotonic()
+            if not _handle(conn, revision, [server, lock]):
+                break
+            _reap()
+    finally:
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+        lock.close()
+
+
+if __name__ == "__main__":
+    serve(Path(sys.argv[1]))
@@ -182,7 +182,7 @@ def list_feature_gates(ctx: click.Context, format: str) -> None:
 
     # 2. Collect Storage Backends with generally_available=False
     storage_manager = deployment.get_storage_manager()
-    for backend_name, backend in storage_manager.backends().items():
+    for backend_name, backend in storage_manager.entries().items():
         if isinstance(backend, FeatureGateMixin) and not backend.generally_available:
             gate_key = backend.gate_key
             unlocked = _check_gate_enabled(gate_key, client, snap)
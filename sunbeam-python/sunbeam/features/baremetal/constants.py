@@ -8,6 +8,8 @@ IRONIC_CONDUCTOR_GROUPS_TFVAR = "ironic-conductor-groups"
 NEUTRON_BAREMETAL_SWITCH_CONF_SECRETS_TFVAR = "netconf-conf-secrets"
 NEUTRON_GENERIC_SWITCH_CONF_SECRETS_TFVAR = "generic-conf-secrets"
 NEUTRON_SWITCH_CONF_SECRETS_TFVAR = "switch-conf-secrets"
+# clusterd key tracking the content hash and id of each switch config secret.
+SWITCH_CONFIG_SECRETS_RECORD_KEY = "BaremetalSwitchConfigSecrets"
 
 SWITCH_CONFIG_TFVAR = {
     "netconf": NEUTRON_BAREMETAL_SWITCH_CONF_SECRETS_TFVAR,
@@ -5,6 +5,8 @@ import logging
 import typing
 
 import click
+import pydantic
+import yaml
 from packaging.version import Version
 from rich.console import Console
 
@@ -249,6 +251,44 @@ class BaremetalFeature(OpenStackControlPlaneFeature):
     def baremetal_group(self):
         """Manage baremetal feature."""
 
+    @click.command()
+    @click.argument("changes_file", metavar="FILEPATH", type=click.File("r"))
+    @click_option_show_hints
+    @pass_method_obj
+    def baremetal_apply(
+        self, deployment: Deployment, changes_file: typing.TextIO, show_hints: bool
+    ):
+        """Add and remove shards and ironic-conductor groups in one go.
+
+        FILEPATH is a YAML file listing the nova-compute shards and
+        ironic-conductor groups to add and remove.
+        """
+        try:
+            changes = feature_config.BaremetalResourceChanges.model_validate(
+                yaml.safe_load(changes_file) or {}
+            )
+        except (yaml.YAMLError, pydantic.ValidationError) as e:
+            raise click.ClickException(f"Invalid baremetal changes file: {e}")
+
+        # Login to the Juju controller
+        run_preflight_checks([JujuLoginCheck(deployment.juju_account)], console)
+
+        plan: list[BaseStep] = [
+            steps.ApplyBaremetalResourcesStep(deployment, self, changes)
+        ]
+        if changes.conductor_groups.add:
+            plan.append(
+                steps.RunSetTempUrlSecretStep(
+                    deployment,
+                    JujuHelper(deployment.juju_controller),
+                    [
+                        f"{constants.IRONIC_CONDUCTOR_APP}-{name}"
+                        for name in changes.conductor_groups.add
+                    ],
+                )
+            )
+        run_plan(plan, console, show_hints)
+
     @click.group()
     def shard_group(self):
         """Manage baremetal nova-compute shards."""
@@ -442,6 +482,8 @@ class BaremetalFeature(OpenStackControlPlaneFeature):
             "init": [{"name": "baremetal", "command": self.baremetal_group}],
             # Add the baremetal subcommands:
             "init.baremetal": [
+                # sunbeam baremetal apply FILEPATH
+                {"name": "apply", "command": self.baremetal_apply},
                 # Add the baremetal shard group:
                 # sunbeam baremetal shard ...
                 {"name": "shard", "command": self.shard_group},
@@ -174,6 +174,40 @@ class BaremetalFeatureConfig(FeatureConfig):
         return v
 
 
+class _ResourceChanges(pydantic.BaseModel):
+    add: list[str] = pydantic.Field(default=[])
+    remove: list[str] = pydantic.Field(default=[])
+
+    @pydantic.model_validator(mode="after")
+    def validate_changes(self):
+        """Validate the resources are unique and not both added and removed."""
+        if len(self.add) != len(set(self.add)):
+            raise ValueError("Resources to add must be unique.")
+
+        if len(self.remove) != len(set(self.remove)):
+            raise ValueError("Resources to remove must be unique.")
+
+        both = set(self.add) & set(self.remove)
+        if both:
+            raise ValueError(
+                f"Resources {sorted(both)} cannot be both added and removed."
+            )
+
+        return self
+
+
+class BaremetalResourceChanges(pydantic.BaseModel):
+    """Batch of nova-ironic shards and ironic-conductor groups changes."""
+
+    model_config = pydantic.ConfigDict(populate_by_name=True)
+
+    shards: _ResourceChanges = pydantic.Field(default_factory=_ResourceChanges)
+    conductor_groups: _ResourceChanges = pydantic.Field(
+        alias="conductor-groups",
+        default_factory=_ResourceChanges,
+    )
+
+
 def _validate_configs(configs: dict[str, _Config], config_type: str):
     sections = {}
     additional_files = []
@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import abc
+import hashlib
+import json
 import logging
 import queue
 
@@ -19,11 +21,13 @@ from sunbeam.core.common import (
     ResultType,
     StepContext,
     read_config,
+    update_config,
     update_status_background,
 )
 from sunbeam.core.deployment import Deployment
 from sunbeam.core.juju import (
     ActionFailedException,
+    ApplicationStatusOverlay,
     JujuHelper,
     JujuSecretNotFound,
     JujuStepHelper,
@@ -39,6 +43,25 @@ from sunbeam.features.interface.v1.openstack import (
 LOG = logging.getLogger(__name__)
 console = Console()
 
+SWITCH_CONFIG_CHARMS = {
+    "netconf": "neutron-baremetal-switch-config",
+    "generic": "neutron-generic-switch-config",
+}
+
+
+def _switch_config_secret_data(config: feature_config._Config) -> dict:
+    """Return the juju secret content for a switch config."""
+    return {
+        "conf": config.configfile,
+        **config.additional_files,
+    }
+
+
+def _switch_config_hash(data: dict) -> str:
+    """Return a stable content hash of switch config secret data."""
+    payload = json.dumps(data, sort_keys=True).encode()
+    return hashlib.sha256(payload).hexdigest()
+
 
 class RunSetTempUrlSecretStep(BaseStep, JujuStepHelper):
     """Run the set-temp-url-secret action on the ironic-conductor."""
@@ -139,11 +162,25 @@ class _BaseStep(abc.ABC, BaseStep, JujuStepHelper):
         except ConfigItemNotFoundException:
             return {}
 
+    def _get_secret_records(self) -> dict[str, dict]:
+        """Return the switch config secret records, keyed by secret name.
+
+        Each record holds the content hash and id of the secret.
+        """
+        try:
+            return read_config(self.client, constants.SWITCH_CONFIG_SECRETS_RECORD_KEY)
+        except ConfigItemNotFoundException:
+            return {}
+
+    def _save_secret_records(self, records: dict[str, dict]) -> None:
+        update_config(self.client, constants.SWITCH_CONFIG_SECRETS_RECORD_KEY, records)
+
     def _apply_tfvars(
         self,
         tfvars: dict,
         apps: list[str],
         reporter=None,
+        overlay: dict[str, ApplicationStatusOverlay] | None = None,
     ) -> None:
         self.tfhelper.update_tfvars_and_apply_tf(
             self.client,
@@ -152,6 +189,9 @@ class _BaseStep(abc.ABC, BaseStep, JujuStepHelper):
             override_tfvars=tfvars,
             reporter=reporter,
         )
+        if not apps:
+            return
+
         LOG.debug("Applications monitored for readiness: %s", apps)
         status_queue: queue.Queue[str] = queue.Queue()
         task = update_status_background(self.feature, apps, status_queue)
@@ -163,6 +203,7 @@ class _BaseStep(abc.ABC, BaseStep, JujuStepHelper):
                 timeout=constants.IRONIC_APP_TIMEOUT,
                 queue=status_queue,
                 status=self.apps_desired_status,
+                overlay=overlay,
             )
         except (JujuWaitException, TimeoutError):
             raise click.ClickException(
@@ -171,6 +212,17 @@ class _BaseStep(abc.ABC, BaseStep, JujuStepHelper):
         finally:
             task.stop()
 
+    def _wait_applications_gone(self, apps: list[str]) -> None:
+        LOG.debug("Waiting for applications to disappear: %s", apps)
+        try:
+            self.jhelper.wait_application_gone(
+                apps,
+                OPENSTACK_MODEL,
+                timeout=constants.IRONIC_APP_TIMEOUT,
+            )
+        except (JujuWaitException, TimeoutError):
+            raise click.ClickException(f"Timed out waiting for {apps} to disappear.")
+
 
 class _DeployResourcesStep(_BaseStep):
     """Deploy resources using Terraform."""
@@ -247,17 +299,7 @@ class _DeleteResourcesStep(_BaseStep):
             reporter=reporter,
         )
 
-        LOG.debug("Waiting for application to disappear: %s", self.charm_name)
-        try:
-            self.jhelper.wait_application_gone(
-                [self.charm_name],
-                OPENSTACK_MODEL,
-                timeout=constants.IRONIC_APP_TIMEOUT,
-            )
-        except (JujuWaitException, TimeoutError):
-            raise click.ClickException(
-                f"Timed out waiting for {self.charm_name} to disappear."
-            )
+        self._wait_applications_gone([self.charm_name])
 
         click.echo(f"Resource {self.item} deleted.")
 
@@ -402,8 +444,92 @@ class ListIronicConductorGroupsStep(_ListResourcesStep):
         )
 
 
+class ApplyBaremetalResourcesStep(_BaseStep):
+    """Add and remove nova-ironic shards and ironic-conductor groups at once.
+
+    All the changes are written in a single terraform apply, followed by one
+    readiness wait for the added applications and one wait for the removed
+    ones to be gone. Only ironic-conductor groups are accepted as blocked.
+    """
+
+    def __init__(
+        self,
+        deployment: Deployment,
+        feature: OpenStackControlPlaneFeature,
+        changes: feature_config.BaremetalResourceChanges,
+    ):
+        super().__init__(
+            "Apply baremetal resource changes",
+            "Applying baremetal resource changes",
+            deployment,
+            feature,
+            constants.NOVA_IRONIC_SHARDS_TFVAR,
+        )
+        self.changes = changes
+        self.added_apps: list[str] = []
+        self.removed_apps: list[str] = []
+
+    def _resources(self):
+        # tfvars key, charm name prefix, charm config key, changes
+        return [
+            (
+                constants.NOVA_IRONIC_SHARDS_TFVAR,
+                "nova-ironic",
+                "shard",
+                self.changes.shards,
+            ),
+            (
+                constants.IRONIC_CONDUCTOR_GROUPS_TFVAR,
+                constants.IRONIC_CONDUCTOR_APP,
+                "conductor-group",
+                self.changes.conductor_groups,
+            ),
+        ]
+
+    def _run(self, reporter=None) -> None:
+        tfvars = self._get_tfvars()
+        overlay: dict[str, ApplicationStatusOverlay] = {}
+        for tfvars_key, prefix, config_key, changes in self._resources():
+            items = tfvars.get(tfvars_key, {})
+            for item in changes.remove:
+                if item not in items:
+                    raise click.ClickException(f"Resource {item} doesn't exist.")
+                items.pop(item)
+                self.removed_apps.append(f"{prefix}-{item}")
+
+            for item in changes.add:
+                if item in items:
+                    raise click.ClickException(f"Resource {item} already exists.")
+                items[item] = {config_key: item}
+                self.added_apps.append(f"{prefix}-{item}")
+                if prefix == constants.IRONIC_CONDUCTOR_APP:
+                    # ironic-conductor-k8s charm will be in the blocked state
+                    # until we run the set-temp-url-secret action.
+                    overlay[f"{prefix}-{item}"] = {"status": ["active", "blocked"]}
+
+            tfvars[tfvars_key] = items
+
+        if not self.added_apps and not self.removed_apps:
+            LOG.debug("No baremetal resource changes to apply")
+            return
+
+        self._apply_tfvars(tfvars, self.added_apps, reporter=reporter, overlay=overlay)
+        if self.removed_apps:
+            self._wait_applications_gone(self.removed_apps)
+
+        if self.added_apps:
+            click.echo(f"Resource(s) {self.added_apps} added.")
+        if self.removed_apps:
+            click.echo(f"Resource(s) {self.removed_apps} deleted.")
+
+
 class UpdateSwitchConfigSecretsStep(_BaseStep):
-    """Update Neutron baremetal / generic switch config secrets."""
+    """Update Neutron baremetal / generic switch config secrets.
+
+    Secrets are reconciled against the desired switch configs: only secrets
+    whose content changed are updated, new ones are added and granted, and
+    the terraform plan is only applied when the secret ids change.
+    """
 
     def __init__(
         self,
@@ -421,29 +547,48 @@ class UpdateSwitchConfigSecretsStep(_BaseStep):
         self.switch_configs = switch_configs
 
     def _run(self, reporter=None) -> None:
-        """Update juju secrets containing switch configs."""
+        """Reconcile juju secrets containing switch configs."""
         tfvars = self._get_tfvars()
         conf_secrets = tfvars.get(self.tfvars_key, {})
-        tfvars[self.tfvars_key] = conf_secrets
-
-        # Remove existing secrets and add new ones.
-        secrets = conf_secrets.get("netconf", [])
-        self._remove_secrets(secrets)
-        secret_ids = self._add_secrets("netconf", self.switch_configs.netconf)
-        opt = ",".join(secret_ids)
-        tfvars[constants.NEUTRON_BAREMETAL_SWITCH_CONF_SECRETS_TFVAR] = opt
-        new_names = self.switch_configs.netconf.keys()
-        conf_secrets["netconf"] = [f"switch-config-{name}" for name in new_names]
-
-        secrets = conf_secrets.get("generic", [])
-        self._remove_secrets(secrets)
-        secret_ids = self._add_secrets("generic", self.switch_configs.generic)
-        opt = ",".join(secret_ids)
-        tfvars[constants.NEUTRON_GENERIC_SWITCH_CONF_SECRETS_TFVAR] = opt
-        new_names = self.switch_configs.generic.keys()
-        conf_secrets["generic"] = [f"switch-config-{name}" for name in new_names]
+        records = self._get_secret_records()
+
+        existing = {
+            secret_name: protocol
+            for protocol in SWITCH_CONFIG_CHARMS
+            for secret_name in conf_secrets.get(protocol, [])
+        }
+        desired = {
+            "netconf": self.switch_configs.netconf,
+            "generic": self.switch_configs.generic,
+        }
+        wanted = {
+            f"switch-config-{name}" for configs in desired.values() for name in configs
+        }
+
+        # Remove secrets no longer part of the switch configs.
+        for secret_name in existing:
+            if secret_name not in wanted:
+                self.jhelper.remove_secret(OPENSTACK_MODEL, secret_name)
+                records.pop(secret_name, None)
+
+        new_tfvars: dict = {self.tfvars_key: {}}
+        for protocol, configs in desired.items():
+            secret_ids = [
+                self._reconcile_secret(protocol, name, config, existing, records)
+                for name, config in configs.items()
+            ]
+            new_tfvars[constants.SWITCH_CONFIG_TFVAR[protocol]] = ",".join(secret_ids)
+            new_tfvars[self.tfvars_key][protocol] = [
+                f"switch-config-{name}" for name in configs
+            ]
+        self._save_secret_records(records)
+
+        if all(tfvars.get(key) == value for key, value in new_tfvars.items()):
+            LOG.debug("Switch config secret ids unchanged, skipping terraform apply")
+            return
 
         # write and apply terraform changes.
+        tfvars.update(new_tfvars)
         apps = ["neutron"]
         if self.switch_configs.netconf:
             apps.append("neutron-baremetal-switch-config")
@@ -452,37 +597,45 @@ class UpdateSwitchConfigSecretsStep(_BaseStep):
 
         self._apply_tfvars(tfvars, apps, reporter=reporter)
 
-    def _remove_secrets(self, secrets_list: list[str]):
-        for secret in secrets_list:
-            self.jhelper.remove_secret(OPENSTACK_MODEL, secret)
-            secrets_list.remove(secret)
-
-    def _add_secrets(self, protocol: str, configs: dict[str, feature_config._Config]):
-        config_charm = "neutron-baremetal-switch-config"
-        if protocol == "generic":
-            config_charm = "neutron-generic-switch-config"
-
-        secret_ids = []
-        for config_name, config in configs.items():
-            secret_name = f"switch-config-{config_name}"
-            secret_data = {
-                "conf": config.configfile,
-                **config.additional_files,
-            }
-
+    def _reconcile_secret(
+        self,
+        protocol: str,
+        config_name: str,
+        config: feature_config._Config,
+        existing: dict[str, str],
+        records: dict[str, dict],
+    ) -> str:
+        """Bring a single switch config secret up to date, return its id."""
+        config_charm = SWITCH_CONFIG_CHARMS[protocol]
+        secret_name = f"switch-config-{config_name}"
+        secret_data = _switch_config_secret_data(config)
+        content_hash = _switch_config_hash(secret_data)
+        record = records.get(secret_name, {})
+
+        if secret_name not in existing:
             secret_id = self.jhelper.add_secret(
                 OPENSTACK_MODEL,
                 secret_name,
                 secret_data,
                 "Neutron switch config",
             )
+            grant_to = ["neutron", config_charm]
+        else:
+            # Secrets not tracked yet have no hash and are always updated.
+            if record.get("hash") != content_hash:
+                LOG.debug("Updating switch config secret %s", secret_name)
+                self.jhelper.update_secret(OPENSTACK_MODEL, secret_name, secret_data)
+            secret_id = record.get("id") or self.jhelper.get_secret_id(
+                OPENSTACK_MODEL, secret_name
+            )
+            # Config moved to another protocol, the new config charm needs access.
+            grant_to = [] if existing[secret_name] == protocol else [config_charm]
 
-            for app in ["neutron", config_charm]:
-                self.jhelper.grant_secret(OPENSTACK_MODEL, secret_name, app)
-
-            secret_ids.append(secret_id)
+        for app in grant_to:
+            self.jhelper.grant_secret(OPENSTACK_MODEL, secret_name, app)
 
-        return secret_ids
+        records[secret_name] = {"hash": content_hash, "id": secret_id}
+        return secret_id
 
 
 class AddSwitchConfigStep(_BaseStep):
@@ -521,10 +674,7 @@ class AddSwitchConfigStep(_BaseStep):
             raise click.ClickException(f"Secret {secret_name} already exists.")
 
         # Create secret and grant it to the config charm and neutron.
-        secret_data = {
-            "conf": self.config_obj.configfile,
-            **self.config_obj.additional_files,
-        }
+        secret_data = _switch_config_secret_data(self.config_obj)
         secret_id = self.jhelper.add_secret(
             OPENSTACK_MODEL,
             secret_name,
@@ -535,6 +685,13 @@ class AddSwitchConfigStep(_BaseStep):
         for app in ["neutron", self.config_charm]:
             self.jhelper.grant_secret(OPENSTACK_MODEL, secret_name, app)
 
+        records = self._get_secret_records()
+        records[secret_name] = {
+            "hash": _switch_config_hash(secret_data),
+            "id": secret_id,
+        }
+        self._save_secret_records(records)
+
         # Update charm's "conf-secrets" config.
         tfvars_key = constants.SWITCH_CONFIG_TFVAR[self.protocol]
         tfvars = self._get_tfvars()
@@ -591,16 +748,18 @@ class UpdateSwitchConfigStep(_BaseStep):
             raise click.ClickException(f"Secret {secret_name} does not exist.")
 
         # Update secret.
-        secret_data = {
-            "conf": self.config_obj.configfile,
-            **self.config_obj.additional_files,
-        }
+        secret_data = _switch_config_secret_data(self.config_obj)
         self.jhelper.update_secret(
             OPENSTACK_MODEL,
             secret_name,
             secret_data,
         )
 
+        records = self._get_secret_records()
+        record = records.setdefault(secret_name, {})
+        record["hash"] = _switch_config_hash(secret_data)
+        self._save_secret_records(records)
+
         click.echo(f"Switch config {self.name} updated.")
 
 
@@ -641,6 +800,10 @@ class DeleteSwitchConfigStep(_BaseStep):
             secret_name,
         )
 
+        records = self._get_secret_records()
+        if records.pop(secret_name, None) is not None:
+            self._save_secret_records(records)
+
         # infer protocol.
         tfvars_key = constants.NEUTRON_SWITCH_CONF_SECRETS_TFVAR
         tfvars = self._get_tfvars()
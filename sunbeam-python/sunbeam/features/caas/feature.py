@@ -4,6 +4,8 @@
 import logging
 import subprocess
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -52,6 +54,7 @@ if TYPE_CHECKING:
     import lightkube.core.exceptions as l_exceptions
     import lightkube.types as l_patch_types
     from lightkube.core import selector
+    from lightkube.core.client import LabelSelector
     from lightkube.resources import (
         apiextensions_v1,
         apps_v1,
@@ -72,6 +75,9 @@ LOG = logging.getLogger(__name__)
 console = Console()
 
 PROVIDER_WAIT_TIMEOUT = 300  # 5 minutes for each provider
+# Overall time to wait for the Cluster API namespaces and CRDs to be gone
+CAPI_DELETE_WAIT_TIMEOUT = 300
+CAPI_DELETE_MAX_INTERVAL = 10
 KUBECONFIG_SECRET_NAME = "kubeconfig"
 MAGNUM_APPLICATION_NAME = "magnum"
 CAAPH_NAMESPACE = "caaph-system"
@@ -448,7 +454,7 @@ class DeleteClusterAPI(BaseStep):
             ]
             subprocess.run(cmd, check=True, timeout=300, capture_output=True)
 
-    def _delete_capi_namespaces(self) -> None:
+    def _delete_capi_namespaces(self) -> set[str]:
         capi_namespaces = [
             "caaph-system",
             "cabpck-system",
@@ -477,14 +483,23 @@ class DeleteClusterAPI(BaseStep):
         for ns in namespaces_to_delete:
             LOG.debug("Deleting namespace %s", ns)
             self.kube.delete(core_v1.Namespace, name=ns)
+        return namespaces_to_delete
 
-    def _delete_capi_crds(self) -> None:
+    def _delete_capi_crds(self) -> set[str]:
         # Delete CAPI CRDs using selector label
         # lightkube client delete does not support labelSelector
         # so workaround by using client request
         # client request expects resource name for delete operation,
         # as a workaround pass empty string
-        capi_label_selector = {"clusterctl.cluster.x-k8s.io": None}
+        capi_label_selector: "LabelSelector" = {"clusterctl.cluster.x-k8s.io": None}
+        crds_to_delete = {
+            crd.metadata.name
+            for crd in self.kube.list(
+                apiextensions_v1.CustomResourceDefinition,
+                labels=capi_label_selector,
+            )
+            if crd.metadata and crd.metadata.name
+        }
         self.kube._client.request(
             "delete",
             res=apiextensions_v1.CustomResourceDefinition,
@@ -499,6 +514,7 @@ class DeleteClusterAPI(BaseStep):
                 res=apiextensions_v1.CustomResourceDefinition,
                 name="images.openstack.k-orc.cloud",
             )
+            crds_to_delete.add("images.openstack.k-orc.cloud")
         except l_exceptions.ApiError as e:
             LOG.debug("Error in deleting ORC CRD: %r", e)
 
@@ -509,9 +525,52 @@ class DeleteClusterAPI(BaseStep):
                 res=apiextensions_v1.CustomResourceDefinition,
                 name="providers.clusterctl.cluster.x-k8s.io",
             )
+            crds_to_delete.add("providers.clusterctl.cluster.x-k8s.io")
         except l_exceptions.ApiError as e:
             LOG.debug("Error in deleting provider CRD: %r", e)
 
+        return crds_to_delete
+
+    def _crd_exists(self, name: str) -> bool:
+        try:
+            self.kube.get(apiextensions_v1.CustomResourceDefinition, name)
+        except l_exceptions.ApiError as e:
+            if e.status.code == 404:
+                return False
+            raise
+        return True
+
+    def _wait_for_deletion(
+        self,
+        namespaces: set[str],
+        crds: set[str],
+        timeout: float = CAPI_DELETE_WAIT_TIMEOUT,
+    ) -> set[str]:
+        """Wait until namespaces and CRDs are gone, return those remaining.
+
+        Namespaces stay in the Terminating state until their content is
+        finalized, enabling the feature again before they are gone would race
+        with their finalization.
+        """
+        deadline = time.monotonic() + timeout
+        interval = 1.0
+        while True:
+            if namespaces:
+                namespaces = namespaces.intersection(
+                    ns.metadata.name
+                    for ns in self.kube.list(core_v1.Namespace)
+                    if ns.metadata
+                )
+            crds = {crd for crd in crds if self._crd_exists(crd)}
+            remaining = namespaces | crds
+            if not remaining:
+                return remaining
+            if time.monotonic() > deadline:
+                return remaining
+            LOG.debug("Waiting for deletion of %s", sorted(remaining))
+            time.sleep(interval)
+            interval = min(interval * 2, CAPI_DELETE_MAX_INTERVAL)
+
     def _delete_orc_resources(self) -> None:
         orc_cluster_roles = [
             "orc-image-editor-role",
@@ -617,30 +676,43 @@ class DeleteClusterAPI(BaseStep):
             message = f"Timed out deleting Cluster API components: {str(e)}"
             return Result(ResultType.FAILED, message)
 
-        # 3. Delete Cluster API namespaces
-        # This also deletes any cert-manager resources and ORC resources
+        # 3. Delete Cluster API namespaces, CRDs and ORC resources concurrently
+        # Deleting the namespaces also deletes any cert-manager resources and
+        # ORC resources. Not only ClusterRoles and ClusterRoleBindings need to be
+        # deleted, rest of the ORC resources are deleted with the namespaces.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            namespaces_future = executor.submit(self._delete_capi_namespaces)
+            crds_future = executor.submit(self._delete_capi_crds)
+            orc_future = executor.submit(self._delete_orc_resources)
         try:
-            self._delete_capi_namespaces()
+            namespaces = namespaces_future.result()
         except l_exceptions.ApiError as e:
             LOG.debug("Failed to delete capi namespace", exc_info=True)
             return Result(ResultType.FAILED, str(e))
-
-        # 4. Delete Cluster API CRDs
         try:
-            self._delete_capi_crds()
+            crds = crds_future.result()
         except l_exceptions.ApiError as e:
             LOG.debug("Failed to delete capi crds", exc_info=True)
             return Result(ResultType.FAILED, str(e))
-
-        # 5. Delete ORC resources
-        # Not only ClusterRoles and ClusterRoleBindings need to be deleted
-        # Rest of the resources are deleted during namespace deletion stage
         try:
-            self._delete_orc_resources()
+            orc_future.result()
         except l_exceptions.ApiError as e:
             LOG.debug("Failed to delete orc resources", exc_info=True)
             return Result(ResultType.FAILED, str(e))
 
+        # 4. Wait for the namespaces and CRDs to be gone
+        try:
+            remaining = self._wait_for_deletion(namespaces, crds)
+        except l_exceptions.ApiError as e:
+            LOG.debug("Failed to wait for capi resources deletion", exc_info=True)
+            return Result(ResultType.FAILED, str(e))
+        if remaining:
+            message = (
+                "Timed out waiting for Cluster API resources to be deleted: "
+                + ", ".join(sorted(remaining))
+            )
+            return Result(ResultType.FAILED, message)
+
         return Result(ResultType.COMPLETED)
 
 
@@ -33,7 +33,11 @@ from sunbeam.core.juju import (
 )
 from sunbeam.core.manifest import CharmManifest, FeatureConfig, SoftwareConfig
 from sunbeam.core.openstack import OPENSTACK_MODEL
-from sunbeam.core.terraform import TerraformException, TerraformInitStep
+from sunbeam.core.terraform import (
+    TerraformException,
+    TerraformInitStep,
+    TerraformStateLockedException,
+)
 from sunbeam.features.interface.v1.openstack import (
     OpenStackControlPlaneFeature,
     TerraformPlanLocation,
@@ -105,8 +109,10 @@ class DisableLDAPDomainStep(BaseStep, JujuStepHelper):
         update_config(self.client, config_key, tfvars)
 
         try:
-            self.tfhelper.apply(LDAP_APPLY_TARGETS, reporter=context.reporter)
-        except TerraformException as e:
+            self.tfhelper.apply_waiting_for_lock(
+                self.client, LDAP_APPLY_TARGETS, reporter=context.reporter
+            )
+        except (TerraformException, TerraformStateLockedException) as e:
             return Result(ResultType.FAILED, str(e))
 
         try:
@@ -173,8 +179,10 @@ class UpdateLDAPDomainStep(BaseStep, JujuStepHelper):
         update_config(self.client, config_key, tfvars)
 
         try:
-            self.tfhelper.apply(LDAP_APPLY_TARGETS, reporter=context.reporter)
-        except TerraformException as e:
+            self.tfhelper.apply_waiting_for_lock(
+                self.client, LDAP_APPLY_TARGETS, reporter=context.reporter
+            )
+        except (TerraformException, TerraformStateLockedException) as e:
             return Result(ResultType.FAILED, str(e))
         charm_name = "keystone-ldap-{}".format(self.charm_config["domain-name"])
         apps = ["keystone", charm_name]
@@ -243,8 +251,10 @@ class AddLDAPDomainStep(BaseStep, JujuStepHelper):
         update_config(self.client, config_key, tfvars)
 
         try:
-            self.tfhelper.apply(LDAP_APPLY_TARGETS, reporter=context.reporter)
-        except TerraformException as e:
+            self.tfhelper.apply_waiting_for_lock(
+                self.client, LDAP_APPLY_TARGETS, reporter=context.reporter
+            )
+        except (TerraformException, TerraformStateLockedException) as e:
             return Result(ResultType.FAILED, str(e))
         charm_name = "keystone-ldap-{}".format(self.charm_config["domain-name"])
         apps = ["keystone", charm_name]
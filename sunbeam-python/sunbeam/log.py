@@ -1,7 +1,12 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import gzip
 import logging
+import logging.handlers
+import os
+import queue
+import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -10,6 +15,67 @@ from typing import Union
 from rich.logging import RichHandler
 
 MAX_LOG_FILES = 100
+# A log file is rotated when reaching MAX_LOG_BYTES, keeping LOG_BACKUP_COUNT
+# compressed backups.
+MAX_LOG_BYTES = 32 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+LOG_FORMAT = "%(asctime)s,%(msecs)d %(name)s %(levelname)s %(message)s"
+LOG_DATE_FORMAT = "%H:%M:%S"
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def rotating_file_handler(
+    logfile: Union[Path, str],
+    max_bytes: int = MAX_LOG_BYTES,
+    backup_count: int = LOG_BACKUP_COUNT,
+    compress: bool = True,
+) -> logging.handlers.RotatingFileHandler:
+    """Return a handler writing to logfile, rotated on size.
+
+    Rotated files are gzipped when compress is set.
+    """
+    handler = logging.handlers.RotatingFileHandler(
+        logfile, maxBytes=max_bytes, backupCount=backup_count
+    )
+    if compress:
+        handler.namer = _gzip_namer
+        handler.rotator = _gzip_rotator
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+    return handler
+
+
+class QueueHandler(logging.handlers.QueueHandler):
+    """Queue records for a listener thread writing them to its handlers.
+
+    Closing the handler, e.g. from logging.shutdown at exit, stops the
+    listener once the queued records are written.
+    """
+
+    def __init__(self, *handlers: logging.Handler) -> None:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        super().__init__(log_queue)
+        self.listener: logging.handlers.QueueListener | None = (
+            logging.handlers.QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+        )
+        self.listener.start()
+
+    def close(self) -> None:
+        """Stop the listener, flushing the queued records, and close."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        super().close()
 
 
 def setup_root_logging(logfile: Path | None = None):
@@ -63,15 +129,13 @@ def setup_root_logging(logfile: Path | None = None):
         logger.addHandler(stream_handler)
 
     if logfile:
-        file_handler = logging.FileHandler(logfile)
+        # Writes happen on a listener thread, the threads logging are never
+        # blocked by a slow disk or large debug records.
+        file_handler = rotating_file_handler(logfile)
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s,%(msecs)d %(name)s %(levelname)s %(message)s",
-                datefmt="%H:%M:%S",
-            )
-        )
-        logger.addHandler(file_handler)
+        queue_handler = QueueHandler(file_handler)
+        queue_handler.setLevel(logging.DEBUG)
+        logger.addHandler(queue_handler)
         logger.debug("Logging to %r", str(logfile))
 
 
@@ -82,12 +146,8 @@ def setup_logging(logfile: Union[Path, str]) -> None:
     :type logfile: Path or str
     :return: None
     """
-    # TODO(wolsen) Use a rotating log handler?
     logging.basicConfig(
-        filename=str(logfile),
-        filemode="a",
-        format="%(asctime)s,%(msecs)d %(name)s %(levelname)s %(message)s",
-        datefmt="%H:%M:%S",
+        handlers=[rotating_file_handler(logfile)],
         level=logging.DEBUG,
     )
 
@@ -95,6 +155,8 @@ def setup_logging(logfile: Union[Path, str]) -> None:
 def prepare_logfile(path: Path, name: str) -> Path:
     """Remove older log files and return a logfile name for current execution.
 
+    The rotated backups of a removed log file are removed along with it.
+
     :param path: Path to the logs directoy
     :param name: name of the logfile
     """
@@ -104,6 +166,8 @@ def prepare_logfile(path: Path, name: str) -> Path:
     if len(present_files) > limit:
         for fpath in sorted(present_files)[:-limit]:
             fpath.unlink(missing_ok=True)
+            for backup in path.glob(f"{fpath.name}.*"):
+                backup.unlink(missing_ok=True)
 
     logfile = path / f"{name}-{datetime.now():%Y%m%d-%H%M%S.%f}.log"
     return logfile
@@ -14,6 +14,7 @@ from rich.console import Console
 from snaphelpers import Snap
 
 from sunbeam import utils
+from sunbeam.clusterd.client import Client
 from sunbeam.clusterd.service import (
     ClusterServiceUnavailableException,
     ConfigItemNotFoundException,
@@ -111,8 +112,10 @@ from sunbeam.steps.clusterd import (
     ClusterUpdateJujuControllerStep,
     ClusterUpdateJujuUserStep,
     ClusterUpdateNodeStep,
+    JoinCoalescer,
     PromptCheckNodeExistStep,
     SaveManagementCidrStep,
+    WaitForJoinCoalescingStep,
 )
 from sunbeam.steps.horizon import AttachHorizonThemeStep
 from sunbeam.steps.hypervisor import (
@@ -206,6 +209,21 @@ LOG = logging.getLogger(__name__)
 console = Console()
 DEPLOYMENTS_CONFIG_KEY = "deployments"
 DEFAULT_LXD_CLOUD = "localhost"
+# Steps reconciling every registered node of the cluster through Terraform,
+# these only need to be run once per batch of coalesced joins.
+JOIN_RECONCILE_STEPS = (
+    DeploySunbeamMachineApplicationStep,
+    DeployK8SApplicationStep,
+    DeployRoleDistributorApplicationStep,
+    DeployMicroOVNApplicationStep,
+    ReapplyMicroOVNOptionalIntegrationsStep,
+    ReapplyMicroOVNTerraformPlanStep,
+    DeployMicrocephApplicationStep,
+    DeployControlPlaneStep,
+    DeployCinderVolumeApplicationStep,
+    ReapplyHypervisorOptionalIntegrationsStep,
+    DeployHypervisorApplicationStep,
+)
 
 
 @click.group("cluster", context_settings=CONTEXT_SETTINGS, cls=CatchGroup)
@@ -1376,6 +1394,16 @@ def add_secondary_region_node(
     help="Token obtained from the region controller.",
     type=str,
 )
+@click.option(
+    "--coalesce-window",
+    type=click.IntRange(min=0),
+    default=0,
+    help=(
+        "Seconds to wait for other nodes joining concurrently. Joins"
+        " registered within the window are reconciled together by a single"
+        " node. Disabled by default."
+    ),
+)
 @click_option_show_hints
 @click.pass_context
 def join(  # noqa: C901
@@ -1385,6 +1413,7 @@ def join(  # noqa: C901
     accept_defaults: bool = False,
     show_hints: bool = False,
     region_controller_token: str | None = None,
+    coalesce_window: int = 0,
 ) -> None:
     """Join node to the cluster.
 
@@ -1618,7 +1647,7 @@ def join(  # noqa: C901
                 jhelper,
                 manifest,
                 deployment.openstack_machines_model,
-                deployment.get_ovn_manager(),
+                ovn_manager,
             )
         )
         plan4.append(
@@ -1786,11 +1815,46 @@ def join(  # noqa: C901
                 )
             )
 
-    run_plan(plan4, console, show_hints)
+    if coalesce_window:
+        _run_coalesced_join_plan(
+            client, name, coalesce_window, plan4, console, show_hints
+        )
+    else:
+        run_plan(plan4, console, show_hints)
 
     click.echo(f"Node joined cluster with roles: {pretty_roles}")
 
 
+def _run_coalesced_join_plan(
+    client: Client,
+    name: str,
+    window: int,
+    plan: list[BaseStep],
+    console: Console,
+    show_hints: bool,
+) -> None:
+    """Run the join plan, reconciling concurrent joins only once.
+
+    The elected leader runs the whole plan, covering every node registered
+    in its batch. Other nodes only run the steps specific to themselves once
+    the leader has reconciled them.
+    """
+    # The node must be registered with its machine before electing a leader,
+    # otherwise the leader batch would not account for it.
+    registration = [step for step in plan if isinstance(step, ClusterUpdateNodeStep)]
+    plan = [step for step in plan if step not in registration]
+    coalescer = JoinCoalescer(client, name, window)
+    run_plan([*registration, WaitForJoinCoalescingStep(coalescer)], console, show_hints)
+    if coalescer.is_leader:
+        with coalescer.reconcile() as nodes:
+            LOG.debug("Reconciling joining nodes: %s", ", ".join(nodes))
+            run_plan(plan, console, show_hints)
+        return
+
+    node_plan = [step for step in plan if not isinstance(step, JOIN_RECONCILE_STEPS)]
+    run_plan(node_plan, console, show_hints)
+
+
 def _resolve_local_ip_from_cidr(cidr: str) -> str:
     try:
         local_ip = utils.get_local_ip_by_cidr(cidr)
@@ -1841,15 +1905,23 @@ def list_nodes(
     help=("Skip safety checks and ignore cleanup errors for some tasks"),
     is_flag=True,
 )
-@click.argument("name", type=str)
+@click.argument("names", type=str, nargs=-1, required=True)
 @click_option_show_hints
 @click.pass_context
-def remove(ctx: click.Context, name: str, force: bool, show_hints: bool) -> None:
-    """Remove a node from the cluster."""
+def remove(
+    ctx: click.Context, names: tuple[str, ...], force: bool, show_hints: bool
+) -> None:
+    """Remove one or more nodes from the cluster.
+
+    All the nodes are removed with a single plan, their units are removed and
+    waited for together.
+    """
     deployment: LocalDeployment = ctx.obj
     client = deployment.get_client()
     jhelper = JujuHelper(deployment.juju_controller)
     microovn_machine_ids = deployment.get_ovn_manager().get_machines()
+    nodes = list(dict.fromkeys(names))
+    model = deployment.openstack_machines_model
 
     preflight_checks = [DaemonGroupCheck(), JujuLoginCheck(deployment.juju_account)]
     run_preflight_checks(preflight_checks, console)
@@ -1857,72 +1929,50 @@ def remove(ctx: click.Context, name: str, force: bool, show_hints: bool) -> None
     plan: list[BaseStep] = []
 
     if not force:
-        plan.append(PromptCheckNodeExistStep(client, name))
+        plan.extend(PromptCheckNodeExistStep(client, name) for name in nodes)
 
     plan.extend(
         [
             CheckCinderVolumeDistributionStep(
-                client,
-                name,
-                jhelper,
-                deployment.openstack_machines_model,
-                force=force,
-            ),
-            CheckMicrocephDistributionStep(
-                client,
-                name,
-                jhelper,
-                deployment.openstack_machines_model,
-                force=force,
-            ),
-            CheckMysqlK8SDistributionStep(
-                client,
-                name,
-                jhelper,
-                deployment.openstack_machines_model,
-                force=force,
-            ),
-            CheckRabbitmqK8SDistributionStep(
-                client,
-                name,
-                jhelper,
-                deployment.openstack_machines_model,
-                force=force,
-            ),
-            MigrateK8SKubeconfigStep(
-                client, name, jhelper, deployment.openstack_machines_model
+                client, nodes, jhelper, model, force=force
             ),
+            CheckMicrocephDistributionStep(client, nodes, jhelper, model, force=force),
+        ]
+    )
+    for name in nodes:
+        plan.extend(
+            [
+                CheckMysqlK8SDistributionStep(
+                    client, name, jhelper, model, force=force, removed_nodes=nodes
+                ),
+                CheckRabbitmqK8SDistributionStep(
+                    client, name, jhelper, model, force=force, removed_nodes=nodes
+                ),
+            ]
+        )
+    plan.extend(
+        MigrateK8SKubeconfigStep(client, name, jhelper, model, removed_nodes=nodes)
+        for name in nodes
+    )
+    plan.extend(
+        [
             UpdateK8SCloudStep(deployment, jhelper),
-            RemoveHypervisorUnitStep(
-                client,
-                jhelper,
-                deployment,
-                name,
-                deployment.openstack_machines_model,
-                force,
-            ),
-            RemoveCinderVolumeUnitsStep(
-                client, name, jhelper, deployment.openstack_machines_model
-            ),
-            RemoveMicrocephUnitsStep(
-                client, name, jhelper, deployment.openstack_machines_model
-            ),
-            RemoveMicroOVNUnitsStep(
-                client, name, jhelper, deployment.openstack_machines_model
-            ),
-            CordonK8SUnitStep(
-                client, name, jhelper, deployment.openstack_machines_model
-            ),
-            DrainK8SUnitStep(
-                client,
-                name,
-                jhelper,
-                deployment.openstack_machines_model,
-                remove_pvc=True,
-            ),
-            RemoveK8SUnitsStep(
-                client, name, jhelper, deployment.openstack_machines_model
-            ),
+            RemoveHypervisorUnitStep(client, jhelper, deployment, nodes, model, force),
+            RemoveCinderVolumeUnitsStep(client, nodes, jhelper, model),
+            RemoveMicrocephUnitsStep(client, nodes, jhelper, model),
+            RemoveMicroOVNUnitsStep(client, nodes, jhelper, model),
+        ]
+    )
+    # Cordon every node first, so pods evicted from one node are not
+    # scheduled on another node being removed.
+    plan.extend(CordonK8SUnitStep(client, name, jhelper, model) for name in nodes)
+    plan.extend(
+        DrainK8SUnitStep(client, name, jhelper, model, remove_pvc=True)
+        for name in nodes
+    )
+    plan.extend(
+        [
+            RemoveK8SUnitsStep(client, nodes, jhelper, model),
             EnsureCiliumDeviceByHostStep(
                 deployment,
                 client,
@@ -1937,18 +1987,13 @@ def remove(ctx: click.Context, name: str, force: bool, show_hints: bool) -> None
                 Networks.MANAGEMENT,
                 deployment.internal_ip_pool,
             ),
-            RemoveSunbeamMachineUnitsStep(
-                client, name, jhelper, deployment.openstack_machines_model
-            ),
-            RemoveJujuMachineStep(
-                client, name, jhelper, deployment.openstack_machines_model
-            ),
-            # Cannot remove user as the same user name cannot be resued,
-            # so commenting the RemoveJujuUserStep
-            # RemoveJujuUserStep(name),
-            ClusterRemoveNodeStep(client, name),
+            RemoveSunbeamMachineUnitsStep(client, nodes, jhelper, model),
         ]
     )
+    plan.extend(RemoveJujuMachineStep(client, name, jhelper, model) for name in nodes)
+    # Cannot remove user as the same user name cannot be resued,
+    # so not running RemoveJujuUserStep
+    plan.extend(ClusterRemoveNodeStep(client, name) for name in nodes)
     if microovn_machine_ids:
         manifest = deployment.get_manifest()
         role_distributor_tfhelper = deployment.get_tfhelper("role-distributor-plan")
@@ -1958,9 +2003,7 @@ def remove(ctx: click.Context, name: str, force: bool, show_hints: bool) -> None
         )
         plan.insert(
             remove_k8s_unit_index,
-            RemoveRoleDistributorUnitsStep(
-                client, name, jhelper, deployment.openstack_machines_model
-            ),
+            RemoveRoleDistributorUnitsStep(client, nodes, jhelper, model),
         )
         plan.extend(
             [
@@ -1986,7 +2029,10 @@ def remove(ctx: click.Context, name: str, force: bool, show_hints: bool) -> None
         )
 
     run_plan(plan, console, show_hints)
-    click.echo(f"Removed node {name} from the cluster")
+    click.echo(
+        f"Removed node{'s' if len(nodes) > 1 else ''} {', '.join(nodes)}"
+        " from the cluster"
+    )
     # Removing machine does not clean up all deployed juju components. This is
     # deliberate, see https://bugs.launchpad.net/juju/+bug/1851489.
     # Without the workaround mentioned in LP#1851489, it is not possible to
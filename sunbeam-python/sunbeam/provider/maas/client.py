@@ -3,9 +3,12 @@
 
 """MAAS management."""
 
+import asyncio
 import collections
+import dataclasses
 import logging
-from typing import TYPE_CHECKING, Sequence, overload
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterable, Sequence, TypeVar, overload
 
 from rich.console import Console
 
@@ -32,6 +35,41 @@ console = Console()
 # "amd64" is the Debian/MAAS name for x86_64.
 DEFAULT_ARCHITECTURE = "amd64"
 DPU_IMAGE_TAG_PREFIX = "dpu-image-"
+# Maximum number of MAAS API calls in flight when fetching an inventory
+MAAS_CONCURRENCY = 8
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _set_thread_event_loop():
+    """Give the calling worker thread its own event loop.
+
+    python-libmaas blocks on the event loop of the current thread, worker
+    threads have none by default.
+    """
+    asyncio.set_event_loop(asyncio.new_event_loop())
+
+
+def maas_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return a worker pool whose threads can call MAAS."""
+    return ThreadPoolExecutor(
+        max_workers=max_workers, initializer=_set_thread_event_loop
+    )
+
+
+def concurrent_map(
+    func: Callable[[T], R], items: Iterable[T], concurrency: int = MAAS_CONCURRENCY
+) -> list[R]:
+    """Apply func to every item on a worker pool able to call MAAS.
+
+    Results are returned in the order of items.
+    """
+    items = list(items)
+    if len(items) <= 1 or concurrency <= 1:
+        return [func(item) for item in items]
+    with maas_executor(min(concurrency, len(items))) as executor:
+        return list(executor.map(func, items))
 
 
 def parse_image_name_from_tags(tag_names: list[str] | None) -> str | None:
@@ -155,19 +193,22 @@ class MaasClient:
                 subnets.append(subnet._data)
         return subnets
 
-    def get_ip_ranges(self, subnet: dict) -> list[dict]:
-        """List ip ranges.
+    def list_ip_ranges_by_subnet(self) -> dict[int, list[dict]]:
+        """List ip ranges, grouped by subnet id.
 
         Only list reserved types as it is the only one we are interested in.
         """
         ip_ranges_response: list = self._client.ip_ranges.list()  # type: ignore
 
-        subnet_id = subnet["id"]
-        ip_ranges = []
+        ip_ranges = collections.defaultdict(list)
         for ip_range in ip_ranges_response:
-            if ip_range.subnet.id == subnet_id and ip_range.type.value == "reserved":
-                ip_ranges.append(ip_range._data)
-        return ip_ranges
+            if ip_range.type.value == "reserved":
+                ip_ranges[ip_range.subnet.id].append(ip_range._data)
+        return dict(ip_ranges)
+
+    def get_ip_ranges(self, subnet: dict) -> list[dict]:
+        """List reserved ip ranges of a subnet."""
+        return self.list_ip_ranges_by_subnet().get(subnet["id"], [])
 
     def get_dns_servers(self) -> list[str]:
         """Get configured upstream dns."""
@@ -359,15 +400,17 @@ def _convert_raw_machine(machine_raw: dict, root_disk: dict | None) -> dict:
 
 
 def list_machines(client: MaasClient, **extra_args) -> list[dict]:
-    """List machines in deployment, return consumable list of dicts."""
+    """List machines in deployment, return consumable list of dicts.
+
+    Root devices backed by volume groups need an extra call per machine,
+    those are issued concurrently.
+    """
     machines_raw = client.list_machines(**extra_args)
 
-    machines = []
-    for machine in machines_raw:
-        machines.append(
-            _convert_raw_machine(machine, _find_root_devices(client, machine))
-        )
-    return machines
+    def _convert(machine: dict) -> dict:
+        return _convert_raw_machine(machine, _find_root_devices(client, machine))
+
+    return concurrent_map(_convert, machines_raw)
 
 
 def get_machine(client: MaasClient, machine: str) -> dict:
@@ -471,23 +514,72 @@ def _convert_raw_ip_range(ip_range_raw: dict) -> dict:
     }
 
 
-def get_ip_ranges_from_space(client: MaasClient, space: str) -> dict[str, list[dict]]:
-    """Return all IP ranges from a space.
-
-    Return a dict with the CIDR as key and a list of IP ranges as value.
-    """
-    subnets = client.get_subnets(space)
+def _ip_ranges_by_cidr(
+    subnets: list[dict], ranges_by_subnet: dict[int, list[dict]]
+) -> dict[str, list[dict]]:
+    """Return the converted IP ranges of the subnets, keyed by CIDR."""
     ip_ranges = {}
     for subnet in subnets:
-        ranges_raw = client.get_ip_ranges(subnet)
         ranges = []
-        for ip_range in ranges_raw:
+        for ip_range in ranges_by_subnet.get(subnet["id"], []):
             ranges.append(_convert_raw_ip_range(ip_range))
         if len(ranges) > 0:
             ip_ranges[subnet["cidr"]] = ranges
     return ip_ranges
 
 
+def get_ip_ranges_from_space(client: MaasClient, space: str) -> dict[str, list[dict]]:
+    """Return all IP ranges from a space.
+
+    Return a dict with the CIDR as key and a list of IP ranges as value.
+    """
+    subnets = client.get_subnets(space)
+    return _ip_ranges_by_cidr(subnets, client.list_ip_ranges_by_subnet())
+
+
+@dataclasses.dataclass(frozen=True)
+class MaasInventory:
+    """Snapshot of the MAAS objects inspected by a validation run.
+
+    Machines carry their block devices and interfaces, see
+    _convert_raw_machine. The snapshot is fetched once and shared by all the
+    checks of the run instead of each check querying MAAS.
+    """
+
+    machines: list[dict]
+    spaces: list[dict]
+    subnets: list[dict]
+    ip_ranges: dict[int, list[dict]]
+
+    def get_subnets(self, space: str) -> list[dict]:
+        """List subnets of a space."""
+        if not any(space_raw["name"] == space for space_raw in self.spaces):
+            raise ValueError(f"Space {space!r} not found.")
+        return [subnet for subnet in self.subnets if subnet["space"] == space]
+
+    def get_ip_ranges_from_space(self, space: str) -> dict[str, list[dict]]:
+        """Return all IP ranges from a space, keyed by CIDR."""
+        return _ip_ranges_by_cidr(self.get_subnets(space), self.ip_ranges)
+
+
+def fetch_inventory(client: MaasClient, **extra_args) -> MaasInventory:
+    """Fetch a MAAS inventory snapshot.
+
+    Spaces, subnets and IP ranges are listed while the machines are fetched.
+    """
+    with maas_executor(3) as executor:
+        spaces = executor.submit(client.list_spaces)
+        subnets = executor.submit(client.get_subnets)
+        ip_ranges = executor.submit(client.list_ip_ranges_by_subnet)
+        machines = list_machines(client, **extra_args)
+        return MaasInventory(
+            machines=machines,
+            spaces=spaces.result(),
+            subnets=subnets.result(),
+            ip_ranges=ip_ranges.result(),
+        )
+
+
 def get_ifname_from_space(client: MaasClient, space: str, **extra_args) -> str | None:
     """Get interface name for the given space.
 
@@ -5,6 +5,7 @@ import json
 import logging
 import sys
 from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Sequence, Tuple, Type
@@ -72,15 +73,18 @@ from sunbeam.feature_gates import feature_gate_option
 from sunbeam.provider.base import ProviderBase
 from sunbeam.provider.common.multiregion import connect_to_region_controller
 from sunbeam.provider.maas.client import (
+    MAAS_CONCURRENCY,
     MaasClient,
     MaasDeployment,
     RoleTags,
+    fetch_inventory,
     get_machine,
     get_network_mapping,
     is_maas_deployment,
     list_machines,
     list_machines_by_zone,
     list_spaces,
+    maas_executor,
     map_spaces,
     unmap_spaces,
 )
@@ -116,6 +120,7 @@ from sunbeam.provider.maas.steps import (
     MachineRootDiskCheck,
     MachineStorageCheck,
     NetworkMappingCompleteCheck,
+    run_check,
 )
 from sunbeam.steps import cluster_status
 from sunbeam.steps.bootstrap_state import SetBootstrapped
@@ -1493,32 +1498,35 @@ def _colorize_result(result: DiagnosticsResult) -> str:
     return status
 
 
+def _submit_maas_checks(
+    executor: ThreadPoolExecutor, checks: list[DiagnosticsCheck]
+) -> list[tuple[DiagnosticsCheck, Future]]:
+    """Submit the checks to the executor, keep them paired with their future."""
+    return [(check, executor.submit(run_check, check)) for check in checks]
+
+
+def _wait_maas_check(
+    check: DiagnosticsCheck, future: Future, console: Console
+) -> list[DiagnosticsResult]:
+    """Wait for the results of a check, showing its progress."""
+    with console.status(f"{check.description}..."):
+        results = future.result()
+    if not results:
+        raise ValueError(f"{check.name!r} returned no results.")
+    return results
+
+
 def _run_maas_checks(checks: list[DiagnosticsCheck], console: Console) -> list[dict]:
-    """Run checks sequentially.
+    """Run checks concurrently.
 
     Runs each checks, logs whether the check passed or failed.
-    Prints to console every result.
+    Prints to console every result, in the order of the checks.
     """
     check_results = []
-    for check in checks:
-        LOG.debug("Starting check %r", check.name)
-        message = f"{check.description}..."
-        with console.status(message):
-            results = check.run()
-            if not results:
-                raise ValueError(f"{check.name!r} returned no results.")
-
-            if isinstance(results, DiagnosticsResult):
-                results = [results]
-
-            for result in results:
-                passed = result.passed.value
-                LOG.debug(
-                    "Result for %r: passed=%r, message=%r",
-                    result.name,
-                    passed,
-                    result.message,
-                )
+    with maas_executor(max(1, min(MAAS_CONCURRENCY, len(checks)))) as executor:
+        for check, future in _submit_maas_checks(executor, checks):
+            message = f"{check.description}..."
+            for result in _wait_maas_check(check, future, console):
                 console.print(
                     message,
                     result.message,
@@ -1532,25 +1540,18 @@ def _run_maas_checks(checks: list[DiagnosticsCheck], console: Console) -> list[d
 def _run_maas_meta_checks(
     checks: list[DiagnosticsCheck], console: Console
 ) -> list[dict]:
-    """Run checks sequentially.
+    """Run checks concurrently.
 
     Runs each checks, logs whether the check passed or failed.
-    Only prints to console last check result.
+    Only prints to console last check result, in the order of the checks.
     """
     check_results = []
-
-    for check in checks:
-        LOG.debug("Starting check %r", check.name)
-        message = f"{check.description}..."
-        with console.status(message):
-            results = check.run()
-            if not results:
-                raise ValueError(f"{check.name!r} returned no results.")
-            if isinstance(results, DiagnosticsResult):
-                results = [results]
+    with maas_executor(max(1, min(MAAS_CONCURRENCY, len(checks)))) as executor:
+        for check, future in _submit_maas_checks(executor, checks):
+            results = _wait_maas_check(check, future, console)
             for result in results:
                 check_results.append(result.to_dict())
-            console.print(message, _colorize_result(results[-1]))
+            console.print(f"{check.description}...", _colorize_result(results[-1]))
     return check_results
 
 
@@ -1619,16 +1620,16 @@ def validate_deployment_cmd(ctx: click.Context):
     snap = Snap()
     deployment: MaasDeployment = ctx.obj
     client = MaasClient.from_deployment(deployment)
-    with console.status(f"Fetching {deployment.name} machines ..."):
+    with console.status(f"Fetching {deployment.name} inventory ..."):
         try:
-            machines = list_machines(client)
+            inventory = fetch_inventory(client)
         except ValueError as e:
             console.print("Error:", e)
             sys.exit(1)
     validation_checks = [
-        DeploymentMachinesCheck(deployment, machines),
-        DeploymentTopologyCheck(machines),
-        DeploymentNetworkingCheck(client, deployment),
+        DeploymentMachinesCheck(deployment, inventory.machines),
+        DeploymentTopologyCheck(inventory.machines),
+        DeploymentNetworkingCheck(client, deployment, inventory),
     ]
     report = _run_maas_meta_checks(validation_checks, console)
     report_path = _save_report(snap, "validate-deployment-" + deployment.name, report)
@@ -1644,15 +1645,23 @@ def validate_deployment_cmd(ctx: click.Context):
     help="Skip safety checks and ignore cleanup errors for some tasks",
     is_flag=True,
 )
-@click.argument("name", type=str)
+@click.argument("names", type=str, nargs=-1, required=True)
 @click_option_show_hints
 @click.pass_context
-def remove_node(ctx: click.Context, name: str, force: bool, show_hints: bool) -> None:
-    """Remove a node from the cluster."""
+def remove_node(
+    ctx: click.Context, names: tuple[str, ...], force: bool, show_hints: bool
+) -> None:
+    """Remove one or more nodes from the cluster.
+
+    All the nodes are removed with a single plan, their units are removed and
+    waited for together.
+    """
     deployment: MaasDeployment = ctx.obj
     client = deployment.get_client()
     jhelper = JujuHelper(deployment.juju_controller)
     microovn_machine_ids = deployment.get_ovn_manager().get_machines()
+    nodes = list(dict.fromkeys(names))
+    model = deployment.openstack_machines_model
 
     preflight_checks = [
         LocalShareCheck(),
@@ -1661,65 +1670,41 @@ def remove_node(ctx: click.Context, name: str, force: bool, show_hints: bool) ->
 
     check_plan: list[BaseStep] = [
         JujuLoginStep(deployment.juju_account),
-        CheckCinderVolumeDistributionStep(
-            client,
-            name,
-            jhelper,
-            deployment.openstack_machines_model,
-            force=force,
-        ),
-        CheckMicrocephDistributionStep(
-            client,
-            name,
-            jhelper,
-            deployment.openstack_machines_model,
-            force=force,
-        ),
-        CheckMysqlK8SDistributionStep(
-            client,
-            name,
-            jhelper,
-            deployment.openstack_machines_model,
-            force=force,
-        ),
-        CheckRabbitmqK8SDistributionStep(
-            client,
-            name,
-            jhelper,
-            deployment.openstack_machines_model,
-            force=force,
-        ),
+        CheckCinderVolumeDistributionStep(client, nodes, jhelper, model, force=force),
+        CheckMicrocephDistributionStep(client, nodes, jhelper, model, force=force),
     ]
+    for name in nodes:
+        check_plan.extend(
+            [
+                CheckMysqlK8SDistributionStep(
+                    client, name, jhelper, model, force=force, removed_nodes=nodes
+                ),
+                CheckRabbitmqK8SDistributionStep(
+                    client, name, jhelper, model, force=force, removed_nodes=nodes
+                ),
+            ]
+        )
 
     run_plan(check_plan, console, show_hints)
 
-    plan = [
-        MigrateK8SKubeconfigStep(
-            client, name, jhelper, deployment.openstack_machines_model
+    plan: list[BaseStep] = [
+        *(
+            MigrateK8SKubeconfigStep(client, name, jhelper, model, removed_nodes=nodes)
+            for name in nodes
         ),
         UpdateK8SCloudStep(deployment, jhelper),
-        RemoveHypervisorUnitStep(
-            client,
-            jhelper,
-            deployment,
-            name,
-            deployment.openstack_machines_model,
-            force,
-        ),
-        RemoveCinderVolumeUnitsStep(
-            client, name, jhelper, deployment.openstack_machines_model
-        ),
-        RemoveMicrocephUnitsStep(
-            client, name, jhelper, deployment.openstack_machines_model
-        ),
-        RemoveMicroOVNUnitsStep(
-            client, name, jhelper, deployment.openstack_machines_model
+        RemoveHypervisorUnitStep(client, jhelper, deployment, nodes, model, force),
+        RemoveCinderVolumeUnitsStep(client, nodes, jhelper, model),
+        RemoveMicrocephUnitsStep(client, nodes, jhelper, model),
+        RemoveMicroOVNUnitsStep(client, nodes, jhelper, model),
+        # Cordon every node first, so pods evicted from one node are not
+        # scheduled on another node being removed.
+        *(CordonK8SUnitStep(client, name, jhelper, model) for name in nodes),
+        *(
+            DrainK8SUnitStep(client, name, jhelper, model, remove_pvc=True)
+            for name in nodes
         ),
-        CordonK8SUnitStep(client, name, jhelper, deployment.openstack_machines_model),
-        DrainK8SUnitStep(
-            client, name, jhelper, deployment.openstack_machines_model, remove_pvc=True
-        ),
-        RemoveK8SUnitsStep(client, name, jhelper, deployment.openstack_machines_model),
+        RemoveK8SUnitsStep(client, nodes, jhelper, model),
         EnsureCiliumDeviceByHostStep(
             deployment,
             client,
@@ -1751,13 +1736,9 @@ def remove_node(ctx: click.Context, name: str, force: bool, show_hints: bool) ->
             deployment.storage_ip_pool,
             optional_if_pool_missing=True,
         ),
-        RemoveSunbeamMachineUnitsStep(
-            client, name, jhelper, deployment.openstack_machines_model
-        ),
-        RemoveJujuMachineStep(
-            client, name, jhelper, deployment.openstack_machines_model
-        ),
-        MaasRemoveMachineFromClusterdStep(client, name),
+        RemoveSunbeamMachineUnitsStep(client, nodes, jhelper, model),
+        *(RemoveJujuMachineStep(client, name, jhelper, model) for name in nodes),
+        *(MaasRemoveMachineFromClusterdStep(client, name) for name in nodes),
         SetCephMgrPoolSizeStep(client, jhelper, deployment.openstack_machines_model),
     ]
     if microovn_machine_ids:
@@ -1769,9 +1750,7 @@ def remove_node(ctx: click.Context, name: str, force: bool, show_hints: bool) ->
         )
         plan.insert(
             cordon_k8s_unit_index,
-            RemoveRoleDistributorUnitsStep(
-                client, name, jhelper, deployment.openstack_machines_model
-            ),
+            RemoveRoleDistributorUnitsStep(client, nodes, jhelper, model),
         )
         ceph_pool_size_index = next(
             i for i, step in enumerate(plan) if isinstance(step, SetCephMgrPoolSizeStep)
@@ -1798,7 +1777,10 @@ def remove_node(ctx: click.Context, name: str, force: bool, show_hints: bool) ->
         ]
 
     run_plan(plan, console, show_hints)
-    click.echo(f"Removed node {name} from the cluster.")
+    click.echo(
+        f"Removed node{'s' if len(nodes) > 1 else ''} {', '.join(nodes)}"
+        " from the cluster."
+    )
 
 
 @click.command("destroy")
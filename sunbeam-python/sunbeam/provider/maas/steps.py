@@ -644,22 +644,28 @@ class MachineRequirementsCheck(DiagnosticsCheck):
         )
 
 
+def run_check(check: DiagnosticsCheck) -> list[DiagnosticsResult]:
+    """Run a check, always return a list of results."""
+    LOG.debug("Starting check %s", check.name)
+    results = check.run()
+    if isinstance(results, DiagnosticsResult):
+        results = [results]
+    for result in results:
+        passed = result.passed.value
+        LOG.debug(
+            "Result for %r: passed=%r, message=%r",
+            result.name,
+            passed,
+            result.message,
+        )
+    return results
+
+
 def _run_check_list(checks: Sequence[DiagnosticsCheck]) -> list[DiagnosticsResult]:
+    """Run independent checks concurrently, results are in the checks order."""
     check_results = []
-    for check in checks:
-        LOG.debug("Starting check %s", check.name)
-        results = check.run()
-        if isinstance(results, DiagnosticsResult):
-            results = [results]
-        for result in results:
-            passed = result.passed.value
-            LOG.debug(
-                "Result for %r: passed=%r, message=%r",
-                result.name,
-                passed,
-                result.message,
-            )
-            check_results.extend(results)
+    for results in maas_client.concurrent_map(run_check, checks):
+        check_results.extend(results)
     return check_results
 
 
@@ -882,6 +888,7 @@ class IpRangesCheck(DiagnosticsCheck):
         self,
         client: maas_client.MaasClient,
         deployment: maas_deployment.MaasDeployment,
+        inventory: maas_client.MaasInventory | None = None,
     ):
         super().__init__(
             "IP ranges check",
@@ -889,6 +896,12 @@ class IpRangesCheck(DiagnosticsCheck):
         )
         self.client = client
         self.deployment = deployment
+        self.inventory = inventory
+
+    def _get_ip_ranges_from_space(self, space: str) -> dict[str, list[dict]]:
+        if self.inventory is not None:
+            return self.inventory.get_ip_ranges_from_space(space)
+        return maas_client.get_ip_ranges_from_space(self.client, space)
 
     def _get_ranges_for_label(
         self, subnet_ranges: dict[str, list[dict[str, str]]], label: str
@@ -920,12 +933,8 @@ class IpRangesCheck(DiagnosticsCheck):
                 ),
             )
 
-        public_subnet_ranges = maas_client.get_ip_ranges_from_space(
-            self.client, public_space
-        )
-        internal_subnet_ranges = maas_client.get_ip_ranges_from_space(
-            self.client, internal_space
-        )
+        public_subnet_ranges = self._get_ip_ranges_from_space(public_space)
+        internal_subnet_ranges = self._get_ip_ranges_from_space(internal_space)
 
         public_ip_ranges = self._get_ranges_for_label(
             public_subnet_ranges, self.deployment.public_api_label
@@ -1062,6 +1071,7 @@ class DeploymentNetworkingCheck(DiagnosticsCheck):
         self,
         client: maas_client.MaasClient,
         deployment: maas_deployment.MaasDeployment,
+        inventory: maas_client.MaasInventory | None = None,
     ):
         super().__init__(
             "Networking check",
@@ -1069,11 +1079,12 @@ class DeploymentNetworkingCheck(DiagnosticsCheck):
         )
         self.client = client
         self.deployment = deployment
+        self.inventory = inventory
 
     def run(self) -> list[DiagnosticsResult]:
         """Run a sequence of checks to validate deployment networking."""
         checks = []
-        checks.append(IpRangesCheck(self.client, self.deployment))
+        checks.append(IpRangesCheck(self.client, self.deployment, self.inventory))
 
         results = _run_check_list(checks)
         results.append(
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+"""Profile the import time of the sunbeam CLI.
+
+Run ``python -m sunbeam.startup_profile`` (from the snap environment) to get
+the modules ranked by cumulative import time, as reported by
+``python -X importtime``.
+"""
+
+import argparse
+import dataclasses
+import subprocess
+import sys
+
+# Modules which must never be imported when loading the CLI entrypoint, they
+# are imported lazily by the commands needing them.
+HEAVY_MODULES = (
+    "kubernetes",
+    "lightkube.resources",
+    "maas.client",
+    "openstack",
+    "pyroute2",
+    "watcherclient",
+)
+
+_IMPORTTIME_PREFIX = "import time:"
+
+
+@dataclasses.dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Parse the stderr of a ``python -X importtime`` run."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith(_IMPORTTIME_PREFIX):
+            continue
+        fields = line[len(_IMPORTTIME_PREFIX) :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Header line
+            continue
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        records.append(
+            ImportRecord(
+                module=module,
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+    return records
+
+
+def heavy_imports(modules: list[str]) -> list[str]:
+    """Return the modules belonging to HEAVY_MODULES."""
+    return sorted(
+        module
+        for module in modules
+        if any(
+            module == heavy or module.startswith(f"{heavy}.") for heavy in HEAVY_MODULES
+        )
+    )
+
+
+def profile_imports(module: str = "sunbeam.main") -> list[ImportRecord]:
+    """Import module in a fresh interpreter and return its import records."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"Failed to import {module}: {process.stderr}")
+    return parse_importtime(process.stderr)
+
+
+def format_report(records: list[ImportRecord], top: int = 30) -> str:
+    """Return a report of the slowest imports, ranked by cumulative time."""
+    ranked = sorted(records, key=lambda record: record.cumulative_us, reverse=True)
+    heavy = heavy_imports([record.module for record in records])
+    lines = [f"{'cumulative [ms]':>15} {'self [ms]':>10}  module"]
+    for record in ranked[:top]:
+        lines.append(
+            f"{record.cumulative_us / 1000:>15.1f} {record.self_us / 1000:>10.1f}"
+            f"  {record.module}"
+        )
+    if heavy:
+        lines.append("")
+        lines.append(f"Heavy modules imported: {', '.join(heavy)}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m sunbeam.startup_profile",
+        description="Rank the modules imported at sunbeam startup by import time.",
+    )
+    parser.add_argument("--module", default="sunbeam.main", help="Module to import.")
+    parser.add_argument(
+        "--top", type=int, default=30, help="Number of modules to report."
+    )
+    args = parser.parse_args(argv)
+
+    records = profile_imports(args.module)
+    print(format_report(records, args.top))
+    return 1 if heavy_imports([record.module for record in records]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -237,17 +237,19 @@ class CheckCinderVolumeDistributionStep(BaseStep):
     def __init__(
         self,
         client: Client,
-        name: str,
+        names: list[str] | str,
         jhelper: JujuHelper,
         model: str,
         force: bool = False,
     ):
         super().__init__(
             "Check Cinder Volume distribution",
-            "Check if node is hosting units of Cinder Volume",
+            "Check if nodes are hosting units of Cinder Volume",
         )
         self.client = client
-        self.node = name
+        if isinstance(names, str):
+            names = [names]
+        self.names = names
         self.jhelper = jhelper
         self.model = model
         self.force = force
@@ -255,19 +257,27 @@ class CheckCinderVolumeDistributionStep(BaseStep):
     def is_skip(self, context: StepContext) -> Result:
         """Determines if the step should be skipped or not.
 
+        All the nodes are checked together, as removing them at once may
+        remove more units than removing any one of them.
+
         :return: ResultType.SKIPPED if the Step should be skipped,
                 ResultType.COMPLETED or ResultType.FAILED otherwise
         """
-        try:
-            node_info = self.client.cluster.get_node_info(self.node)
-        except NodeNotExistInClusterException:
-            return Result(
-                ResultType.SKIPPED, f"Node {self.node} is not found in the cluster"
-            )
-
-        if Role.STORAGE.name.lower() not in node_info.get("role", ""):
-            LOG.debug("Node %s is not a storage node", self.node)
+        # node name -> machine id
+        storage_nodes = {}
+        for name in self.names:
+            try:
+                node_info = self.client.cluster.get_node_info(name)
+            except NodeNotExistInClusterException:
+                LOG.debug("Node %s is not found in the cluster", name)
+                continue
+            if Role.STORAGE.name.lower() not in node_info.get("role", ""):
+                LOG.debug("Node %s is not a storage node", name)
+                continue
+            storage_nodes[name] = str(node_info.get("machineid"))
+        if not storage_nodes:
             return Result(ResultType.SKIPPED)
+
         try:
             app = self.jhelper.get_application(self._APPLICATION, self.model)
         except ApplicationNotFoundException:
@@ -277,15 +287,19 @@ class CheckCinderVolumeDistributionStep(BaseStep):
                 f"Application {self._APPLICATION} has not been deployed yet",
             )
 
-        for unit_name, unit in app.units.items():
-            if unit.machine == str(node_info.get("machineid")):
-                LOG.debug("Unit %s is running on node %s", unit_name, self.node)
-                break
-        else:
-            LOG.debug("No %s units found on %s", self._APPLICATION, self.node)
+        machines = {unit.machine for unit in app.units.values()}
+        storage_nodes = {
+            name: machine_id
+            for name, machine_id in storage_nodes.items()
+            if machine_id in machines
+        }
+        if not storage_nodes:
+            LOG.debug("No %s units found on %s", self._APPLICATION, self.names)
             return Result(ResultType.SKIPPED)
+        LOG.debug("%s units are running on %s", self._APPLICATION, list(storage_nodes))
+
         nb_storage_nodes = len(self.client.cluster.list_nodes_by_role("storage"))
-        if nb_storage_nodes == 1 and not self.force:
+        if nb_storage_nodes <= len(storage_nodes) and not self.force:
             return Result(
                 ResultType.FAILED,
                 "Cannot remove the last cinder-volume,"
@@ -1,10 +1,15 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import contextlib
 import ipaddress
 import logging
 import re
+import time
+import uuid
+from datetime import datetime, timezone
 
+from requests.exceptions import HTTPError
 from rich.console import Console
 
 import sunbeam.versions as versions
@@ -19,12 +24,20 @@ from sunbeam.clusterd.service import (
     NodeAlreadyExistsException,
     NodeJoinException,
     NodeNotExistInClusterException,
+    TerraformLockConflictException,
     TokenAlreadyGeneratedException,
     TokenNotFoundException,
     URLNotFoundException,
 )
 from sunbeam.core import questions
-from sunbeam.core.common import BaseStep, Result, ResultType, StepContext
+from sunbeam.core.common import (
+    BaseStep,
+    Result,
+    ResultType,
+    StepContext,
+    read_config,
+    update_config,
+)
 from sunbeam.core.juju import (
     ApplicationNotFoundException,
     JujuController,
@@ -34,6 +47,7 @@ from sunbeam.core.juju import (
     ModelNotFoundException,
 )
 from sunbeam.core.manifest import CharmManifest, Manifest
+from sunbeam.core.terraform import TerraformLockWaiter
 from sunbeam.steps.juju import BOOTSTRAP_CONFIG_KEY
 
 LOG = logging.getLogger(__name__)
@@ -42,6 +56,14 @@ SUNBEAM_CLUSTERD_APP_TIMEOUT = (
     1200  # 20 minutes, adding / removing units can take a long time
 )
 CLUSTERD_PORT = 7000
+# Join coalescing is coordinated through a clusterd terraform lock, this
+# makes the leader visible (and unlockable) through `sunbeam plans`.
+JOIN_COALESCING_LOCK = "join-coalescing"
+JOIN_COALESCING_BATCH_KEY = "JoinCoalescingBatch"
+JOIN_COALESCING_TIMEOUT = 3600  # 1 hour, a batch runs several plans
+# A leader holding the lock longer than a batch can take is gone
+JOIN_COALESCING_STALE_AGE = JOIN_COALESCING_TIMEOUT
+JOIN_COALESCING_POLL_INTERVAL = 10
 
 
 def bootstrap_questions():
@@ -389,6 +411,203 @@ class ClusterUpdateNodeStep(BaseStep):
             return Result(ResultType.FAILED, str(e))
 
 
+class JoinCoalescer:
+    """Coalesce concurrent node joins into a single reconciliation.
+
+    Nodes joining within the coalescing window register in clusterd and then
+    elect a leader through the join-coalescing lock. The leader records the
+    batch of nodes registered at that time and reconciles all of them with a
+    single set of Terraform applies, other nodes wait for the batch to be
+    completed and only run their node specific steps. A lock older than the
+    stale age is left by a leader which is gone, waiting nodes break it and
+    elect a new leader.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        name: str,
+        window: int,
+        timeout: int = JOIN_COALESCING_TIMEOUT,
+        poll_interval: int = JOIN_COALESCING_POLL_INTERVAL,
+        stale_age: int = JOIN_COALESCING_STALE_AGE,
+    ):
+        self.client = client
+        self.name = name
+        self.window = window
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.stale_age = stale_age
+        self.is_leader = False
+        self.lock = {
+            "ID": str(uuid.uuid4()),
+            "Operation": "OperationTypeJoin",
+            "Info": "Coalesced node join",
+            "Who": name,
+            "Version": versions.determine_version(),
+            "Created": datetime.now(tz=timezone.utc).isoformat(),
+            "Path": "",
+        }
+        self._batch_id: str | None = None
+
+    def _read_batch(self) -> dict:
+        try:
+            return read_config(self.client, JOIN_COALESCING_BATCH_KEY)
+        except ConfigItemNotFoundException:
+            return {}
+
+    def _is_reconciled(self, batch: dict) -> bool:
+        """Whether a batch started after registration reconciled this node."""
+        return (
+            batch.get("id") != self._batch_id
+            and batch.get("status") == "completed"
+            and self.name in batch.get("nodes", [])
+        )
+
+    def _acquire(self) -> dict | None:
+        """Try to acquire the coalescing lock, return the holder on conflict."""
+        # The lock age tells waiting nodes whether the leader is gone
+        self.lock["Created"] = datetime.now(tz=timezone.utc).isoformat()
+        try:
+            self.client.cluster.lock_terraform_plan(JOIN_COALESCING_LOCK, self.lock)
+        except TerraformLockConflictException as e:
+            return e.lock or {}
+        # Only lead if the stored lock is ours, clusterd versions acquiring
+        # the lock in two transactions let concurrent requests all succeed.
+        try:
+            holder = self.client.cluster.get_terraform_lock(JOIN_COALESCING_LOCK)
+        except (ConfigItemNotFoundException, URLNotFoundException):
+            return {}
+        if holder.get("ID") != self.lock["ID"]:
+            return holder
+        return None
+
+    def _break_stale(self, holder: dict) -> bool:
+        """Break the lock of a gone leader, return whether it was released."""
+        age = TerraformLockWaiter.lock_age(holder)
+        if age is None or age <= self.stale_age:
+            return False
+        LOG.warning(
+            "Breaking %r lock held by %s for %ds",
+            JOIN_COALESCING_LOCK,
+            holder.get("Who", "unknown"),
+            age,
+        )
+        try:
+            self.client.cluster.unlock_terraform_plan(JOIN_COALESCING_LOCK, holder)
+        except HTTPError:
+            # Another node broke the lock first
+            LOG.debug("Failed to break stale lock", exc_info=True)
+            return False
+        return True
+
+    def wait(self, status_callback=None) -> bool:
+        """Wait for the node to be reconciled or to be elected leader.
+
+        :param status_callback: called with a message while waiting
+        :return: True if this node leads the reconciliation
+        """
+        # Remember the last known batch, only batches started after this
+        # node registered can account for it.
+        self._batch_id = self._read_batch().get("id")
+        LOG.debug("Waiting %ss for other nodes to join", self.window)
+        time.sleep(self.window)
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            if self._is_reconciled(self._read_batch()):
+                LOG.debug("Node %s reconciled by another node", self.name)
+                return False
+            holder = self._acquire()
+            if holder is None:
+                # A batch might have completed between the check and the lock
+                if self._is_reconciled(self._read_batch()):
+                    self.release()
+                    return False
+                self.is_leader = True
+                return True
+            if self._break_stale(holder):
+                continue
+            if status_callback is not None:
+                status_callback(
+                    f"waiting for {holder.get('Who', 'another node')} to"
+                    " reconcile joining nodes"
+                )
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Timed out waiting for {JOIN_COALESCING_LOCK!r} lock, held by"
+                    f" {holder.get('Who', 'unknown')}"
+                )
+            time.sleep(self.poll_interval)
+
+    def start_batch(self) -> list[str]:
+        """Record the batch of registered nodes the leader reconciles."""
+        nodes = sorted(
+            node["name"]
+            for node in self.client.cluster.list_nodes()
+            if node.get("machineid", -1) != -1
+        )
+        batch = {
+            "id": self.lock["ID"],
+            "leader": self.name,
+            "nodes": nodes,
+            "status": "running",
+        }
+        update_config(self.client, JOIN_COALESCING_BATCH_KEY, batch)
+        LOG.debug("Reconciling join batch %s", batch)
+        return nodes
+
+    def finish_batch(self, nodes: list[str], success: bool) -> None:
+        """Mark the batch as done, followers fall back to leading on failure."""
+        batch = {
+            "id": self.lock["ID"],
+            "leader": self.name,
+            "nodes": nodes,
+            "status": "completed" if success else "failed",
+        }
+        update_config(self.client, JOIN_COALESCING_BATCH_KEY, batch)
+
+    def release(self) -> None:
+        """Release the coalescing lock."""
+        self.client.cluster.unlock_terraform_plan(JOIN_COALESCING_LOCK, self.lock)
+        self.is_leader = False
+
+    @contextlib.contextmanager
+    def reconcile(self):
+        """Context manager wrapping the leader reconciliation."""
+        nodes = self.start_batch()
+        success = False
+        try:
+            yield nodes
+            success = True
+        finally:
+            try:
+                self.finish_batch(nodes, success)
+            finally:
+                self.release()
+
+
+class WaitForJoinCoalescingStep(BaseStep):
+    """Wait for concurrent joins to be coalesced."""
+
+    def __init__(self, coalescer: JoinCoalescer):
+        super().__init__(
+            "Coalesce node joins",
+            "Waiting for concurrent node joins",
+        )
+        self.coalescer = coalescer
+
+    def run(self, context: StepContext) -> Result:
+        """Wait to be elected leader or reconciled by the leader."""
+        try:
+            self.coalescer.wait(lambda msg: self.update_status(context, msg))
+        except TimeoutError as e:
+            LOG.debug("Failed to coalesce node join", exc_info=True)
+            return Result(ResultType.FAILED, str(e))
+        # Callers read the election outcome from coalescer.is_leader
+        return Result(ResultType.COMPLETED)
+
+
 class ClusterRemoveNodeStep(BaseStep):
     """Remove node from the sunbeam cluster."""
 
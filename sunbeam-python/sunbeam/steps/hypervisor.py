@@ -4,8 +4,7 @@
 import json
 import logging
 import typing
-
-import tenacity
+from concurrent.futures import ThreadPoolExecutor
 
 from sunbeam.clusterd.client import Client
 from sunbeam.clusterd.service import (
@@ -22,7 +21,6 @@ from sunbeam.core.common import (
     ResultType,
     Role,
     StepContext,
-    convert_retry_failure_as_result,
     read_config,
     update_config,
 )
@@ -60,6 +58,8 @@ HYPERVISOR_DESTROY_TIMEOUT = 600
 HYPERVISOR_UNIT_TIMEOUT = (
     1800  # 30 minutes, adding / removing units can take a long time
 )
+# Maximum number of actions run at once on hypervisor units
+HYPERVISOR_ACTION_CONCURRENCY = 8
 
 
 class DeployHypervisorApplicationStep(DeployMachineApplicationStep):
@@ -205,27 +205,51 @@ class ReapplyHypervisorOptionalIntegrationsStep(DeployHypervisorApplicationStep)
 
 
 class RemoveHypervisorUnitStep(BaseStep, JujuStepHelper):
+    """Remove the openstack-hypervisor units of one or several nodes.
+
+    Actions are run on all the units concurrently, the units are removed with
+    a single request and waited for together.
+    """
+
     def __init__(
         self,
         client: Client,
         jhelper: JujuHelper,
         deployment: "Deployment | None",
-        name: str,
+        names: list[str] | str,
         model: str,
         force: bool = False,
     ):
         super().__init__(
-            "Remove openstack-hypervisor unit",
-            "Remove openstack-hypervisor unit from machine",
+            "Remove openstack-hypervisor unit(s)",
+            "Remove openstack-hypervisor unit(s) from machine(s)",
         )
         self.client = client
-        self.node_name = name
+        if isinstance(names, str):
+            names = [names]
+        self.names = names
         self.jhelper = jhelper
         self.model = model
         self.force = force
         self.deployment = deployment
-        self.unit: str | None = None
-        self.machine_id = ""
+        # node name -> unit name
+        self.units: dict[str, str] = {}
+        # node name -> machine id
+        self.machine_ids: dict[str, str] = {}
+
+    def _run_action_on_units(self, action: str) -> dict[str, dict]:
+        """Run action on every unit concurrently, return results by unit."""
+        units = list(self.units.values())
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(HYPERVISOR_ACTION_CONCURRENCY, len(units)))
+        ) as executor:
+            results = executor.map(
+                lambda unit: self.jhelper.for_worker().run_action(
+                    unit, self.model, action
+                ),
+                units,
+            )
+            return dict(zip(units, results))
 
     def is_skip(self, context: StepContext) -> Result:
         """Determines if the step should be skipped or not.
@@ -233,11 +257,14 @@ class RemoveHypervisorUnitStep(BaseStep, JujuStepHelper):
         :return: ResultType.SKIPPED if the Step should be skipped,
                 ResultType.COMPLETED or ResultType.FAILED otherwise
         """
-        try:
-            node = self.client.cluster.get_node_info(self.node_name)
-            self.machine_id = str(node.get("machineid"))
-        except NodeNotExistInClusterException:
-            LOG.debug("Machine %s does not exist, skipping", self.node_name)
+        for name in self.names:
+            try:
+                node = self.client.cluster.get_node_info(name)
+            except NodeNotExistInClusterException:
+                LOG.debug("Machine %s does not exist, skipping", name)
+                continue
+            self.machine_ids[name] = str(node.get("machineid"))
+        if not self.machine_ids:
             return Result(ResultType.SKIPPED)
 
         try:
@@ -248,59 +275,66 @@ class RemoveHypervisorUnitStep(BaseStep, JujuStepHelper):
                 ResultType.SKIPPED, "Hypervisor application has not been deployed yet"
             )
 
-        for unit_name, unit in application.units.items():
-            if unit.machine == self.machine_id:
-                LOG.debug(
-                    "Unit %s is deployed on machine: %s", unit_name, self.machine_id
-                )
-                self.unit = unit_name
-                break
-        if not self.unit:
-            LOG.debug("Unit is not deployed on machine: %s, skipping", self.machine_id)
+        machine_units = {
+            unit.machine: unit_name for unit_name, unit in application.units.items()
+        }
+        for name, machine_id in self.machine_ids.items():
+            if unit_name := machine_units.get(machine_id):
+                LOG.debug("Unit %s is deployed on machine: %s", unit_name, machine_id)
+                self.units[name] = unit_name
+            else:
+                LOG.debug("Unit is not deployed on machine: %s, skipping", machine_id)
+        if not self.units:
             return Result(ResultType.SKIPPED)
+
         try:
-            results = self.jhelper.run_action(self.unit, self.model, "running-guests")
+            results = self._run_action_on_units("running-guests")
         except ActionFailedException:
             LOG.debug("Failed to run action on hypervisor unit", exc_info=True)
             return Result(ResultType.FAILED, "Failed to run action on hypervisor unit")
 
-        if result := results.get("result"):
-            guests = json.loads(result)
-            LOG.debug("Found guests on hypervisor: %s", guests)
-            if guests and not self.force:
-                return Result(
-                    ResultType.FAILED,
-                    "Guests are running on hypervisor, aborting",
-                )
+        for unit_name, unit_results in results.items():
+            if result := unit_results.get("result"):
+                guests = json.loads(result)
+                LOG.debug("Found guests on hypervisor %s: %s", unit_name, guests)
+                if guests and not self.force:
+                    return Result(
+                        ResultType.FAILED,
+                        f"Guests are running on hypervisor {unit_name}, aborting",
+                    )
         return Result(ResultType.COMPLETED)
 
-    def remove_machine_id_from_tfvar(self) -> None:
-        """Remove machine if from terraform vars saved in cluster db."""
+    def remove_machine_ids_from_tfvar(self) -> None:
+        """Remove machine ids from terraform vars saved in cluster db."""
         try:
             tfvars = read_config(self.client, CONFIG_KEY)
         except ConfigItemNotFoundException:
             tfvars = {}
 
         machine_ids = tfvars.get("machine_ids", [])
-        if self.machine_id in machine_ids:
-            machine_ids.remove(self.machine_id)
-            tfvars.update({"machine_ids": machine_ids})
+        removed = {self.machine_ids.get(name) for name in self.units}
+        remaining = [
+            machine_id for machine_id in machine_ids if machine_id not in removed
+        ]
+        if remaining != machine_ids:
+            tfvars.update({"machine_ids": remaining})
             update_config(self.client, CONFIG_KEY, tfvars)
 
     def run(self, context: StepContext) -> Result:
-        """Remove unit from openstack-hypervisor application on Juju model."""
-        if not self.unit:
+        """Remove units from openstack-hypervisor application on Juju model."""
+        if not self.units:
             return Result(ResultType.FAILED, "Unit not found on machine")
         try:
-            self.jhelper.run_action(self.unit, self.model, "disable")
+            self._run_action_on_units("disable")
         except ActionFailedException as e:
             LOG.debug("Failed to disable hypervisor unit: %r", e)
             return Result(ResultType.FAILED, "Failed to disable hypervisor unit")
+        units = list(self.units.values())
         try:
-            self.jhelper.remove_unit(APPLICATION, self.unit, self.model)
-            self.remove_machine_id_from_tfvar()
+            self.jhelper.remove_units(units, self.model)
+            self.remove_machine_ids_from_tfvar()
             self.jhelper.wait_units_gone(
-                [self.unit],
+                units,
                 self.model,
                 timeout=HYPERVISOR_UNIT_TIMEOUT,
             )
@@ -313,19 +347,23 @@ class RemoveHypervisorUnitStep(BaseStep, JujuStepHelper):
         except (ApplicationNotFoundException, TimeoutError) as e:
             LOG.warning("Failed to remove hypervisor unit: %r", e)
             return Result(ResultType.FAILED, str(e))
-        try:
-            if self.deployment:
-                remove_hypervisor(self.jhelper, self.deployment, self.node_name)
-        except openstack.exceptions.SDKException as e:
-            LOG.error(
-                "Encountered error removing hypervisor references from control plane"
-            )
-            if self.force:
-                LOG.warning(
-                    "Force mode set, ignoring following exceptions", exc_info=True
+        if not self.deployment:
+            return Result(ResultType.COMPLETED)
+        for name in self.units:
+            try:
+                remove_hypervisor(self.jhelper, self.deployment, name)
+            except openstack.exceptions.SDKException as e:
+                LOG.error(
+                    "Encountered error removing hypervisor %s references from"
+                    " control plane",
+                    name,
                 )
-            else:
-                return Result(ResultType.FAILED, str(e))
+                if self.force:
+                    LOG.warning(
+                        "Force mode set, ignoring following exceptions", exc_info=True
+                    )
+                else:
+                    return Result(ResultType.FAILED, str(e))
 
         return Result(ResultType.COMPLETED)
 
@@ -366,12 +404,6 @@ class ReapplyHypervisorTerraformPlanStep(BaseStep):
 
         return Result(ResultType.SKIPPED)
 
-    @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
-        stop=tenacity.stop_after_delay(300),
-        retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
-        retry_error_callback=convert_retry_failure_as_result,
-    )
     def run(self, context: StepContext) -> Result:
         """Apply terraform configuration to deploy hypervisor."""
         # Refresh model related variables
@@ -411,7 +443,7 @@ class ReapplyHypervisorTerraformPlanStep(BaseStep):
                 override_tfvars=self.extra_tfvars,
                 reporter=context.reporter,
             )
-        except TerraformException as e:
+        except (TerraformException, TerraformStateLockedException) as e:
             return Result(ResultType.FAILED, str(e))
 
         # Wait for more time since parallel node joins will take time
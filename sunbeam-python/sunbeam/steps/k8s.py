@@ -1,9 +1,12 @@
 # SPDX-FileCopyrightText: 2024 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import hashlib
 import ipaddress
+import json
 import logging
 import subprocess
+import threading
 import time
 import typing
 
@@ -127,23 +130,54 @@ class KubeClientError(K8SError):
     pass
 
 
+# Process-wide pool of lightkube clients, keyed by kubeconfig digest and namespace
+_KUBE_CLIENTS: dict[tuple[str, str | None], "l_client.Client"] = {}
+_KUBE_CLIENTS_LOCK = threading.Lock()
+
+
+def clear_kube_clients() -> None:
+    """Forget the lightkube clients pooled by get_kube_client."""
+    with _KUBE_CLIENTS_LOCK:
+        _KUBE_CLIENTS.clear()
+
+
 def get_kube_client(client: Client, namespace: str | None = None) -> "l_client.Client":
+    """Return a lightkube client for the kubeconfig stored in clusterd.
+
+    Clients are pooled for the lifetime of the process so that steps share
+    keep-alive connections to the API server. Once the stored kubeconfig
+    changes, the clients built from the previous one are dropped.
+    """
     try:
         kubeconfig_raw = read_config(client, K8SHelper.get_kubeconfig_key())
     except ConfigItemNotFoundException as e:
         LOG.debug("K8S kubeconfig not found")
         raise KubeClientError("K8S kubeconfig not found") from e
 
-    kubeconfig = l_kubeconfig.KubeConfig.from_dict(kubeconfig_raw)
-    try:
-        return l_client.Client(
-            kubeconfig,
-            namespace,  # type: ignore
-            trust_env=False,
-        )
-    except l_exceptions.ConfigError as e:
-        LOG.debug("Error creating k8s client")
-        raise KubeClientError("Error creating k8s client") from e
+    digest = hashlib.sha256(
+        json.dumps(kubeconfig_raw, sort_keys=True).encode()
+    ).hexdigest()
+    with _KUBE_CLIENTS_LOCK:
+        kube = _KUBE_CLIENTS.get((digest, namespace))
+        if kube is not None:
+            return kube
+
+        kubeconfig = l_kubeconfig.KubeConfig.from_dict(kubeconfig_raw)
+        try:
+            kube = l_client.Client(
+                kubeconfig,
+                namespace,  # type: ignore
+                trust_env=False,
+            )
+        except l_exceptions.ConfigError as e:
+            LOG.debug("Error creating k8s client")
+            raise KubeClientError("Error creating k8s client") from e
+
+        for key in [key for key in _KUBE_CLIENTS if key[0] != digest]:
+            LOG.debug("Kubeconfig changed, dropping k8s client %s", key)
+            del _KUBE_CLIENTS[key]
+        _KUBE_CLIENTS[(digest, namespace)] = kube
+        return kube
 
 
 def load_addons_config(client: Client) -> dict:
@@ -894,6 +928,7 @@ class MigrateK8SKubeconfigStep(BaseStep, _CommonK8SStepMixin):
         name: str,
         jhelper: JujuHelper,
         model: str,
+        removed_nodes: list[str] | None = None,
     ):
         super().__init__(
             "Migrate kubeconfig definition",
@@ -903,6 +938,8 @@ class MigrateK8SKubeconfigStep(BaseStep, _CommonK8SStepMixin):
         self.node = name
         self.jhelper = jhelper
         self.model = model
+        # Nodes removed along with this node, kubeconfig must not move to them
+        self.removed_nodes = {name, *(removed_nodes or [])}
 
     def _get_endpoint_from_kubeconfig(
         self, kubeconfig: "l_kubeconfig.KubeConfig"
@@ -970,10 +1007,15 @@ class MigrateK8SKubeconfigStep(BaseStep, _CommonK8SStepMixin):
                 ResultType.SKIPPED,
                 f"Application {self._SUBSTRATE} has not been deployed yet",
             )
+        removed_machines = {
+            str(node["machineid"])
+            for node in self.client.cluster.list_nodes()
+            if node["name"] in self.removed_nodes
+        }
         other_k8s = None
-        for unit in app.units:
-            if unit != self.unit:
-                other_k8s = unit
+        for unit_name, unit in app.units.items():
+            if unit_name != self.unit and unit.machine not in removed_machines:
+                other_k8s = unit_name
                 break
         if other_k8s is None:
             return Result(
@@ -1008,6 +1050,7 @@ class CheckApplicationK8SDistributionStep(BaseStep, _CommonK8SStepMixin):
         jhelper: JujuHelper,
         model: str,
         force: bool = False,
+        removed_nodes: list[str] | None = None,
     ):
         if not hasattr(self, "_CHARM"):
             raise NotImplementedError("Subclasses must define _CHARM")
@@ -1020,6 +1063,9 @@ class CheckApplicationK8SDistributionStep(BaseStep, _CommonK8SStepMixin):
         self.jhelper = jhelper
         self.model = model
         self.force = force
+        # Nodes removed along with this node, their pods do not count as
+        # remaining units
+        self.removed_nodes = {name, *(removed_nodes or [])}
 
     def _fetch_apps(self) -> list[str]:
         try:
@@ -1063,8 +1109,13 @@ class CheckApplicationK8SDistributionStep(BaseStep, _CommonK8SStepMixin):
             LOG.debug("Node %s has %d %s pods", self.node, nb_pods, app)
             if nb_pods > 0:
                 total_pods = fetch_pods(self.kube, labels=app_label)
-                if nb_pods == len(total_pods):
-                    LOG.debug("All %s pods are on node %s", app, self.node)
+                remaining_pods = [
+                    pod
+                    for pod in total_pods
+                    if pod.spec is None or pod.spec.nodeName not in self.removed_nodes
+                ]
+                if not remaining_pods:
+                    LOG.debug("All %s pods are on nodes %s", app, self.removed_nodes)
                     if not self.force:
                         return Result(
                             ResultType.FAILED,
@@ -196,6 +196,7 @@ class RunWatcherAuditStep(BaseStep):
                 audit=self.audit,
                 client=self.client,
                 status=context.status,
+                reporter=context.reporter,
             )
         except (
             SunbeamException,
@@ -4,8 +4,6 @@
 import logging
 from typing import Any
 
-import tenacity
-
 from sunbeam import versions
 from sunbeam.clusterd.client import Client
 from sunbeam.clusterd.service import (
@@ -17,7 +15,6 @@ from sunbeam.core.common import (
     Result,
     ResultType,
     StepContext,
-    convert_retry_failure_as_result,
 )
 from sunbeam.core.deployment import Deployment, Networks
 from sunbeam.core.juju import (
@@ -217,12 +214,6 @@ class DeployMicroOVNApplicationStep(DeployMachineApplicationStep):
         machines_by_arch = self.ovn_manager.get_machines_by_architecture()
         return _microovn_applications_to_wait(machines_by_arch)
 
-    @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
-        stop=tenacity.stop_after_delay(300),
-        retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
-        retry_error_callback=convert_retry_failure_as_result,
-    )
     def run(self, context: StepContext) -> Result:
         """Apply terraform and wait for MicroOVN applications."""
         try:
@@ -237,7 +228,7 @@ class DeployMicroOVNApplicationStep(DeployMachineApplicationStep):
                 tf_apply_extra_args=self.tf_apply_extra_args(),
                 reporter=context.reporter,
             )
-        except TerraformException as e:
+        except (TerraformException, TerraformStateLockedException) as e:
             return Result(ResultType.FAILED, str(e))
 
         if not self.wait_for_readiness:
@@ -319,12 +310,6 @@ class ReapplyMicroOVNTerraformPlanStep(BaseStep):
 
         return Result(ResultType.SKIPPED)
 
-    @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
-        stop=tenacity.stop_after_delay(300),
-        retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
-        retry_error_callback=convert_retry_failure_as_result,
-    )
     def run(self, context: StepContext) -> Result:
         """Apply terraform configuration to deploy MicroOVN."""
         # Apply Network configs everytime reapply is called
@@ -350,7 +335,7 @@ class ReapplyMicroOVNTerraformPlanStep(BaseStep):
                 override_tfvars=self.extra_tfvars,
                 reporter=context.reporter,
             )
-        except TerraformException as e:
+        except (TerraformException, TerraformStateLockedException) as e:
             return Result(ResultType.FAILED, str(e))
 
         machines_by_arch = self.ovn_manager.get_machines_by_architecture()
@@ -8,7 +8,6 @@ import math
 import queue
 import typing
 
-import tenacity
 from rich.console import Console
 
 import sunbeam.steps.microceph as microceph
@@ -22,7 +21,6 @@ from sunbeam.core.common import (
     StepContext,
     SunbeamException,
     convert_proxy_to_model_configs,
-    convert_retry_failure_as_result,
     get_host_total_cores,
     get_host_total_ram,
     read_config,
@@ -713,12 +711,6 @@ class DeployControlPlaneStep(BaseStep, JujuStepHelper):
 
         return Result(ResultType.COMPLETED)
 
-    @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
-        stop=tenacity.stop_after_delay(300),
-        retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
-        retry_error_callback=convert_retry_failure_as_result,
-    )
     def run(self, context: StepContext) -> Result:
         """Execute configuration using terraform."""
         # TODO(jamespage):
@@ -820,7 +812,7 @@ class DeployControlPlaneStep(BaseStep, JujuStepHelper):
                 override_tfvars=extra_tfvars,
                 reporter=context.reporter,
             )
-        except TerraformException as e:
+        except (TerraformException, TerraformStateLockedException) as e:
             LOG.warning("Error configuring cloud: %r", e)
             return Result(ResultType.FAILED, str(e))
 
@@ -977,7 +969,7 @@ class ReapplyOpenStackTerraformPlanStep(BaseStep, JujuStepHelper):
                 override_tfvars=override_tfvars,
                 reporter=context.reporter,
             )
-        except TerraformException as e:
+        except (TerraformException, TerraformStateLockedException) as e:
             LOG.warning("Error reconfiguring cloud: %r", e)
             return Result(ResultType.FAILED, str(e))
 
@@ -1086,7 +1078,7 @@ class UpdateOpenStackModelConfigStep(BaseStep):
                 reporter=context.reporter,
             )
             return Result(ResultType.COMPLETED)
-        except TerraformException as e:
+        except (TerraformException, TerraformStateLockedException) as e:
             LOG.warning("Error updating modelconfigs for OpenStack plan: %r", e)
             return Result(ResultType.FAILED, str(e))
 
@@ -6,15 +6,12 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import tenacity
-
 from sunbeam.clusterd.client import Client
 from sunbeam.core.common import (
     BaseStep,
     Result,
     ResultType,
     StepContext,
-    convert_retry_failure_as_result,
 )
 from sunbeam.core.deployment import Deployment
 from sunbeam.core.juju import JujuHelper
@@ -169,12 +166,6 @@ class ReapplyRoleDistributorApplicationStep(BaseStep):
         self.manifest = manifest
         self.model = model
 
-    @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
-        stop=tenacity.stop_after_delay(300),
-        retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
-        retry_error_callback=convert_retry_failure_as_result,
-    )
     def run(self, context: StepContext) -> Result:
         """Apply Terraform configuration for role-distributor."""
         microovn_machine_ids = _microovn_machine_ids(self.deployment)
@@ -202,7 +193,7 @@ class ReapplyRoleDistributorApplicationStep(BaseStep):
                 override_tfvars=extra_tfvars,
                 reporter=context.reporter,
             )
-        except TerraformException as e:
+        except (TerraformException, TerraformStateLockedException) as e:
             return Result(ResultType.FAILED, str(e))
 
         try:
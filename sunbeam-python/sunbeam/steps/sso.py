@@ -40,6 +40,7 @@ from sunbeam.core.openstack import OPENSTACK_MODEL
 from sunbeam.core.terraform import (
     TerraformException,
     TerraformHelper,
+    TerraformStateLockedException,
 )
 from sunbeam.features.interface.utils import cert_and_key_match
 from sunbeam.steps.openstack import CONFIG_KEY
@@ -347,8 +348,8 @@ class RemoveExternalProviderStep(BaseStep, JujuStepHelper):
         update_config(self.client, SSO_CONFIG_KEY, cfg)
 
         try:
-            self.tfhelper.apply(reporter=context.reporter)
-        except TerraformException as e:
+            self.tfhelper.apply_waiting_for_lock(self.client, reporter=context.reporter)
+        except (TerraformException, TerraformStateLockedException) as e:
             return Result(ResultType.FAILED, str(e))
 
         try:
@@ -490,8 +491,8 @@ class UpdateExternalProviderStep(BaseStep, JujuStepHelper):
         self.tfhelper.write_tfvars(tfvars)
         update_config(self.client, CONFIG_KEY, tfvars)
         try:
-            self.tfhelper.apply(reporter=context.reporter)
-        except TerraformException as e:
+            self.tfhelper.apply_waiting_for_lock(self.client, reporter=context.reporter)
+        except (TerraformException, TerraformStateLockedException) as e:
             return Result(ResultType.FAILED, str(e))
 
         charm_name = f"keystone-idp-{self._proto}-{self._provider_name}"
@@ -749,8 +750,8 @@ class _BaseExternalProviderStep(_BaseProviderStep):
 
         self.tfhelper.write_tfvars(tfvars)
         try:
-            self.tfhelper.apply(reporter=context.reporter)
-        except TerraformException as e:
+            self.tfhelper.apply_waiting_for_lock(self.client, reporter=context.reporter)
+        except (TerraformException, TerraformStateLockedException) as e:
             return Result(ResultType.FAILED, f"Failed to apply terraform plan {e}")
 
         update_config(self.client, SSO_CONFIG_KEY, cfg)
@@ -1281,8 +1282,8 @@ class DeployIdentityProvidersStep(BaseStep, JujuStepHelper):
         update_config(self.client, CONFIG_KEY, tfvars)
 
         try:
-            self.tfhelper.apply(reporter=context.reporter)
-        except TerraformException as e:
+            self.tfhelper.apply_waiting_for_lock(self.client, reporter=context.reporter)
+        except (TerraformException, TerraformStateLockedException) as e:
             return Result(ResultType.FAILED, str(e))
 
         app_queue: queue.Queue[str] = queue.Queue()
@@ -1492,8 +1493,8 @@ class SetKeystoneSAMLCertAndKeyStep(BaseStep, JujuStepHelper):
         update_config(self.client, CONFIG_KEY, tfvars)
         self.tfhelper.write_tfvars(tfvars)
         try:
-            self.tfhelper.apply(reporter=context.reporter)
-        except TerraformException as e:
+            self.tfhelper.apply_waiting_for_lock(self.client, reporter=context.reporter)
+        except (TerraformException, TerraformStateLockedException) as e:
             return Result(ResultType.FAILED, str(e))
 
         try:
@@ -1,17 +1,25 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import hashlib
+import json
 import logging
 import queue
+from concurrent.futures import ThreadPoolExecutor
 
 from rich.console import Console
+from snaphelpers import Snap
 
 from sunbeam.clusterd.client import Client
+from sunbeam.clusterd.service import ConfigItemNotFoundException
 from sunbeam.core.common import (
     BaseStep,
     Result,
     ResultType,
     StepContext,
+    delete_config,
+    read_config,
+    update_config,
     update_status_background,
 )
 from sunbeam.core.deployment import Deployment, Networks
@@ -80,12 +88,120 @@ SNAP_APPS_INFRA_MODEL: list[str] = [
     "sunbeam-clusterd",
 ]
 
+# Charms refreshed, and waited for, before the rest of their model.
+# Each group only starts once the previous one has settled, charms not
+# listed are refreshed in a last group.
+REFRESH_GROUPS: list[set[str]] = [
+    # Database and messaging, everything else depends on them
+    {"mysql-router-k8s", "rabbitmq-k8s"},
+    # API services other services talk to
+    {
+        "keystone-k8s",
+        "glance-k8s",
+        "placement-k8s",
+        "nova-k8s",
+        "neutron-k8s",
+        "cinder-k8s",
+    },
+]
+REFRESH_CONCURRENCY = 8
+REFRESH_PROGRESS_KEY = "IntraChannelRefreshProgress"
+
+
+def group_apps_for_refresh(apps: dict) -> list[list[str]]:
+    """Split apps into the ordered groups they are refreshed in."""
+    groups: list[list[str]] = [[] for _ in range(len(REFRESH_GROUPS) + 1)]
+    for app_name, (charm, _, _) in apps.items():
+        index = next(
+            (i for i, group in enumerate(REFRESH_GROUPS) if charm in group),
+            len(REFRESH_GROUPS),
+        )
+        groups[index].append(app_name)
+    return [group for group in groups if group]
+
+
+def refresh_progress_key(manifest: Manifest) -> str:
+    """Key of the charm refreshes an in channel upgrade performs.
+
+    Made of the snap revision and the charm channels and revisions of the
+    manifest, progress recorded under another key belongs to an upgrade
+    towards other charms and must not be resumed.
+    """
+    charms = {
+        name: [charm.channel, charm.revision]
+        for name, charm in manifest.core.software.charms.items()
+    }
+    for _, feature in manifest.get_features():
+        for name, charm in feature.software.charms.items():
+            charms.setdefault(name, [charm.channel, charm.revision])
+    digest = hashlib.sha256(json.dumps(charms, sort_keys=True).encode())
+    return f"{Snap().revision}:{digest.hexdigest()}"
+
+
+class RefreshProgress:
+    """Apps already refreshed by an interrupted in channel upgrade.
+
+    The record is kept in clusterd so that re-running the upgrade after a
+    failure does not refresh and wait for the same apps again. It is only
+    resumed by an upgrade with the same key, see refresh_progress_key.
+    """
+
+    def __init__(self, client: Client, key: str):
+        self.client = client
+        self.key = key
+        self.refreshed: dict[str, list[str]] = {}
+
+    def load(self) -> None:
+        """Load the progress of the previous attempt."""
+        try:
+            record = read_config(self.client, REFRESH_PROGRESS_KEY)
+        except ConfigItemNotFoundException:
+            record = {}
+        if record and record.get("key") != self.key:
+            LOG.debug(
+                "Discarding in channel upgrade progress recorded for %s",
+                record.get("key"),
+            )
+            record = {}
+        self.refreshed = record.get("refreshed", {})
+        if self.refreshed:
+            LOG.debug("Resuming in channel upgrade from %s", self.refreshed)
+
+    def is_refreshed(self, model: str, app_name: str) -> bool:
+        """Whether app was refreshed by a previous attempt."""
+        return app_name in self.refreshed.get(model, [])
+
+    def record(self, model: str, apps: list[str]) -> None:
+        """Record apps as refreshed and settled."""
+        refreshed = self.refreshed.setdefault(model, [])
+        refreshed.extend(app for app in apps if app not in refreshed)
+        update_config(
+            self.client,
+            REFRESH_PROGRESS_KEY,
+            {"key": self.key, "refreshed": self.refreshed},
+        )
+
+    def clear(self) -> None:
+        """Forget the progress once the upgrade completed."""
+        try:
+            delete_config(self.client, REFRESH_PROGRESS_KEY)
+        except ConfigItemNotFoundException:
+            pass
+        self.refreshed = {}
+
 
 class LatestInChannel(BaseStep, JujuStepHelper):
-    def __init__(self, deployment: Deployment, jhelper: JujuHelper, manifest: Manifest):
+    def __init__(
+        self,
+        deployment: Deployment,
+        jhelper: JujuHelper,
+        manifest: Manifest,
+        concurrency: int = REFRESH_CONCURRENCY,
+    ):
         """Upgrade all charms to latest in current channel.
 
         :jhelper: Helper for interacting with pylibjuju
+        :concurrency: Maximum number of charm refreshes issued at once
         """
         super().__init__(
             "In channel upgrade", "Upgrade charms to latest revision in current channel"
@@ -93,6 +209,8 @@ class LatestInChannel(BaseStep, JujuStepHelper):
         self.deployment = deployment
         self.jhelper = jhelper
         self.manifest = manifest
+        self.concurrency = concurrency
+        self._progress: RefreshProgress | None = None
 
     def is_skip(self, context: StepContext) -> Result:
         """Step can be skipped if nothing needs refreshing."""
@@ -206,6 +324,9 @@ class LatestInChannel(BaseStep, JujuStepHelper):
         If there is no manifest charm entry, refresh the charm to latest revision.
         If manifest charm exists, refresh using channel and revision from manifest.
 
+        Apps are refreshed concurrently, group by group (see REFRESH_GROUPS),
+        each group being waited for before the next one is refreshed.
+
         After the refresh the wait accepts the app's pre-refresh workload status
         OR active.  This avoids false timeouts for apps that were in a
         non-active state (e.g. waiting, blocked) before the refresh was issued.
@@ -221,32 +342,64 @@ class LatestInChannel(BaseStep, JujuStepHelper):
             LOG.debug("Could not fetch pre-refresh status", exc_info=True)
         LOG.debug("Pre-refresh workload status in %s: %s", model, pre_refresh_status)
 
-        refreshed_apps = []
-        for app_name, (charm, channel, _) in apps.items():
+        pending = {
+            app_name: app
+            for app_name, app in apps.items()
             # Skip infra apps, they are refreshed via `sunbeam cluster refresh <app>`
-            if charm in INFRA_APPS:
-                continue
-            manifest_charm = self.manifest.find_charm(charm)
-            trust = charm in CHARMS_REQUIRING_TRUST
-
-            if not manifest_charm:
-                LOG.debug("Running refresh for app %s (no manifest entry)", app_name)
-                self.jhelper.charm_refresh(app_name, model, trust=trust)
-                refreshed_apps.append(app_name)
-            else:
-                LOG.debug("Running refresh for app %s with manifest config", app_name)
-                self.jhelper.charm_refresh(
-                    app_name,
-                    model,
-                    channel=manifest_charm.channel,
-                    revision=manifest_charm.revision,
-                    trust=trust,
+            if app[0] not in INFRA_APPS
+            and not (self._progress and self._progress.is_refreshed(model, app_name))
+        }
+        for group in group_apps_for_refresh(pending):
+            if context is not None:
+                self.update_status(
+                    context, f"refreshing {len(group)} applications in {model}"
                 )
-                refreshed_apps.append(app_name)
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.concurrency, len(group)))
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._refresh_app,
+                        self.jhelper.for_worker(),
+                        app_name,
+                        pending[app_name][0],
+                        model,
+                    )
+                    for app_name in group
+                ]
+                for future in futures:
+                    future.result()
 
-        return self._wait_after_refresh(
-            refreshed_apps, model, pre_refresh_status, context
-        )
+            result = self._wait_after_refresh(group, model, pre_refresh_status, context)
+            if result.result_type == ResultType.FAILED:
+                return result
+            if self._progress:
+                self._progress.record(model, group)
+
+        return Result(ResultType.COMPLETED)
+
+    def _refresh_app(
+        self, jhelper: JujuHelper, app_name: str, charm: str, model: str
+    ) -> None:
+        """Refresh app, to the manifest channel and revision if any.
+
+        Runs in a worker thread, jhelper is the worker's own helper.
+        """
+        manifest_charm = self.manifest.find_charm(charm)
+        trust = charm in CHARMS_REQUIRING_TRUST
+
+        if not manifest_charm:
+            LOG.debug("Running refresh for app %s (no manifest entry)", app_name)
+            jhelper.charm_refresh(app_name, model, trust=trust)
+        else:
+            LOG.debug("Running refresh for app %s with manifest config", app_name)
+            jhelper.charm_refresh(
+                app_name,
+                model,
+                channel=manifest_charm.channel,
+                revision=manifest_charm.revision,
+                trust=trust,
+            )
 
     def run(self, context: StepContext) -> Result:
         """Refresh all charms identified as needing a refresh.
@@ -277,6 +430,11 @@ class LatestInChannel(BaseStep, JujuStepHelper):
             )
             return Result(ResultType.FAILED, error_msg)
 
+        self._progress = RefreshProgress(
+            self.deployment.get_client(), refresh_progress_key(self.manifest)
+        )
+        self._progress.load()
+
         if is_maas_deployment(self.deployment):
             result = self.refresh_apps(
                 deployed_infra_apps, self.deployment.infra_model, context
@@ -294,6 +452,7 @@ class LatestInChannel(BaseStep, JujuStepHelper):
         if result.result_type == ResultType.FAILED:
             return result
 
+        self._progress.clear()
         return Result(ResultType.COMPLETED)
 
 
@@ -34,6 +34,7 @@ from sunbeam.storage.cli_base import StorageBackendCLIBase
 from sunbeam.storage.models import (
     SecretDictField,
 )
+from sunbeam.storage.registry import ENABLED_BACKENDS_CONFIG_KEY
 from sunbeam.storage.steps import (
     BaseStorageBackendDeployStep,
     BaseStorageBackendDestroyStep,
@@ -96,7 +97,6 @@ def validate_juju_application_name(name: str) -> bool:
 
 
 BackendConfig = typing.TypeVar("BackendConfig", bound=StorageBackendConfig)
-ENABLED_BACKENDS_CONFIG_KEY = "StorageBackendsEnabled"
 
 
 class StorageBackendBase(FeatureGateMixin, typing.Generic[BackendConfig]):
@@ -260,9 +260,7 @@ class StorageBackendBase(FeatureGateMixin, typing.Generic[BackendConfig]):
 
     def register_terraform_plan(self, deployment: Deployment) -> None:
         """Register storage backend Terraform plan with deployment system."""
-        import shutil
-
-        from sunbeam.core.terraform import TerraformHelper
+        from sunbeam.core.terraform import TerraformHelper, sync_plan_directory
 
         # Get the plan source path
         backend_self_contained = (
@@ -279,7 +277,7 @@ class StorageBackendBase(FeatureGateMixin, typing.Generic[BackendConfig]):
 
         # Copy plan to deployment's plans directory
         dst = deployment.plans_directory / self.tfplan_dir
-        shutil.copytree(plan_source, dst, dirs_exist_ok=True)
+        source_hash = sync_plan_directory(plan_source, dst)
 
         # Create TerraformHelper
         env = {}
@@ -293,6 +291,7 @@ class StorageBackendBase(FeatureGateMixin, typing.Generic[BackendConfig]):
             backend="http",
             env=env,
             clusterd_address=deployment.get_clusterd_http_address(),
+            source_hash=source_hash,
         )
 
         # Register the helper with the deployment's tfhelpers
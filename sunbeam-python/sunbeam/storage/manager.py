@@ -1,11 +1,9 @@
 # SPDX-FileCopyrightText: 2025 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
-import importlib
 import logging
-import pathlib
 import typing
-from typing import Dict
+from typing import Callable, Dict
 
 import click
 from rich.console import Console
@@ -18,15 +16,68 @@ from sunbeam.core.manifest import StorageInstanceManifest
 from sunbeam.errors import SunbeamException
 from sunbeam.storage.base import StorageBackendBase
 from sunbeam.storage.models import BackendNotFoundException, StorageBackendInfo
+from sunbeam.storage.registry import BACKENDS, BackendEntry
 from sunbeam.storage.service import StorageBackendService
 
 LOG = logging.getLogger(__name__)
 console = Console()
 
-# Global registry for storage backends
+# Global registry for the loaded storage backends
 _STORAGE_BACKENDS: Dict[str, StorageBackendBase] = {}
 
 
+class LazyBackendGroup(click.Group):
+    """Click group with a subcommand per backend, built on first use.
+
+    Only the backend of the invoked subcommand is imported, the help of the
+    group is rendered from the backend index.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        register: Callable[[str, click.Group], None],
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(name, **kwargs)
+        self._register = register
+        self._lazy: dict[str, str] = {}
+
+    def add_lazy_command(self, name: str, short_help: str) -> None:
+        """Declare a backend subcommand, registered when first looked up."""
+        self._lazy[name] = short_help
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List both registered and declared subcommands."""
+        return sorted(set(self.commands) | set(self._lazy))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return the subcommand, registering its backend if needed."""
+        if cmd_name not in self.commands and cmd_name in self._lazy:
+            del self._lazy[cmd_name]
+            self._register(cmd_name, self)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """Write the subcommands without importing the declared backends."""
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            if name in self.commands:
+                if self.commands[name].hidden:
+                    continue
+                rows.append((name, self.commands[name].get_short_help_str(limit)))
+            else:
+                rows.append((name, self._lazy[name]))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
 @click.group("storage", context_settings={"help_option_names": ["-h", "--help"]})
 @click.pass_context
 def storage(ctx):
@@ -43,86 +94,68 @@ def storage(ctx):
         )
 
 
-class StorageBackendManager:
-    """Registry for managing storage backends."""
+class _LoadedBackends(typing.Mapping[str, StorageBackendBase]):
+    """Mapping of the known backends, importing each one on first access."""
 
-    _backends: dict[str, StorageBackendBase] = _STORAGE_BACKENDS
-    _loaded: bool = False
-
-    def __init__(self) -> None:
-        if not self._backends:
-            self._load_backends()
+    def __init__(self, manager: "StorageBackendManager") -> None:
+        self._manager = manager
 
-    def _load_backends(self) -> None:
-        """Load all storage backends from the storage/backends directory."""
-        if self._loaded:
-            return
+    def __getitem__(self, name: str) -> StorageBackendBase:
+        """Return the backend, loading it if needed."""
+        try:
+            return self._manager.get_backend(name)
+        except ValueError:
+            raise KeyError(name) from None
 
-        LOG.debug("Loading storage backends")
-        import sunbeam.storage.backends
+    def __iter__(self) -> typing.Iterator[str]:
+        """Iterate over the backend types, without loading them."""
+        return iter(self._manager.entries())
 
-        sunbeam_storage_backends = pathlib.Path(
-            sunbeam.storage.backends.__file__
-        ).parent
+    def __len__(self) -> int:
+        """Return the number of known backends."""
+        return len(self._manager.entries())
 
-        for path in sunbeam_storage_backends.iterdir():
-            # Skip non-directories and special files
-            if not path.is_dir() or path.name.startswith("_") or path.name == "etc":
-                continue
 
-            backend_name = path.name
-            backend_module_path = path / "backend.py"
-
-            # Check if the backend.py file exists in the backend directory
-            if not backend_module_path.exists():
-                LOG.debug("Skipping %s: no backend.py file found", backend_name)
-                continue
+class StorageBackendManager:
+    """Registry for managing storage backends.
 
-            try:
-                LOG.debug("Loading storage backend: %s", backend_name)
-                # Import the backend module from the backend subdirectory
-                mod = importlib.import_module(
-                    f"sunbeam.storage.backends.{backend_name}.backend"
-                )
+    Backends are enumerated from the static index in sunbeam.storage.registry
+    and their modules are imported only when a backend is used.
+    """
 
-                # Look for backend classes
-                for attr_name in dir(mod):
-                    attr = getattr(mod, attr_name)
-                    if (
-                        isinstance(attr, type)
-                        and issubclass(attr, StorageBackendBase)
-                        and attr != StorageBackendBase
-                    ):
-                        backend_instance = attr()
-                        self._backends[backend_instance.backend_type] = backend_instance
-                        LOG.debug(
-                            "Registered storage backend: %s",
-                            backend_instance.backend_type,
-                        )
+    _backends: dict[str, StorageBackendBase] = _STORAGE_BACKENDS
+    _index: dict[str, BackendEntry] = {entry.backend_type: entry for entry in BACKENDS}
 
-            except Exception as e:
-                LOG.debug("Failed to load storage backend", exc_info=True)
-                LOG.warning("Failed to load storage backend %s: %r", backend_name, e)
+    def entries(self) -> dict[str, BackendEntry | StorageBackendBase]:
+        """Return the known backends, without loading them.
 
-        self._loaded = True
+        Backends not loaded yet are represented by their index entry, both
+        provide backend_type, display_name, generally_available, gate_key
+        and check_enabled.
+        """
+        return {**self._index, **self._backends}
 
     def get_backend(self, name: str) -> StorageBackendBase:
-        """Get a storage backend by name."""
-        self._load_backends()
-        if name not in self._backends:
+        """Get a storage backend by name, importing it if needed."""
+        if backend := self._backends.get(name):
+            return backend
+        if name not in self._index:
             raise ValueError(f"Storage backend '{name}' not found")
-        return self._backends[name]
+        LOG.debug("Loading storage backend: %s", name)
+        backend = self._index[name].load()
+        self._backends[name] = backend
+        return backend
 
     def backends(self) -> typing.Mapping[str, StorageBackendBase]:
-        """Get all available storage backends."""
-        return self._backends
+        """Get all available storage backends, loaded on access."""
+        return _LoadedBackends(self)
 
     def get_all_storage_manifests(
         self,
     ) -> dict[str, dict[str, StorageInstanceManifest]]:
         """Return a dict of all feature manifest defaults."""
         manifests: dict[str, dict[str, StorageInstanceManifest]] = {}
-        for name in self.backends():
+        for name in self.entries():
             manifests[name] = {}
 
         return manifests
@@ -141,7 +174,7 @@ class StorageBackendManager:
             LOG.error("Failed to register storage backend commands: %r", e)
             raise e
 
-    def register_cli_commands(  # noqa: C901
+    def register_cli_commands(
         self, storage_group: click.Group, deployment: Deployment
     ) -> None:
         """Register all backend commands with the storage CLI group.
@@ -157,18 +190,21 @@ class StorageBackendManager:
           sunbeam storage config reset <backend> <name> key ...
           sunbeam storage config options <backend> [name]
         """
-        self._load_backends()
-
-        # Top-level subgroups
-        @click.group(name="add")
-        def add_group():
-            """Add a storage backend."""
-            pass
-
-        @click.group(name="options")
-        def options_group():
-            """Show storage backend configuration options."""
-            pass
+        # Top-level subgroups, backend subcommands are registered when invoked
+        add_group = LazyBackendGroup(
+            "add",
+            lambda name, group: self._register_backend_cli(
+                name, lambda backend: backend.register_add_cli(group)
+            ),
+            help="Add a storage backend.",
+        )
+        options_group = LazyBackendGroup(
+            "options",
+            lambda name, group: self._register_backend_cli(
+                name, lambda backend: backend.register_options_cli(group)
+            ),
+            help="Show storage backend configuration options.",
+        )
 
         @click.command(name="list")
         @click.pass_context
@@ -255,24 +291,20 @@ class StorageBackendManager:
             # Might be called before bootstrap
             LOG.debug("Could not get client for deployment", exc_info=True)
             client = None
-        for backend in self._backends.values():
+        for backend_type, backend in self.entries().items():
             if not backend.check_enabled(client, snap):
                 LOG.debug(
                     "Not registering backend %r, it is not enabled",
-                    backend.backend_type,
+                    backend_type,
                 )
                 continue
-            try:
-                backend.register_add_cli(add_group)
-                backend.register_options_cli(options_group)
-            except Exception as e:
-                backend_name = getattr(backend, "name", "unknown")
-                LOG.warning(
-                    "Backend %s failed to register CLI: %r",
-                    backend_name,
-                    e,
-                )
-                raise
+            add_group.add_lazy_command(
+                backend_type, f"Add {backend.display_name} backend."
+            )
+            options_group.add_lazy_command(
+                backend_type,
+                f"Show configuration options for all {backend.display_name} backends.",
+            )
 
         # Mount groups under storage
         storage_group.add_command(list_all)
@@ -281,6 +313,17 @@ class StorageBackendManager:
         storage_group.add_command(options_group)
         storage_group.add_command(remove_backend)
 
+    def _register_backend_cli(
+        self, name: str, register: Callable[[StorageBackendBase], None]
+    ) -> None:
+        """Load a backend and register its commands."""
+        backend = self.get_backend(name)
+        try:
+            register(backend)
+        except Exception as e:
+            LOG.warning("Backend %s failed to register CLI: %r", name, e)
+            raise
+
     def _display_backends_table(self, backends: list[StorageBackendInfo]) -> None:
         """Display backends in a formatted table."""
         if not backends:
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+"""Static index of the storage backends.
+
+The index lets the CLI enumerate and gate the storage backends without
+importing their modules, a backend module is only imported when the backend is
+selected. Add an entry here when adding a backend under storage/backends.
+"""
+
+import dataclasses
+import importlib
+import typing
+
+from snaphelpers import Snap
+
+from sunbeam.clusterd.client import Client
+from sunbeam.feature_gates import FeatureGateMixin
+
+if typing.TYPE_CHECKING:
+    from sunbeam.storage.base import StorageBackendBase
+
+ENABLED_BACKENDS_CONFIG_KEY = "StorageBackendsEnabled"
+
+
+@dataclasses.dataclass(frozen=True)
+class BackendEntry(FeatureGateMixin):
+    """Metadata of a storage backend, available without importing it."""
+
+    backend_type: str
+    class_name: str
+    display_name: str
+    generally_available: bool = False
+
+    @property
+    def module(self) -> str:
+        """Module implementing the backend."""
+        return f"sunbeam.storage.backends.{self.backend_type}.backend"
+
+    def check_enabled(self, client: Client | None, snap: Snap) -> bool:
+        """Check if the backend is enabled, see StorageBackendBase.check_enabled."""
+        return not self.check_gated(
+            client=client, snap=snap, enabled_config_key=ENABLED_BACKENDS_CONFIG_KEY
+        )
+
+    def load(self) -> "StorageBackendBase":
+        """Import the backend module and return an instance of the backend."""
+        mod = importlib.import_module(self.module)
+        return getattr(mod, self.class_name)()
+
+
+BACKENDS: tuple[BackendEntry, ...] = (
+    BackendEntry("datacore", "DatacoreBackend", "DataCore"),
+    BackendEntry("datera", "DateraBackend", "Datera"),
+    BackendEntry("dellpowermax", "DellpowermaxBackend", "Dell PowerMax"),
+    BackendEntry("dellpowerstore", "DellPowerstoreBackend", "Dell PowerStore"),
+    BackendEntry("dellpowervault", "DellPowerVaultBackend", "Dell PowerVault"),
+    BackendEntry("dellsc", "DellSCBackend", "Dell Storage Center"),
+    BackendEntry("dellunity", "DellunityBackend", "Dell Unity"),
+    BackendEntry("fujitsueternusdx", "FujitsueternusdxBackend", "FJDX FC"),
+    BackendEntry("hitachi", "HitachiBackend", "Hitachi VSP Storage"),
+    BackendEntry("hpe3par", "HPEthreeparBackend", "HPE 3Par"),
+    BackendEntry("hpexp", "HpexpBackend", "HPE XP"),
+    BackendEntry("huawei", "HuaweiBackend", "Huawei OceanStor Dorado"),
+    BackendEntry(
+        "ibmflashsystemcommon", "IbmflashsystemcommonBackend", "IBM FlashSystem Common"
+    ),
+    BackendEntry(
+        "ibmflashsystemiscsi", "IbmflashsystemiscsiBackend", "FlashSystem iSCSI"
+    ),
+    BackendEntry("ibmgpfs", "IbmgpfsBackend", "GPFS"),
+    BackendEntry("ibmibmstorage", "IbmibmstorageBackend", "IBMStorage"),
+    BackendEntry("ibmstorwizesvc", "IbmstorwizesvcBackend", "IBM Storwize SVC"),
+    BackendEntry("infinidat", "InfinidatBackend", "Infinidat"),
+    BackendEntry("inspuras13000", "Inspuras13000Backend", "AS13000"),
+    BackendEntry("inspurinstorage", "InspurinstorageBackend", "InStorageMCS"),
+    BackendEntry("kaminario", "KaminarioBackend", "Kaminario iSCSI"),
+    BackendEntry("linstor", "LinstorBackend", "LINSTOR iSCSI"),
+    BackendEntry("macrosan", "MacrosanBackend", "MacroSAN"),
+    BackendEntry("necv", "NecvBackend", "VStorage"),
+    BackendEntry("netapp", "NetAppBackend", "NetApp ONTAP"),
+    BackendEntry("nexenta", "NexentaBackend", "Nexenta iSCSI"),
+    BackendEntry("nimble", "NimbleBackend", "HPE Nimble Storage"),
+    BackendEntry("opene", "OpeneBackend", "Jovian iSCSI"),
+    BackendEntry("prophetstor", "ProphetStorBackend", "ProphetStor FC"),
+    BackendEntry(
+        "purestorage",
+        "PureStorageBackend",
+        "Pure Storage FlashArray",
+        generally_available=True,
+    ),
+    BackendEntry("qnap", "QnapBackend", "QNAP Storage"),
+    BackendEntry("sandstone", "SandstoneBackend", "Sds iSCSI"),
+    BackendEntry("solidfire", "SolidFireBackend", "NetApp SolidFire"),
+    BackendEntry("stx", "StxBackend", "Stx"),
+    BackendEntry("synology", "SynologyBackend", "Synology iSCSI"),
+    BackendEntry("toyouacs5000", "Toyouacs5000Backend", "Acs5000 FC/iSCSI"),
+    BackendEntry("veritasaccess", "VeritasAccessBackend", "Veritas Access"),
+    BackendEntry("yadro", "YadroBackend", "Tatlin FCVolume"),
+    BackendEntry("zadara", "ZadaraBackend", "ZadaraVPSA iSCSI"),
+)
@@ -12,7 +12,6 @@ import logging
 from typing import TYPE_CHECKING, Any, Callable
 
 import pydantic
-import tenacity
 from rich.console import Console
 
 from sunbeam.clusterd.client import Client
@@ -26,7 +25,6 @@ from sunbeam.core.common import (
     ResultType,
     Role,
     StepContext,
-    friendly_terraform_lock_retry_callback,
     read_config,
     update_config,
 )
@@ -382,16 +380,6 @@ class BaseStorageBackendDeployStep(BaseStep):
         """
         return True
 
-    @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
-        stop=tenacity.stop_after_delay(300),
-        retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
-        retry_error_callback=friendly_terraform_lock_retry_callback,
-        before_sleep=lambda retry_state: console.print(
-            f"Terraform state locked, retrying in 60 seconds... "
-            f"(attempt {retry_state.attempt_number}/5)"
-        ),
-    )
     def run(self, context: StepContext) -> Result:
         """Deploy the storage backend using Terraform."""
         # Ensure fresh Juju credentials and Terraform env before applying
@@ -434,9 +422,6 @@ class BaseStorageBackendDeployStep(BaseStep):
                 override_tfvars=tfvars,
                 reporter=context.reporter,
             )
-        except TerraformStateLockedException as e:
-            # Bubble up to trigger retry
-            raise e
         except Exception as e:
             LOG.error(
                 "Failed to deploy %s backend %s: %r",
@@ -525,16 +510,6 @@ class BaseStorageBackendDestroyStep(BaseStep):
         self.backend_instance = backend_instance
         self.model = model
 
-    @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
-        stop=tenacity.stop_after_delay(300),
-        retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
-        retry_error_callback=friendly_terraform_lock_retry_callback,
-        before_sleep=lambda retry_state: console.print(
-            f"Terraform state locked, retrying in 60 seconds... "
-            f"(attempt {retry_state.attempt_number}/5)"
-        ),
-    )
     def run(self, context: StepContext) -> Result:
         """Run the destroy step atomically.
 
@@ -588,9 +563,8 @@ class BaseStorageBackendDestroyStep(BaseStep):
                 reporter=context.reporter,
             )
         except TerraformStateLockedException as e:
-            # Bubble up to trigger retry
-            LOG.debug("Terraform state locked")
-            raise e
+            LOG.debug("Terraform state still locked", exc_info=True)
+            return Result(ResultType.FAILED, str(e))
         except TerraformException:
             # Restore the backend configuration if apply fails
             LOG.debug("Terraform apply failed", exc_info=True)
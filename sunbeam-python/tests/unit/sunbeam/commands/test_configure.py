@@ -100,6 +100,23 @@ class TestRetrieveAdminCredentials:
         creds = configure.retrieve_admin_credentials(helper, deployment, "openstack")
         assert creds["OS_REGION_NAME"] == deployment.get_region_name()
 
+    def test_retrieve_admin_credentials_cached(self, deployment: Deployment):
+        helper = Mock()
+        helper.get_leader_unit.return_value = "keystone/0"
+        helper.run_action.side_effect = lambda unit, model, action: (
+            {"username": "admin"} if action == "get-admin-account" else {}
+        )
+
+        creds = configure.retrieve_admin_credentials(helper, deployment, "openstack")
+        creds["OS_USERNAME"] = "modified"
+        creds = configure.retrieve_admin_credentials(helper, deployment, "openstack")
+        assert creds["OS_USERNAME"] == "admin"
+        assert helper.run_action.call_count == 2
+
+        configure.clear_admin_credentials(deployment, "openstack")
+        configure.retrieve_admin_credentials(helper, deployment, "openstack")
+        assert helper.run_action.call_count == 4
+
 
 class TestDemoSetup:
     def test_is_skip_demo_setup(self, cclient, tfhelper, load_answers, step_context):
@@ -125,7 +142,9 @@ class TestDemoSetup:
     def test_run_fail(self, cclient, tfhelper, load_answers, step_context):
         answer_data = {"user": {"foo": "bar"}}
         load_answers.return_value = answer_data
-        tfhelper.apply.side_effect = TerraformException("Bad terraform")
+        tfhelper.apply_waiting_for_lock.side_effect = TerraformException(
+            "Bad terraform"
+        )
         step = configure.DemoSetup(cclient, tfhelper, Path("/tmp/dummy"))
         result = step.run(step_context)
         assert result.result_type == ResultType.FAILED
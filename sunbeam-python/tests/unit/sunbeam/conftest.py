@@ -73,8 +73,10 @@ def environ():
 
 
 @pytest.fixture
-def copytree():
-    with patch("shutil.copytree") as p:
+def sync_plan_directory():
+    with patch(
+        "sunbeam.core.deployment.sync_plan_directory", return_value="tree-hash"
+    ) as p:
         yield p
 
 
@@ -86,6 +88,26 @@ def tenacity_patch(mocker):
     return tenacity
 
 
+@pytest.fixture(autouse=True)
+def kube_clients():
+    """Do not share pooled lightkube clients between tests."""
+    from sunbeam.steps.k8s import clear_kube_clients
+
+    clear_kube_clients()
+    yield
+    clear_kube_clients()
+
+
+@pytest.fixture(autouse=True)
+def admin_credentials():
+    """Do not share cached admin credentials between tests."""
+    from sunbeam.commands.configure import clear_admin_credentials
+
+    clear_admin_credentials()
+    yield
+    clear_admin_credentials()
+
+
 # Common test fixtures used across multiple test files
 @pytest.fixture
 def basic_client():
@@ -108,6 +130,7 @@ def basic_jhelper():
     """Basic juju helper mock used by most test classes."""
     jhelper = Mock()
     jhelper.run_action.return_value = {}
+    jhelper.for_worker.return_value = jhelper
     return jhelper
 
 
@@ -115,7 +115,35 @@ class TestDeployment:
         assert nova_manifest.revision is None
         assert nova_manifest.config is None
 
-    def test_get_tfhelper(self, mocker, snap, copytree, deployment: Deployment):
+    def test_load_latest_from_cache(self, mocker, deployment: Deployment):
+        client = Mock()
+        client.cluster.get_latest_manifest.return_value = {
+            "manifestid": "abc",
+            "data": test_manifest,
+        }
+        deployment.get_client.side_effect = None
+        deployment.get_client.return_value = client
+        deployment.get_feature_manager.return_value.features.return_value = {}
+        manifest = deployment.get_manifest()
+
+        deployment._manifest = None
+        parse_manifest = deployment.parse_manifest
+        parse_manifest.reset_mock()
+        cached = deployment.get_manifest()
+
+        parse_manifest.assert_not_called()
+        assert cached == manifest
+        assert cached.core.software.charms["keystone-k8s"].revision == 234
+
+        # A new manifest in clusterd is parsed again
+        deployment._manifest = None
+        client.cluster.get_latest_manifest.return_value["manifestid"] = "def"
+        deployment.get_manifest()
+        parse_manifest.assert_called_once()
+
+    def test_get_tfhelper(
+        self, mocker, snap, sync_plan_directory, deployment: Deployment
+    ):
         tfplan = "k8s-plan"
         mocker.patch.object(deployment_mod, "Snap", return_value=snap)
         mocker.patch.object(manifest_mod, "Snap", return_value=snap)
@@ -123,12 +151,11 @@ class TestDeployment:
         tfhelper = deployment.get_tfhelper(tfplan)
         assert tfhelper.plan == tfplan
         assert deployment._load_tfhelpers.call_count == 1
-        copytree.assert_has_calls(
+        sync_plan_directory.assert_has_calls(
             [
                 call(
                     Path(snap.paths.snap / "etc" / tfplan_dir),
                     Path(deployment.plans_directory / tfplan_dir),
-                    dirs_exist_ok=True,
                 )
                 for tfplan_dir in TERRAFORM_DIR_NAMES.values()
             ],
@@ -136,7 +163,7 @@ class TestDeployment:
         )
 
     def test_get_tfhelper_tfplan_override_in_manifest(
-        self, mocker, snap, copytree, deployment: Deployment
+        self, mocker, snap, sync_plan_directory, deployment: Deployment
     ):
         tfplan = "openstack-plan"
         mocker.patch.object(deployment_mod, "Snap", return_value=snap)
@@ -150,19 +177,19 @@ class TestDeployment:
         tfhelper = deployment.get_tfhelper(tfplan)
         tfplan_dir = TERRAFORM_DIR_NAMES.get(tfplan)
         test_manifest_dict = yaml.safe_load(test_manifest)
-        copytree.assert_any_call(
+        sync_plan_directory.assert_any_call(
             Path(
                 test_manifest_dict["core"]["software"]["terraform"]["openstack-plan"][
                     "source"
                 ]
             ),
             Path(deployment.plans_directory / tfplan_dir),
-            dirs_exist_ok=True,
         )
         assert tfhelper.plan == tfplan
+        assert tfhelper.source_hash == "tree-hash"
 
     def test_get_tfhelper_multiple_calls(
-        self, mocker, snap, copytree, deployment: Deployment
+        self, mocker, snap, sync_plan_directory, deployment: Deployment
     ):
         tfplan = "k8s-plan"
         mocker.patch.object(deployment_mod, "Snap", return_value=snap)
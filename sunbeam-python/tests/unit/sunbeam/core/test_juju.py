@@ -123,6 +123,22 @@ def test_init_with_none():
         jujulib.JujuHelper(None)
 
 
+def test_for_worker_has_own_client(jhelper):
+    jhelper._juju = jubilant.Juju(wait_timeout=60)
+
+    worker = jhelper.for_worker()
+
+    assert worker.controller == jhelper.controller
+    assert worker._juju is not jhelper._juju
+    assert worker._juju.wait_timeout == 60
+    with worker._model("test-model") as juju:
+        assert juju.model == "test:admin/test-model"
+        assert jhelper._juju.model is None
+    # Model lookups are shared with the parent helper
+    jhelper.models.assert_called_once()
+    assert worker.get_model("test-model") is jhelper.get_model("test-model")
+
+
 def test_cli_json_success(jhelper):
     jhelper._juju.cli.return_value = json.dumps({"app": "bar"})
     result = jhelper.cli("status")
@@ -201,6 +217,17 @@ def test_remove_unit(jhelper, juju):
     juju.remove_unit.assert_called()
 
 
+def test_remove_units(jhelper, juju):
+    jhelper.remove_units(["app/0", "other/1"], "test-model")
+    juju.remove_unit.assert_called_once_with("app/0", "other/1")
+
+
+def test_remove_units_invalid(jhelper, juju):
+    with pytest.raises(ValueError):
+        jhelper.remove_units(["app/0", "app"], "test-model")
+    juju.remove_unit.assert_not_called()
+
+
 def test_run_cmd_on_machine_unit_payload_success(jhelper, juju):
     juju.exec = Mock(return_value=Mock(success=True, results={"result": "ok"}))
 
@@ -1226,6 +1253,84 @@ def test_wait_until_desired_status_overlay_units(
     juju.wait.assert_called_once()
 
 
+def test_wait_until_desired_status_units_exact_ownership(
+    jhelper: jujulib.JujuHelper, juju, status
+):
+    """Units are assigned to apps by exact name, not by substring."""
+    status.apps["nova"] = Mock(
+        units={
+            "nova/0": Mock(
+                workload_status=Mock(current="active", message=""),
+                juju_status=Mock(current="idle"),
+            ),
+        },
+        subordinate_to=[],
+        scale=1,
+    )
+    status.apps["nova-cell"] = Mock(
+        units={
+            "nova-cell/0": Mock(
+                workload_status=Mock(current="active", message=""),
+                juju_status=Mock(current="idle"),
+            ),
+        },
+        subordinate_to=[],
+        scale=1,
+    )
+
+    jhelper.wait_until_desired_status(
+        "test-model", ["nova", "nova-cell"], units=["nova-cell/0"]
+    )
+
+    ready = juju.wait.call_args.args[0]
+    # nova has no unit selected, all of its units are checked.
+    assert ready(status)
+    status.apps["nova"].units["nova/0"].workload_status.current = "blocked"
+    assert not ready(status)
+
+
+def test_wait_until_desired_status_short_circuits_without_queue(
+    jhelper: jujulib.JujuHelper, juju, status
+):
+    for app in ("app1", "app2"):
+        status.apps[app] = Mock(
+            units={
+                f"{app}/0": Mock(
+                    workload_status=Mock(current="waiting", message=""),
+                    juju_status=Mock(current="idle"),
+                ),
+            },
+            subordinate_to=[],
+            scale=1,
+        )
+
+    jhelper.wait_until_desired_status("test-model", ["app1", "app2"])
+
+    ready = juju.wait.call_args.args[0]
+    app2_units = Mock(wraps=status.apps["app2"].units)
+    status.apps["app2"].units = app2_units
+    assert not ready(status)
+    app2_units.items.assert_not_called()
+
+
+def test_app_status_matcher_caches_unchanged_status():
+    unit = Mock(
+        workload_status=Mock(current="active", message=""),
+        juju_status=Mock(current="idle"),
+    )
+    application_status = Mock(units={"app1/0": unit}, subordinate_to=[], scale=1)
+    matcher = jujulib._AppStatusMatcher(None, {"active"}, {"idle"})
+
+    with patch.object(matcher, "_evaluate", wraps=matcher._evaluate) as mock_evaluate:
+        assert matcher.matches(application_status)
+        assert matcher.matches(application_status)
+        mock_evaluate.assert_called_once()
+
+        unit.juju_status.current = "executing"
+        assert not matcher.matches(application_status)
+        assert mock_evaluate.call_count == 2
+
+
 def test_get_relation_map(jhelper, status, juju):
     status.apps["app"] = Mock(units={"app/0": Mock(leader=True)})
     juju.exec = Mock(
@@ -334,6 +334,20 @@ class TestAddManifestStep:
         )
         assert result.result_type == ResultType.COMPLETED
 
+    def test_run_invalidates_manifest_cache(
+        self, snap_conf, edge_manifest, step_context
+    ):
+        cache = manifest_mod.ManifestCache(snap_conf, "deployment")
+        cache.save("key", manifest_mod.Manifest())
+        assert cache.path.exists()
+
+        step = manifest_mod.AddManifestStep(Mock(), clear=True)
+        step.manifest_content = manifest_mod.EMPTY_MANIFEST
+        result = step.run(step_context)
+
+        assert result.result_type == ResultType.COMPLETED
+        assert not cache.path.exists()
+
     def test_run_with_no_manifest(self, snap_conf, edge_manifest, step_context):
         client = Mock()
         step = manifest_mod.AddManifestStep(client)
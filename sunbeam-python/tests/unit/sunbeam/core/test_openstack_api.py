@@ -4,6 +4,7 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from keystoneauth1.exceptions import Unauthorized
 
 import sunbeam.core.openstack_api
 
@@ -64,6 +65,25 @@ class TestOpenStackAPI:
             project_domain_name=FAKE_CREDS.get("OS_PROJECT_DOMAIN_NAME"),
         )
 
+    def test_get_admin_connection_retries_on_unauthorized(
+        self, retrieve_admin_credentials, os_connect
+    ):
+        jhelper = Mock()
+        deployment = Mock()
+        stale_conn = Mock()
+        stale_conn.session.get_token.side_effect = Unauthorized()
+        conn = Mock()
+        os_connect.side_effect = [stale_conn, conn]
+        with patch.object(
+            sunbeam.core.openstack_api, "clear_admin_credentials"
+        ) as clear_admin_credentials:
+            assert (
+                sunbeam.core.openstack_api.get_admin_connection(jhelper, deployment)
+                is conn
+            )
+        clear_admin_credentials.assert_called_once_with(deployment, "openstack")
+        assert retrieve_admin_credentials.call_count == 2
+
     def test_guests_on_hypervisor(self):
         conn = Mock()
         get_admin_connection.return_value = conn
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest.mock import Mock
+
+import pytest
+
+from sunbeam.core.ovn import ARM64_ARCHITECTURE, DEFAULT_ARCHITECTURE, OvnManager
+
+NODES = [
+    {"name": "node-0", "role": ["control", "storage"], "machineid": 0},
+    {"name": "node-1", "role": ["compute"], "machineid": 1, "arch": "amd64"},
+    {"name": "node-2", "role": ["compute", "network"], "machineid": 2},
+    {"name": "node-3", "role": ["network"], "machineid": 3, "arch": "arm64"},
+    {"name": "node-4", "role": ["storage"], "machineid": 4},
+    {"name": "node-5", "role": ["compute"], "machineid": -1},
+]
+
+
+@pytest.fixture
+def manager():
+    client = Mock()
+    client.cluster.list_nodes.return_value = NODES
+    return OvnManager(client)
+
+
+def test_get_machines(manager):
+    assert manager.get_machines() == ["0", "1", "2", "3"]
+    assert manager.get_machines(ARM64_ARCHITECTURE) == ["3"]
+
+
+def test_get_machines_by_architecture(manager):
+    assert manager.get_machines_by_architecture() == {
+        DEFAULT_ARCHITECTURE: ["0", "1", "2"],
+        ARM64_ARCHITECTURE: ["3"],
+    }
+
+
+def test_get_token_distributor_machines(manager):
+    assert manager.get_token_distributor_machines() == ["0"]
+
+
+def test_get_token_distributor_machines_skips_other_architectures():
+    client = Mock()
+    client.cluster.list_nodes.return_value = [
+        {"name": "node-0", "role": ["control"], "machineid": 0, "arch": "arm64"},
+        {"name": "node-1", "role": ["compute"], "machineid": 1},
+    ]
+
+    assert OvnManager(client).get_token_distributor_machines() == ["1"]
+
+
+def test_snapshot_is_reused_until_refresh(manager):
+    manager.get_machines()
+    manager.get_machines_by_architecture()
+    manager.get_token_distributor_machines()
+    manager.client.cluster.list_nodes.assert_called_once_with()
+
+    manager.refresh()
+    manager.get_machines()
+    assert manager.client.cluster.list_nodes.call_count == 2
@@ -1,15 +1,16 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
-import tenacity
 
 from sunbeam.core.common import ResultType, Role
 from sunbeam.core.juju import ApplicationNotFoundException
 from sunbeam.core.steps import (
     DeployMachineApplicationStep,
+    PatchLoadBalancerServicesIPPoolStep,
     RemoveMachineUnitsStep,
 )
 from sunbeam.core.terraform import TerraformException, TerraformStateLockedException
@@ -91,6 +92,7 @@ class TestDeployMachineApplicationStep:
             },
             tf_apply_extra_args=[],
             reporter=step_context.reporter,
+            scoped_tfvars={"machine_ids": ["juju_application.app1"]},
         )
         assert result.result_type == ResultType.COMPLETED
 
@@ -135,10 +137,9 @@ class TestDeployMachineApplicationStep:
         step_context,
     ):
         jhelper.get_application.return_value = Mock(units={"app/1": Mock(machine=1)})
-        tfhelper.update_tfvars_and_apply_tf.side_effect = [
-            TerraformStateLockedException("apply failed..."),
-            None,
-        ]
+        tfhelper.update_tfvars_and_apply_tf.side_effect = TerraformStateLockedException(
+            "apply failed..."
+        )
 
         step = DeployMachineApplicationStep(
             deployment,
@@ -150,11 +151,11 @@ class TestDeployMachineApplicationStep:
             "app1",
             "model1",
         )
-        step.run.retry.wait = tenacity.wait_none()
         result = step.run(step_context)
 
-        tfhelper.update_tfvars_and_apply_tf.assert_called()
-        assert result.result_type == ResultType.COMPLETED
+        # The lock is waited for by the apply, the step does not retry
+        tfhelper.update_tfvars_and_apply_tf.assert_called_once()
+        assert result.result_type == ResultType.FAILED
 
     def test_run_waiting_timed_out(
         self,
@@ -250,7 +251,7 @@ class TestRemoveMachineUnitStep:
     def test_run_application_not_found(
         self, cclient, jhelper, read_config, step_context
     ):
-        jhelper.remove_unit.side_effect = ApplicationNotFoundException(
+        jhelper.remove_units.side_effect = ApplicationNotFoundException(
             "Application missing..."
         )
 
@@ -260,7 +261,7 @@ class TestRemoveMachineUnitStep:
         step.units_to_remove = {"app1/0"}
         result = step.run(step_context)
 
-        jhelper.remove_unit.assert_called_once()
+        jhelper.remove_units.assert_called_once()
         assert result.result_type == ResultType.FAILED
         assert result.message == "Application missing..."
 
@@ -275,3 +276,124 @@ class TestRemoveMachineUnitStep:
         jhelper.wait_application_ready.assert_called_once()
         assert result.result_type == ResultType.FAILED
         assert result.message == "timed out"
+
+
+POOL_ANNOTATION = "metallb.io/address-pool"
+ALLOCATED_POOL_ANNOTATION = "metallb.io/ip-allocated-from-pool"
+
+
+class PatchServicesStep(PatchLoadBalancerServicesIPPoolStep):
+    def services(self) -> list[str]:
+        return ["keystone", "glance"]
+
+    def model(self) -> str:
+        return "openstack"
+
+
+def _service(name: str, annotations: dict) -> Mock:
+    service = Mock()
+    service.metadata.name = name
+    service.metadata.annotations = annotations
+    service.spec.type = "LoadBalancer"
+    return service
+
+
+class TestPatchLoadBalancerServicesIPPoolStep:
+    @pytest.fixture
+    def watch_client(self):
+        client = Mock()
+        with (
+            patch("sunbeam.core.steps.l_kubeconfig.KubeConfig"),
+            patch("sunbeam.core.steps.l_client.Client", return_value=client),
+        ):
+            yield client
+
+    @pytest.fixture
+    def step(self, watch_client):
+        step = PatchServicesStep(Mock(), "new-pool")
+        step.lb_pool_annotation = POOL_ANNOTATION
+        step.lb_allocated_pool_annotation = ALLOCATED_POOL_ANNOTATION
+        step.kubeconfig = {}
+        step.kube = Mock()
+        return step
+
+    def test_run_applies_all_then_watches_once(self, step, watch_client, step_context):
+        step.kube.get.side_effect = lambda res, name: _service(
+            name, {ALLOCATED_POOL_ANNOTATION: "old-pool"}
+        )
+        watch_client.watch.return_value = iter(
+            [
+                ("ADDED", _service("keystone-lb", {})),
+                (
+                    "MODIFIED",
+                    _service("other", {ALLOCATED_POOL_ANNOTATION: "new-pool"}),
+                ),
+                (
+                    "MODIFIED",
+                    _service("keystone-lb", {ALLOCATED_POOL_ANNOTATION: "new-pool"}),
+                ),
+                (
+                    "MODIFIED",
+                    _service("glance-lb", {ALLOCATED_POOL_ANNOTATION: "new-pool"}),
+                ),
+            ]
+        )
+
+        result = step.run(step_context)
+
+        assert result.result_type == ResultType.COMPLETED
+        assert [call.args[0].metadata.name for call in step.kube.apply.mock_calls] == [
+            "keystone-lb",
+            "glance-lb",
+        ]
+        watch_client.watch.assert_called_once()
+        assert watch_client.watch.call_args.kwargs["namespace"] == "openstack"
+
+    def test_run_fails_on_pending_services(self, step, watch_client, step_context):
+        step.kube.get.side_effect = lambda res, name: _service(name, {})
+        watch_client.watch.return_value = iter(
+            [
+                (
+                    "MODIFIED",
+                    _service("glance-lb", {ALLOCATED_POOL_ANNOTATION: "new-pool"}),
+                )
+            ]
+        )
+
+        result = step.run(step_context)
+
+        assert result.result_type == ResultType.FAILED
+        assert "keystone-lb" in result.message
+        assert "glance-lb" not in result.message
+
+    def test_run_nothing_to_patch(self, step, watch_client, step_context):
+        step.kube.get.side_effect = lambda res, name: _service(
+            name,
+            {POOL_ANNOTATION: "new-pool", ALLOCATED_POOL_ANNOTATION: "new-pool"},
+        )
+
+        result = step.run(step_context)
+
+        assert result.result_type == ResultType.COMPLETED
+        step.kube.apply.assert_not_called()
+        watch_client.watch.assert_not_called()
+
+    def test_wait_timeout_stops_watch(self, step, watch_client):
+        closed = threading.Event()
+        watch_client.close.side_effect = closed.set
+
+        def watch(*args, **kwargs):
+            # Block until the client is closed, as a watch without events.
+            closed.wait(5)
+            raise RuntimeError("client closed")
+            yield
+
+        watch_client.watch.side_effect = watch
+
+        pending = step._wait_for_ip_allocated_from_pool(
+            ["keystone-lb"], "new-pool", timeout=0.1
+        )
+
+        assert pending == {"keystone-lb"}
+        watch_client.close.assert_called_once()
+        assert "lb-ip-pool-watch" not in [t.name for t in threading.enumerate()]
@@ -12,12 +12,17 @@ import yaml
 import sunbeam.core.deployment as deployment_mod
 import sunbeam.core.manifest as manifest_mod
 import sunbeam.core.terraform as terraform_mod
+from sunbeam.clusterd.service import ConfigItemNotFoundException
 from sunbeam.core.deployment import Deployment
 from sunbeam.core.progress import NoOpReporter
 from sunbeam.core.terraform import (
     TerraformException,
     TerraformHelper,
+    TerraformLockWaiter,
+    TerraformStateIndex,
     TerraformStateLockedException,
+    TerraformStateReader,
+    sync_plan_directory,
 )
 from sunbeam.versions import OPENSTACK_CHANNEL
 
@@ -118,7 +123,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -193,7 +198,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -235,7 +240,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -282,7 +287,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -328,7 +333,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -366,7 +371,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -406,7 +411,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -443,7 +448,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -483,7 +488,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -541,7 +546,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -592,7 +597,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -639,7 +644,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -683,7 +688,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -741,7 +746,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -774,7 +779,7 @@ class TestTerraformHelper:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -920,7 +925,7 @@ class TestApplyTfvars:
         self,
         mocker,
         snap,
-        copytree,
+        sync_plan_directory,
         deployment: Deployment,
         read_config,
     ):
@@ -1265,3 +1270,423 @@ class TestRunTerraformCommand:
                 env={},
                 reporter=None,
             )
+
+
+class TestTerraformLockWaiter:
+    @pytest.fixture(autouse=True)
+    def sleep(self, mocker):
+        yield mocker.patch("sunbeam.core.terraform.time.sleep")
+
+    def _lock(self, created="2026-03-23T10:00:00.123456789Z"):
+        return {
+            "ID": "lock-id",
+            "Operation": "OperationTypeApply",
+            "Who": "root@node-1",
+            "Created": created,
+        }
+
+    def test_wait_returns_when_unlocked(self, sleep):
+        client = Mock()
+        client.cluster.get_terraform_lock.side_effect = ConfigItemNotFoundException
+        TerraformLockWaiter(client, "openstack-plan").wait()
+        sleep.assert_not_called()
+
+    def test_wait_reports_holder_until_released(self, sleep):
+        client = Mock()
+        client.cluster.get_terraform_lock.side_effect = [
+            self._lock(),
+            self._lock(),
+            ConfigItemNotFoundException,
+        ]
+        reporter = Mock()
+
+        TerraformLockWaiter(client, "openstack-plan", stale_age=10**10).wait(reporter)
+
+        assert sleep.call_count == 2
+        events = [call.args[0] for call in reporter.report.call_args_list]
+        assert [event.event_type for event in events] == ["lock_wait", "lock_wait"]
+        assert "root@node-1" in events[0].message
+
+    def test_wait_reports_stale_lock(self):
+        client = Mock()
+        client.cluster.get_terraform_lock.side_effect = [
+            self._lock(created="2020-01-01T00:00:00Z"),
+            ConfigItemNotFoundException,
+        ]
+        reporter = Mock()
+
+        TerraformLockWaiter(client, "openstack-plan").wait(reporter)
+
+        event = reporter.report.call_args.args[0]
+        assert event.event_type == "lock_stale"
+        assert "sunbeam plans unlock openstack-plan" in event.message
+
+    def test_wait_timeout(self):
+        client = Mock()
+        client.cluster.get_terraform_lock.return_value = self._lock()
+
+        with pytest.raises(TerraformStateLockedException):
+            TerraformLockWaiter(client, "openstack-plan", timeout=-1).wait()
+
+    def test_lock_age_invalid(self):
+        assert TerraformLockWaiter.lock_age({"Created": "invalid"}) is None
+
+
+class TestApplyWaitingForLock:
+    def _make_helper(self, mocker, snap, tmp_path, backend="http"):
+        mocker.patch.object(terraform_mod, "Snap", return_value=snap)
+        return TerraformHelper(
+            path=tmp_path, plan="test-plan", tfvar_map={}, backend=backend
+        )
+
+    def test_apply_retried_after_lock_release(self, mocker, snap, tmp_path):
+        helper = self._make_helper(mocker, snap, tmp_path)
+        waiter = mocker.patch.object(terraform_mod, "TerraformLockWaiter")
+        waiter.return_value.expired.return_value = False
+        with patch.object(
+            helper,
+            "apply",
+            side_effect=[TerraformStateLockedException("locked"), None],
+        ) as apply:
+            helper.apply_waiting_for_lock(Mock())
+
+        assert apply.call_count == 2
+        waiter.return_value.wait.assert_called_once()
+
+    def test_apply_raises_when_expired(self, mocker, snap, tmp_path):
+        helper = self._make_helper(mocker, snap, tmp_path)
+        waiter = mocker.patch.object(terraform_mod, "TerraformLockWaiter")
+        waiter.return_value.expired.return_value = True
+        with (
+            patch.object(
+                helper, "apply", side_effect=TerraformStateLockedException("locked")
+            ),
+            pytest.raises(TerraformStateLockedException),
+        ):
+            helper.apply_waiting_for_lock(Mock())
+
+    def test_local_backend_applies_directly(self, mocker, snap, tmp_path):
+        helper = self._make_helper(mocker, snap, tmp_path, backend="local")
+        waiter = mocker.patch.object(terraform_mod, "TerraformLockWaiter")
+        with patch.object(helper, "apply") as apply:
+            helper.apply_waiting_for_lock(Mock())
+        apply.assert_called_once()
+        waiter.assert_not_called()
+
+
+class TestTargetedApply:
+    scoped = {"machine_ids": ["juju_application.app"]}
+
+    @pytest.fixture(autouse=True)
+    def update_config(self, mocker):
+        return mocker.patch.object(terraform_mod, "update_config")
+
+    def _make_helper(self, mocker, snap, tmp_path):
+        mocker.patch.object(terraform_mod, "Snap", return_value=snap)
+        helper = TerraformHelper(
+            path=tmp_path,
+            plan="test-plan",
+            tfvar_map={},
+            backend="local",
+        )
+        mocker.patch.object(helper, "write_tfvars")
+        mocker.patch.object(helper, "apply")
+        mocker.patch.object(
+            helper,
+            "state_index",
+            return_value=TerraformStateIndex(
+                serial=1,
+                lineage="l",
+                types={"juju_application.app": "juju_application"},
+                instances={"juju_application.app": ["juju_application.app"]},
+            ),
+        )
+        return helper
+
+    def _config(self, stored, last_full_apply="recent"):
+        if last_full_apply == "recent":
+            timestamp = terraform_mod.datetime.now(terraform_mod.timezone.utc)
+            last_full_apply = {"timestamp": timestamp.isoformat()}
+
+        def _read_config(client, key):
+            if key == "tfvars":
+                return stored
+            if last_full_apply is None:
+                raise ConfigItemNotFoundException("not found")
+            return last_full_apply
+
+        return _read_config
+
+    def _apply(self, helper, override_tfvars, extra_args=None):
+        helper.update_tfvars_and_apply_tf(
+            Mock(),
+            Mock(software=Mock(charms={})),
+            tfvar_config="tfvars",
+            override_tfvars=override_tfvars,
+            tf_apply_extra_args=extra_args,
+            scoped_tfvars=self.scoped,
+        )
+        return helper.apply.call_args.args[0]
+
+    def test_only_scoped_tfvars_changed(self, mocker, snap, tmp_path, read_config):
+        helper = self._make_helper(mocker, snap, tmp_path)
+        read_config.side_effect = self._config(
+            {"machine_ids": ["1"], "model": "m", "_computed_keys": ["machine_ids"]}
+        )
+
+        args = self._apply(helper, {"machine_ids": ["1", "2"], "model": "m"})
+
+        assert args == ["-target=juju_application.app", "-refresh=false"]
+
+    def test_unscoped_tfvars_changed(
+        self, mocker, snap, tmp_path, read_config, update_config
+    ):
+        helper = self._make_helper(mocker, snap, tmp_path)
+        read_config.side_effect = self._config(
+            {"machine_ids": ["1"], "model": "m", "_computed_keys": ["machine_ids"]}
+        )
+
+        args = self._apply(helper, {"machine_ids": ["1", "2"], "model": "other"})
+
+        assert args == []
+        update_config.assert_any_call(
+            mocker.ANY, "TerraformLastFullApply-test-plan", mocker.ANY
+        )
+
+    def test_first_apply_is_full(self, mocker, snap, tmp_path, read_config):
+        helper = self._make_helper(mocker, snap, tmp_path)
+        read_config.side_effect = ConfigItemNotFoundException("not found")
+
+        assert self._apply(helper, {"machine_ids": ["1"]}) == []
+
+    def test_full_apply_due(self, mocker, snap, tmp_path, read_config):
+        helper = self._make_helper(mocker, snap, tmp_path)
+        read_config.side_effect = self._config(
+            {"machine_ids": ["1"], "_computed_keys": ["machine_ids"]},
+            last_full_apply={"timestamp": "2020-01-01T00:00:00+00:00"},
+        )
+
+        assert self._apply(helper, {"machine_ids": ["1", "2"]}) == []
+
+    def test_target_not_in_state(self, mocker, snap, tmp_path, read_config):
+        helper = self._make_helper(mocker, snap, tmp_path)
+        helper.state_index.return_value = TerraformStateIndex(serial=1, lineage="l")
+        read_config.side_effect = self._config(
+            {"machine_ids": ["1"], "_computed_keys": ["machine_ids"]}
+        )
+
+        assert self._apply(helper, {"machine_ids": ["1", "2"]}) == []
+
+    def test_caller_targets_untouched(
+        self, mocker, snap, tmp_path, read_config, update_config
+    ):
+        helper = self._make_helper(mocker, snap, tmp_path)
+        read_config.side_effect = self._config(
+            {"machine_ids": ["1"], "_computed_keys": ["machine_ids"]}
+        )
+
+        args = self._apply(
+            helper, {"machine_ids": ["1", "2"]}, extra_args=["-target=foo"]
+        )
+
+        assert args == ["-target=foo"]
+        helper.state_index.assert_not_called()
+        update_config.assert_called_once()
+
+
+STATE = {
+    "serial": 3,
+    "lineage": "abc",
+    "resources": [
+        {
+            "mode": "data",
+            "type": "juju_model",
+            "name": "machine_model",
+            "instances": [{"attributes": {"uuid": "secret"}}],
+        },
+        {
+            "mode": "managed",
+            "type": "juju_application",
+            "name": "k8s",
+            "instances": [{"attributes": {}}],
+        },
+        {
+            "module": "module.cinder-volume",
+            "mode": "managed",
+            "type": "juju_application",
+            "name": "cinder-volume",
+            "instances": [{"index_key": 0}, {"index_key": "b"}],
+        },
+    ],
+}
+
+
+class TestTerraformStateIndex:
+    def test_from_state(self):
+        index = TerraformStateIndex.from_state(STATE)
+
+        assert index.serial == 3
+        assert index.addresses() == [
+            "data.juju_model.machine_model",
+            "juju_application.k8s",
+            "module.cinder-volume.juju_application.cinder-volume[0]",
+            'module.cinder-volume.juju_application.cinder-volume["b"]',
+        ]
+        assert index.by_type("juju_application") == [
+            "juju_application.k8s",
+            "module.cinder-volume.juju_application.cinder-volume",
+        ]
+        assert "juju_application.k8s" in index
+        assert "module.cinder-volume.juju_application.cinder-volume" in index
+        assert "module.cinder-volume.juju_application.cinder-volume[0]" in index
+        assert "module.cinder-volume.juju_application.cinder-volume[1]" not in index
+        assert "juju_application.microceph" not in index
+        assert index
+
+    def test_empty_state(self):
+        index = TerraformStateIndex.from_state({})
+
+        assert not index
+        assert index.addresses() == []
+
+
+class TestTerraformStateReader:
+    def test_read_cached_by_serial(self, mocker):
+        client = Mock()
+        client.cluster.get_terraform_state.return_value = (STATE, None)
+        from_state = mocker.spy(TerraformStateIndex, "from_state")
+        reader = TerraformStateReader(client)
+
+        first = reader.read("k8s-plan")
+        assert reader.read("k8s-plan") is first
+        from_state.assert_called_once()
+
+        client.cluster.get_terraform_state.return_value = (dict(STATE, serial=4), None)
+        assert reader.read("k8s-plan").serial == 4
+        assert from_state.call_count == 2
+        client.cluster.get_terraform_state.assert_called_with("k8s-plan", None)
+
+    def test_read_not_modified(self, mocker):
+        client = Mock()
+        client.cluster.get_terraform_state.side_effect = [
+            (STATE, '"abc"'),
+            (None, '"abc"'),
+        ]
+        reader = TerraformStateReader(client)
+
+        first = reader.read("k8s-plan")
+        assert reader.read("k8s-plan") is first
+        client.cluster.get_terraform_state.assert_called_with("k8s-plan", '"abc"')
+
+    def test_read_missing_state(self):
+        client = Mock()
+        client.cluster.get_terraform_state.side_effect = ConfigItemNotFoundException(
+            "not found"
+        )
+
+        assert not TerraformStateReader(client).read("k8s-plan")
+
+    def test_state_index_local_backend(self, mocker, snap, tmp_path):
+        mocker.patch.object(terraform_mod, "Snap", return_value=snap)
+        helper = TerraformHelper(path=tmp_path, plan="p", tfvar_map={})
+        with patch.object(helper, "pull_state", return_value=STATE):
+            index = helper.state_index(Mock())
+        assert "juju_application.k8s" in index
+
+    def test_state_index_http_backend(self, mocker, snap, tmp_path):
+        mocker.patch.object(terraform_mod, "Snap", return_value=snap)
+        helper = TerraformHelper(path=tmp_path, plan="p", tfvar_map={}, backend="http")
+        client = Mock()
+        client.cluster.get_terraform_state.return_value = (STATE, None)
+        with patch.object(helper, "pull_state") as pull_state:
+            index = helper.state_index(client)
+        pull_state.assert_not_called()
+        assert "juju_application.k8s" in index
+
+
+class TestSyncPlanDirectory:
+    @pytest.fixture
+    def src(self, tmp_path):
+        src = tmp_path / "src"
+        (src / "modules").mkdir(parents=True)
+        (src / "main.tf").write_text("main")
+        (src / "modules" / "module.tf").write_text("module")
+        return src
+
+    def test_initial_sync(self, src, tmp_path):
+        dst = tmp_path / "dst"
+
+        tree_hash = sync_plan_directory(src, dst)
+
+        assert (dst / "main.tf").read_text() == "main"
+        assert (dst / "modules" / "module.tf").read_text() == "module"
+        assert tree_hash
+
+    def test_unchanged_sources_skipped(self, src, tmp_path, mocker):
+        dst = tmp_path / "dst"
+        tree_hash = sync_plan_directory(src, dst)
+        copy2 = mocker.patch.object(terraform_mod.shutil, "copy2")
+
+        assert sync_plan_directory(src, dst) == tree_hash
+        copy2.assert_not_called()
+
+    def test_only_changed_files_copied(self, src, tmp_path, mocker):
+        dst = tmp_path / "dst"
+        tree_hash = sync_plan_directory(src, dst)
+        (src / "main.tf").write_text("main changed")
+        copy2 = mocker.spy(terraform_mod.shutil, "copy2")
+
+        assert sync_plan_directory(src, dst) != tree_hash
+        copy2.assert_called_once_with(src / "main.tf", dst / "main.tf")
+        assert (dst / "main.tf").read_text() == "main changed"
+
+    def test_deleted_destination_file_restored(self, src, tmp_path):
+        dst = tmp_path / "dst"
+        sync_plan_directory(src, dst)
+        (dst / "main.tf").unlink()
+
+        sync_plan_directory(src, dst)
+
+        assert (dst / "main.tf").read_text() == "main"
+
+    def test_missing_sources(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            sync_plan_directory(tmp_path / "missing", tmp_path / "dst")
+
+
+class TestInitFingerprint:
+    def _make_helper(self, mocker, snap, tmp_path, source_hash="tree-hash"):
+        mocker.patch.object(terraform_mod, "Snap", return_value=snap)
+        (tmp_path / ".terraform").mkdir()
+        return TerraformHelper(
+            path=tmp_path, plan="p", tfvar_map={}, source_hash=source_hash
+        )
+
+    def test_init_skipped_when_fingerprint_matches(self, mocker, snap, tmp_path, run):
+        helper = self._make_helper(mocker, snap, tmp_path)
+        mocker.patch.object(helper, "write_terraformrc")
+
+        helper.init()
+        helper.init()
+
+        run.assert_called_once()
+
+    def test_init_rerun_when_sources_change(self, mocker, snap, tmp_path, run):
+        helper = self._make_helper(mocker, snap, tmp_path)
+        mocker.patch.object(helper, "write_terraformrc")
+
+        helper.init()
+        helper.source_hash = "new-tree-hash"
+        helper.init()
+
+        assert run.call_count == 2
+
+    def test_init_always_run_without_source_hash(self, mocker, snap, tmp_path, run):
+        helper = self._make_helper(mocker, snap, tmp_path, source_hash=None)
+        mocker.patch.object(helper, "write_terraformrc")
+
+        helper.init()
+        helper.init()
+
+        assert run.call_count == 2
+        assert not (tmp_path / terraform_mod.PLAN_INIT_RECORD).exists()
@@ -282,72 +282,96 @@ def test_wait_resource_in_target_state_failed(mock_retry_sleep, mock_retry_stop)
         )
 
 
-@patch("sunbeam.core.watcher.get_actions")
-@patch(
-    "sunbeam.core.watcher.tenacity.wait_fixed",
-    return_value=tenacity.wait_fixed(0),
-)
-@patch(
-    "sunbeam.core.watcher.tenacity.stop_after_delay",
-    return_value=tenacity.stop_after_attempt(10),
-)
-def test_wait_until_action_state(
-    mock_stop_after_delay,
-    mock_wait_fixed,
-    mock_get_actions,
-):
+def _action(uuid: str, state: str) -> Mock:
+    action = Mock(uuid=uuid, state=state, action_type="migrate")
+    return action
+
+
+@patch("sunbeam.core.watcher.time.sleep")
+def test_wait_until_action_state(mock_sleep):
     mock_client = Mock()
     mock_status = Mock()
+    mock_reporter = Mock()
     mock_step = Mock()
     mock_step.status = "fake-status-msg"
-    mock_audit = Mock()
+    mock_audit = Mock(uuid="audit-uuid")
+
+    mock_client.action.list.return_value = [
+        _action("0", "SUCCEEDED"),
+        _action("1", "PENDING"),
+        _action("2", "PENDING"),
+    ]
+    mock_client.action.get.side_effect = [
+        _action("1", "ONGOING"),
+        _action("2", "PENDING"),
+        _action("1", "ONGOING"),
+        _action("2", "PENDING"),
+        _action("1", "SUCCEEDED"),
+        _action("2", "SUCCEEDED"),
+    ]
 
-    times = 5
-    action_num = 3
-    side_effect = []
-    for i in range(times):
-        actions = []
-        for j in range(action_num):
-            action = Mock()
-            action.uuid = str(j)
-            actions.append(action)
-        side_effect.append(actions)
-    for action in side_effect[-1]:
-        action.state = "SUCCEEDED"
+    watcher_helper.wait_until_action_state(
+        mock_step, mock_audit, mock_client, mock_status, reporter=mock_reporter
+    )
+
+    mock_client.action.list.assert_called_once_with(audit="audit-uuid", limit=0)
+    # Completed actions are not fetched again
+    assert [c.args[0] for c in mock_client.action.get.call_args_list] == [
+        "1",
+        "2",
+    ] * 3
+    # The interval is reset on progress and backs off while nothing changes
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 1, 2]
+    mock_status.update.assert_called_with(
+        "fake-status-msg" + ("waiting for actions to become expected state (3/3)")
+    )
+    # Initial listing of 3 actions, then ONGOING and the 2 completions
+    assert mock_reporter.report.call_count == 6
 
-    side_effect[1][0].state = "SUCCEEDED"
 
-    mock_get_actions.side_effect = side_effect
+@patch("sunbeam.core.watcher.time.sleep")
+def test_wait_until_action_state_lists_many_pending_actions(mock_sleep):
+    mock_client = Mock()
+    mock_audit = Mock(uuid="audit-uuid")
+    nb_actions = watcher_helper.PENDING_ACTIONS_GET_THRESHOLD + 1
+    mock_client.action.list.side_effect = [
+        [_action(str(i), "PENDING") for i in range(nb_actions)],
+        [_action(str(i), "SUCCEEDED") for i in range(nb_actions)],
+    ]
 
     watcher_helper.wait_until_action_state(
-        mock_step, mock_audit, mock_client, mock_status
+        Mock(status=""), mock_audit, mock_client, None
     )
 
+    assert mock_client.action.list.call_count == 2
+    mock_client.action.get.assert_not_called()
 
-@patch("sunbeam.core.watcher.get_actions")
-@patch(
-    "sunbeam.core.watcher.tenacity.wait_fixed",
-    return_value=tenacity.wait_fixed(0),
-)
-@patch(
-    "sunbeam.core.watcher.tenacity.stop_after_delay",
-    return_value=tenacity.stop_after_attempt(10),
-)
-def test_wait_until_action_state_failed(
-    mock_stop_after_delay,
-    mock_wait_fixed,
-    mock_get_actions,
-):
+
+@patch("sunbeam.core.watcher.time.sleep")
+def test_wait_until_action_state_failed(mock_sleep):
     mock_client = Mock()
     mock_status = Mock()
     mock_step = Mock()
     mock_step.status = "fake-status-msg"
     mock_audit = Mock()
 
-    mock_get_actions.return_value = [Mock()]
-    mock_get_actions.return_value[0].state = "FAILED"
+    mock_client.action.list.return_value = [_action("0", "PENDING")]
+    mock_client.action.get.return_value = _action("0", "FAILED")
 
     with pytest.raises(watcher_helper.WatcherActionFailedException):
         watcher_helper.wait_until_action_state(
             mock_step, mock_audit, mock_client, mock_status
         )
+
+
+@patch("sunbeam.core.watcher.time.monotonic", side_effect=[0, 0, 1000])
+@patch("sunbeam.core.watcher.time.sleep")
+def test_wait_until_action_state_timeout(mock_sleep, mock_monotonic):
+    mock_client = Mock()
+    mock_client.action.list.return_value = [_action("0", "PENDING")]
+    mock_client.action.get.return_value = _action("0", "PENDING")
+
+    with pytest.raises(SunbeamException, match="Not all actions completed: 0"):
+        watcher_helper.wait_until_action_state(
+            Mock(status=""), Mock(), mock_client, None
+        )
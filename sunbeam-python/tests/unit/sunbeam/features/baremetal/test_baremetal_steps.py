@@ -126,6 +126,7 @@ class TestBaremetalCommands:
             timeout=constants.IRONIC_APP_TIMEOUT,
             queue=ANY,
             status=["active"],
+            overlay=None,
         )
 
     @patch.object(steps, "JujuHelper")
@@ -156,6 +157,7 @@ class TestBaremetalCommands:
             timeout=constants.IRONIC_APP_TIMEOUT,
             queue=ANY,
             status=["active"],
+            overlay=None,
         )
 
     @patch.object(steps, "JujuHelper")
@@ -192,6 +194,7 @@ class TestBaremetalCommands:
             timeout=constants.IRONIC_APP_TIMEOUT,
             queue=ANY,
             status=["active"],
+            overlay=None,
         )
 
     @patch.object(steps.console, "print")
@@ -382,6 +385,7 @@ class TestBaremetalCommands:
             timeout=constants.IRONIC_APP_TIMEOUT,
             queue=ANY,
             status=["active"],
+            overlay=None,
         )
 
     @patch.object(steps, "Table")
@@ -525,4 +529,183 @@ class TestBaremetalCommands:
             timeout=constants.IRONIC_APP_TIMEOUT,
             queue=ANY,
             status=["active", "blocked"],
+            overlay=None,
         )
+
+    def _switch_configs(self, netconf_name: str = "foo"):
+        netconf = test_feature_config._get_netconf_sample_config(
+            netconf_name, with_key=False
+        )
+        config_obj = feature_config._Config(configfile=netconf)
+        return feature_config._SwitchConfigs(netconf={"foo": config_obj})
+
+    @patch.object(steps, "JujuHelper")
+    def test_switch_config_secrets_unchanged(
+        self, mock_JujuHelper, deployment, step_context
+    ):
+        ironic = ironic_feature.BaremetalFeature()
+        ironic._manifest = Mock()
+        switch_configs = self._switch_configs()
+        secret_data = steps._switch_config_secret_data(switch_configs.netconf["foo"])
+
+        client = deployment.get_client.return_value
+        client._cluster_config[OPENSTACK_TERRAFORM_VARS] = {
+            constants.NEUTRON_BAREMETAL_SWITCH_CONF_SECRETS_TFVAR: "foo-id",
+            constants.NEUTRON_GENERIC_SWITCH_CONF_SECRETS_TFVAR: "",
+            constants.NEUTRON_SWITCH_CONF_SECRETS_TFVAR: {
+                "netconf": ["switch-config-foo"],
+                "generic": [],
+            },
+        }
+        client._cluster_config[constants.SWITCH_CONFIG_SECRETS_RECORD_KEY] = {
+            "switch-config-foo": {
+                "hash": steps._switch_config_hash(secret_data),
+                "id": "foo-id",
+            },
+        }
+        step = steps.UpdateSwitchConfigSecretsStep(deployment, ironic, switch_configs)
+
+        result = step.run(step_context)
+
+        assert result.result_type == ResultType.COMPLETED
+        jhelper = mock_JujuHelper.return_value
+        jhelper.add_secret.assert_not_called()
+        jhelper.update_secret.assert_not_called()
+        jhelper.remove_secret.assert_not_called()
+        jhelper.grant_secret.assert_not_called()
+        tfhelper = deployment.get_tfhelper.return_value
+        tfhelper.update_tfvars_and_apply_tf.assert_not_called()
+
+    @patch.object(steps, "JujuHelper")
+    def test_switch_config_secrets_changed_and_removed(
+        self, mock_JujuHelper, deployment, step_context
+    ):
+        ironic = ironic_feature.BaremetalFeature()
+        ironic._manifest = Mock()
+        switch_configs = self._switch_configs("changed")
+        secret_data = steps._switch_config_secret_data(switch_configs.netconf["foo"])
+
+        client = deployment.get_client.return_value
+        client._cluster_config[OPENSTACK_TERRAFORM_VARS] = {
+            constants.NEUTRON_BAREMETAL_SWITCH_CONF_SECRETS_TFVAR: "foo-id",
+            constants.NEUTRON_GENERIC_SWITCH_CONF_SECRETS_TFVAR: "bar-id",
+            constants.NEUTRON_SWITCH_CONF_SECRETS_TFVAR: {
+                "netconf": ["switch-config-foo"],
+                "generic": ["switch-config-bar"],
+            },
+        }
+        client._cluster_config[constants.SWITCH_CONFIG_SECRETS_RECORD_KEY] = {
+            "switch-config-foo": {"hash": "stale", "id": "foo-id"},
+            "switch-config-bar": {"hash": "stale", "id": "bar-id"},
+        }
+        step = steps.UpdateSwitchConfigSecretsStep(deployment, ironic, switch_configs)
+
+        result = step.run(step_context)
+
+        assert result.result_type == ResultType.COMPLETED
+        jhelper = mock_JujuHelper.return_value
+        jhelper.update_secret.assert_called_once_with(
+            OPENSTACK_MODEL, "switch-config-foo", secret_data
+        )
+        jhelper.remove_secret.assert_called_once_with(
+            OPENSTACK_MODEL, "switch-config-bar"
+        )
+        jhelper.add_secret.assert_not_called()
+        jhelper.grant_secret.assert_not_called()
+        jhelper.get_secret_id.assert_not_called()
+
+        expected_tfvars = {
+            constants.NEUTRON_BAREMETAL_SWITCH_CONF_SECRETS_TFVAR: "foo-id",
+            constants.NEUTRON_GENERIC_SWITCH_CONF_SECRETS_TFVAR: "",
+            constants.NEUTRON_SWITCH_CONF_SECRETS_TFVAR: {
+                "netconf": ["switch-config-foo"],
+                "generic": [],
+            },
+        }
+        tfhelper = deployment.get_tfhelper.return_value
+        tfhelper.update_tfvars_and_apply_tf.assert_called_once_with(
+            client,
+            ironic._manifest,
+            tfvar_config=OPENSTACK_TERRAFORM_VARS,
+            override_tfvars=expected_tfvars,
+            reporter=step_context.reporter,
+        )
+        client.cluster.update_config.assert_any_call(
+            constants.SWITCH_CONFIG_SECRETS_RECORD_KEY,
+            json.dumps(
+                {
+                    "switch-config-foo": {
+                        "hash": steps._switch_config_hash(secret_data),
+                        "id": "foo-id",
+                    }
+                }
+            ),
+        )
+
+    @patch.object(steps, "JujuHelper")
+    def test_apply_baremetal_resources(self, mock_JujuHelper, deployment, step_context):
+        ironic = ironic_feature.BaremetalFeature()
+        ironic._manifest = Mock()
+        client = deployment.get_client.return_value
+        client._cluster_config[OPENSTACK_TERRAFORM_VARS] = {
+            constants.NOVA_IRONIC_SHARDS_TFVAR: {"old": {"shard": "old"}},
+            constants.IRONIC_CONDUCTOR_GROUPS_TFVAR: {},
+        }
+        changes = feature_config.BaremetalResourceChanges.model_validate(
+            {
+                "shards": {"add": ["foo"], "remove": ["old"]},
+                "conductor-groups": {"add": ["foo", "lish"]},
+            }
+        )
+        step = steps.ApplyBaremetalResourcesStep(deployment, ironic, changes)
+
+        result = step.run(step_context)
+
+        assert result.result_type == ResultType.COMPLETED
+        expected_tfvars = {
+            constants.NOVA_IRONIC_SHARDS_TFVAR: {"foo": {"shard": "foo"}},
+            constants.IRONIC_CONDUCTOR_GROUPS_TFVAR: {
+                "foo": {"conductor-group": "foo"},
+                "lish": {"conductor-group": "lish"},
+            },
+        }
+        tfhelper = deployment.get_tfhelper.return_value
+        tfhelper.update_tfvars_and_apply_tf.assert_called_once_with(
+            client,
+            ironic._manifest,
+            tfvar_config=OPENSTACK_TERRAFORM_VARS,
+            override_tfvars=expected_tfvars,
+            reporter=step_context.reporter,
+        )
+
+        jhelper = mock_JujuHelper.return_value
+        jhelper.wait_until_desired_status.assert_called_once_with(
+            OPENSTACK_MODEL,
+            ["nova-ironic-foo", "ironic-conductor-foo", "ironic-conductor-lish"],
+            timeout=constants.IRONIC_APP_TIMEOUT,
+            queue=ANY,
+            status=["active"],
+            overlay={
+                "ironic-conductor-foo": {"status": ["active", "blocked"]},
+                "ironic-conductor-lish": {"status": ["active", "blocked"]},
+            },
+        )
+        jhelper.wait_application_gone.assert_called_once_with(
+            ["nova-ironic-old"],
+            OPENSTACK_MODEL,
+            timeout=constants.IRONIC_APP_TIMEOUT,
+        )
+
+    def test_apply_baremetal_resources_remove_not_found(self, deployment, step_context):
+        ironic = ironic_feature.BaremetalFeature()
+        ironic._manifest = Mock()
+        changes = feature_config.BaremetalResourceChanges.model_validate(
+            {"conductor-groups": {"add": ["foo"], "remove": ["missing"]}}
+        )
+        step = steps.ApplyBaremetalResourcesStep(deployment, ironic, changes)
+
+        result = step.run(step_context)
+
+        assert result.result_type == ResultType.FAILED
+        tfhelper = deployment.get_tfhelper.return_value
+        tfhelper.update_tfvars_and_apply_tf.assert_not_called()
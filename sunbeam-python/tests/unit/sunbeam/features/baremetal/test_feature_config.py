@@ -78,6 +78,28 @@ class TestBaremetalFeatureConfig:
         feature_config.BaremetalFeatureConfig(conductor_groups=[])
         feature_config.BaremetalFeatureConfig(conductor_groups=["foo", "lish"])
 
+    def test_validate_resource_changes(self):
+        changes_cls = feature_config.BaremetalResourceChanges
+
+        # no duplicates.
+        with pytest.raises(pydantic.ValidationError):
+            changes_cls.model_validate({"shards": {"add": ["foo", "foo"]}})
+
+        # cannot be both added and removed.
+        with pytest.raises(pydantic.ValidationError):
+            changes_cls.model_validate(
+                {"conductor-groups": {"add": ["foo"], "remove": ["foo"]}}
+            )
+
+        # valid examples.
+        changes = changes_cls.model_validate({})
+        assert changes.shards.add == []
+        changes = changes_cls.model_validate(
+            {"shards": {"remove": ["foo"]}, "conductor-groups": {"add": ["foo"]}}
+        )
+        assert changes.shards.remove == ["foo"]
+        assert changes.conductor_groups.add == ["foo"]
+
     def test_validate_netconf_config(self):
         # valid config.
         configfile_data = _get_netconf_sample_config("foo")
@@ -11,6 +11,7 @@ from sunbeam.features.caas.feature import (
     CAAPH_CONTAINER,
     CAAPH_DEPLOYMENT,
     CAAPH_NAMESPACE,
+    DeleteClusterAPI,
     PatchCaaphProxyStep,
 )
 
@@ -149,3 +150,86 @@ class TestPatchCaaphProxyStep:
         result = step.run(step_context)
 
         assert result.result_type == ResultType.FAILED
+
+
+def _named(name: str) -> Mock:
+    obj = Mock()
+    obj.metadata.name = name
+    return obj
+
+
+def _not_found() -> ApiError:
+    api_error = ApiError.__new__(ApiError)
+    api_error.status = Mock(code=404)
+    return api_error
+
+
+class TestDeleteClusterAPI:
+    @pytest.fixture
+    def kube(self, kube_client):
+        from sunbeam.features.caas import feature
+
+        namespaces = [[_named("capi-system"), _named("default")], [_named("default")]]
+
+        def _list(res, **kwargs):
+            if res is feature.core_v1.Namespace:
+                return namespaces.pop(0) if len(namespaces) > 1 else namespaces[0]
+            if res is feature.apiextensions_v1.CustomResourceDefinition:
+                return [_named("clusters.cluster.x-k8s.io")]
+            return [_named("orc-manager-role"), _named("orc-manager-rolebinding")]
+
+        kube_client.list.side_effect = _list
+        kube_client.get.side_effect = _not_found()
+        return kube_client
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self):
+        with patch("sunbeam.features.caas.feature.time.sleep") as mock:
+            yield mock
+
+    def test_run(self, client, kube, get_kube_client_patch, step_context):
+        from sunbeam.features.caas import feature
+
+        step = DeleteClusterAPI(client, {})
+        with (
+            patch.object(step, "_get_workload_clusters", return_value=[]),
+            patch.object(step, "_delete_capi_components"),
+        ):
+            result = step.run(step_context)
+
+        assert result.result_type == ResultType.COMPLETED
+        kube.delete.assert_any_call(feature.core_v1.Namespace, name="capi-system")
+        crds = [c.kwargs.get("name") for c in kube._client.request.call_args_list]
+        assert crds == [
+            "",
+            "images.openstack.k-orc.cloud",
+            "providers.clusterctl.cluster.x-k8s.io",
+        ]
+        waited_crds = {c.args[1] for c in kube.get.call_args_list}
+        assert waited_crds == {
+            "clusters.cluster.x-k8s.io",
+            "images.openstack.k-orc.cloud",
+            "providers.clusterctl.cluster.x-k8s.io",
+        }
+
+    def test_run_timeout_waiting_for_namespaces(
+        self, client, kube, get_kube_client_patch, step_context
+    ):
+        from sunbeam.features.caas import feature
+
+        kube.list.side_effect = lambda res, **kwargs: (
+            [_named("capi-system")] if res is feature.core_v1.Namespace else []
+        )
+        step = DeleteClusterAPI(client, {})
+        with (
+            patch.object(step, "_get_workload_clusters", return_value=[]),
+            patch.object(step, "_delete_capi_components"),
+            patch(
+                "sunbeam.features.caas.feature.time.monotonic",
+                side_effect=[0, 0, 1000],
+            ),
+        ):
+            result = step.run(step_context)
+
+        assert result.result_type == ResultType.FAILED
+        assert "capi-system" in result.message
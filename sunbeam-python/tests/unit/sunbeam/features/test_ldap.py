@@ -72,8 +72,8 @@ class TestAddLDAPDomainStep:
                 "ldap-apps": {"dom1": {"domain-name": "dom1"}},
             }
         )
-        step.tfhelper.apply.assert_called_once_with(
-            LDAP_APPLY_TARGETS, reporter=step_context.reporter
+        step.tfhelper.apply_waiting_for_lock.assert_called_once_with(
+            step.client, LDAP_APPLY_TARGETS, reporter=step_context.reporter
         )
         assert result.result_type == ResultType.COMPLETED
 
@@ -93,8 +93,8 @@ class TestAddLDAPDomainStep:
                 },
             }
         )
-        step.tfhelper.apply.assert_called_once_with(
-            LDAP_APPLY_TARGETS, reporter=step_context.reporter
+        step.tfhelper.apply_waiting_for_lock.assert_called_once_with(
+            step.client, LDAP_APPLY_TARGETS, reporter=step_context.reporter
         )
         assert result.result_type == ResultType.COMPLETED
 
@@ -105,9 +105,11 @@ class TestAddLDAPDomainStep:
         step = AddLDAPDomainStep(
             Mock(), Mock(), self.jhelper, self.feature, self.charm_config
         )
-        step.tfhelper.apply.side_effect = TerraformException("apply failed...")
+        step.tfhelper.apply_waiting_for_lock.side_effect = TerraformException(
+            "apply failed..."
+        )
         result = step.run(step_context)
-        step.tfhelper.apply.assert_called_once()
+        step.tfhelper.apply_waiting_for_lock.assert_called_once()
         assert result.result_type == ResultType.FAILED
         assert result.message == "apply failed..."
 
@@ -125,8 +127,8 @@ class TestAddLDAPDomainStep:
                 "ldap-apps": {"dom1": {"domain-name": "dom1"}},
             }
         )
-        step.tfhelper.apply.assert_called_once_with(
-            LDAP_APPLY_TARGETS, reporter=step_context.reporter
+        step.tfhelper.apply_waiting_for_lock.assert_called_once_with(
+            step.client, LDAP_APPLY_TARGETS, reporter=step_context.reporter
         )
         assert result.result_type == ResultType.FAILED
         assert result.message == "timed out"
@@ -157,8 +159,8 @@ class TestDisableLDAPDomainStep:
         step.tfhelper.write_tfvars.assert_called_with(
             {"ldap-channel": "2023.2/edge", "ldap-apps": {}}
         )
-        step.tfhelper.apply.assert_called_once_with(
-            LDAP_APPLY_TARGETS, reporter=step_context.reporter
+        step.tfhelper.apply_waiting_for_lock.assert_called_once_with(
+            step.client, LDAP_APPLY_TARGETS, reporter=step_context.reporter
         )
 
     def test_disable_tf_apply_failed(
@@ -169,13 +171,15 @@ class TestDisableLDAPDomainStep:
             "ldap-apps": {"dom1": {"domain-name": "dom1"}},
         }
         step = DisableLDAPDomainStep(Mock(), Mock(), self.jhelper, self.feature, "dom1")
-        step.tfhelper.apply.side_effect = TerraformException("apply failed...")
+        step.tfhelper.apply_waiting_for_lock.side_effect = TerraformException(
+            "apply failed..."
+        )
         result = step.run(step_context)
         step.tfhelper.write_tfvars.assert_called_with(
             {"ldap-channel": "2023.2/edge", "ldap-apps": {}}
         )
-        step.tfhelper.apply.assert_called_once_with(
-            LDAP_APPLY_TARGETS, reporter=step_context.reporter
+        step.tfhelper.apply_waiting_for_lock.assert_called_once_with(
+            step.client, LDAP_APPLY_TARGETS, reporter=step_context.reporter
         )
         assert result.result_type == ResultType.FAILED
         assert result.message == "apply failed..."
@@ -225,8 +229,8 @@ class TestUpdateLDAPDomainStep:
                 "ldap-apps": {"dom1": {"domain-name": "dom1"}},
             }
         )
-        step.tfhelper.apply.assert_called_once_with(
-            LDAP_APPLY_TARGETS, reporter=step_context.reporter
+        step.tfhelper.apply_waiting_for_lock.assert_called_once_with(
+            step.client, LDAP_APPLY_TARGETS, reporter=step_context.reporter
         )
         assert result.result_type == ResultType.COMPLETED
 
@@ -250,10 +254,12 @@ class TestUpdateLDAPDomainStep:
         step = UpdateLDAPDomainStep(
             Mock(), self.jhelper, self.feature, self.charm_config
         )
-        step.tfhelper.apply.side_effect = TerraformException("apply failed...")
+        step.tfhelper.apply_waiting_for_lock.side_effect = TerraformException(
+            "apply failed..."
+        )
         result = step.run(step_context)
-        step.tfhelper.apply.assert_called_once_with(
-            LDAP_APPLY_TARGETS, reporter=step_context.reporter
+        step.tfhelper.apply_waiting_for_lock.assert_called_once_with(
+            step.client, LDAP_APPLY_TARGETS, reporter=step_context.reporter
         )
         assert result.result_type == ResultType.FAILED
         assert result.message == "apply failed..."
@@ -269,10 +275,12 @@ class TestUpdateLDAPDomainStep:
             Mock(), self.jhelper, self.feature, self.charm_config
         )
         self.jhelper.wait_until_active.side_effect = TimeoutError("timed out")
-        step.tfhelper.apply.side_effect = TerraformException("apply failed...")
+        step.tfhelper.apply_waiting_for_lock.side_effect = TerraformException(
+            "apply failed..."
+        )
         result = step.run(step_context)
-        step.tfhelper.apply.assert_called_once_with(
-            LDAP_APPLY_TARGETS, reporter=step_context.reporter
+        step.tfhelper.apply_waiting_for_lock.assert_called_once_with(
+            step.client, LDAP_APPLY_TARGETS, reporter=step_context.reporter
         )
         assert result.result_type == ResultType.FAILED
         assert result.message == "apply failed..."
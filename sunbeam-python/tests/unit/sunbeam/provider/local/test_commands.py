@@ -8,8 +8,18 @@ import pytest
 from click.testing import CliRunner
 
 from sunbeam.core.common import ResultType, Role
-from sunbeam.provider.local.commands import add, join, remove
-from sunbeam.steps.clusterd import ClusterRemoveNodeStep
+from sunbeam.provider.local.commands import (
+    _run_coalesced_join_plan,
+    add,
+    join,
+    remove,
+)
+from sunbeam.steps.clusterd import (
+    ClusterRemoveNodeStep,
+    ClusterUpdateNodeStep,
+    WaitForJoinCoalescingStep,
+)
+from sunbeam.steps.hypervisor import DeployHypervisorApplicationStep
 from sunbeam.steps.juju import JujuGrantModelAccessStep, RemoveJujuMachineStep
 from sunbeam.steps.microovn import ReapplyMicroOVNTerraformPlanStep
 from sunbeam.steps.role_distributor import (
@@ -202,6 +212,41 @@ class TestJoinNodeValidation:
         assert first_plan[0].__class__.__name__ == "ClusterJoinNodeStep"
 
 
+class TestCoalescedJoin:
+    def _plan(self):
+        update_step = Mock(spec=ClusterUpdateNodeStep)
+        deploy_step = Mock(spec=DeployHypervisorApplicationStep)
+        node_step = Mock()
+        return update_step, deploy_step, node_step
+
+    @patch("sunbeam.provider.local.commands.JoinCoalescer")
+    def test_leader_runs_whole_plan(self, coalescer_cls, run_plan_cmd):
+        coalescer_cls.return_value.is_leader = True
+        update_step, deploy_step, node_step = self._plan()
+
+        _run_coalesced_join_plan(
+            Mock(), "node-1", 30, [update_step, deploy_step, node_step], Mock(), False
+        )
+
+        first_plan = run_plan_cmd.call_args_list[0][0][0]
+        assert first_plan[0] is update_step
+        assert isinstance(first_plan[1], WaitForJoinCoalescingStep)
+        assert run_plan_cmd.call_args_list[1][0][0] == [deploy_step, node_step]
+        coalescer_cls.return_value.reconcile.assert_called_once()
+
+    @patch("sunbeam.provider.local.commands.JoinCoalescer")
+    def test_follower_skips_reconcile_steps(self, coalescer_cls, run_plan_cmd):
+        coalescer_cls.return_value.is_leader = False
+        update_step, deploy_step, node_step = self._plan()
+
+        _run_coalesced_join_plan(
+            Mock(), "node-2", 30, [update_step, deploy_step, node_step], Mock(), False
+        )
+
+        assert run_plan_cmd.call_args_list[1][0][0] == [node_step]
+        coalescer_cls.return_value.reconcile.assert_not_called()
+
+
 class TestRemoveNodeRoleDistributor:
     def test_remove_cleans_role_distributor_before_machine_removal_and_reapplies(
         self,
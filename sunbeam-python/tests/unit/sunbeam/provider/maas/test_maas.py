@@ -3,6 +3,7 @@
 
 import copy
 import json
+import time
 from builtins import ConnectionRefusedError
 from ssl import SSLError
 from unittest.mock import MagicMock, Mock, patch
@@ -13,11 +14,22 @@ from lightkube import ApiError
 from maas.client.bones import CallError
 
 import sunbeam.provider.maas.steps as maas_steps
-from sunbeam.core.checks import DiagnosticResultType
+from sunbeam.core.checks import (
+    DiagnosticResultType,
+    DiagnosticsCheck,
+    DiagnosticsResult,
+)
 from sunbeam.core.deployment import Networks
 from sunbeam.core.deployments import DeploymentsConfig
 from sunbeam.core.juju import ControllerNotFoundException
+from sunbeam.provider.maas.client import (
+    MaasInventory,
+    concurrent_map,
+    fetch_inventory,
+)
 from sunbeam.provider.maas.commands import (
+    _run_maas_checks,
+    _run_maas_meta_checks,
     configure_cmd,
     remove_node,
     validate_deployment_cmd,
@@ -327,7 +339,10 @@ class TestValidateDeploymentCommand:
             "sunbeam.provider.maas.commands.MaasClient.from_deployment",
             return_value=Mock(),
         )
-        mocker.patch("sunbeam.provider.maas.commands.list_machines", return_value=[])
+        mocker.patch(
+            "sunbeam.provider.maas.commands.fetch_inventory",
+            return_value=MaasInventory([], [], [], {}),
+        )
         mocker.patch(
             "sunbeam.provider.maas.commands._run_maas_meta_checks",
             return_value=[{"passed": DiagnosticResultType.FAILURE.value}],
@@ -351,7 +366,10 @@ class TestValidateDeploymentCommand:
             "sunbeam.provider.maas.commands.MaasClient.from_deployment",
             return_value=Mock(),
         )
-        mocker.patch("sunbeam.provider.maas.commands.list_machines", return_value=[])
+        mocker.patch(
+            "sunbeam.provider.maas.commands.fetch_inventory",
+            return_value=MaasInventory([], [], [], {}),
+        )
         mocker.patch(
             "sunbeam.provider.maas.commands._run_maas_meta_checks",
             return_value=[{"passed": DiagnosticResultType.SUCCESS.value}],
@@ -367,6 +385,51 @@ class TestValidateDeploymentCommand:
         assert "Validation failed" not in result.output
 
 
+class _SleepyCheck(DiagnosticsCheck):
+    def __init__(self, name: str, delay: float):
+        super().__init__(name, f"Checking {name}")
+        self.delay = delay
+
+    def run(self) -> list[DiagnosticsResult]:
+        time.sleep(self.delay)
+        return [
+            DiagnosticsResult.success(f"{self.name}-sub", "sub"),
+            DiagnosticsResult.success(self.name, "done"),
+        ]
+
+
+class TestRunMaasChecks:
+    def test_results_keep_checks_order(self):
+        # The first check finishes last, the report must not be reordered.
+        checks = [_SleepyCheck("slow", 0.2), _SleepyCheck("fast", 0)]
+
+        report = _run_maas_checks(checks, MagicMock())
+
+        assert [result["name"] for result in report] == [
+            "slow-sub",
+            "slow",
+            "fast-sub",
+            "fast",
+        ]
+
+    def test_meta_checks_print_last_result(self):
+        checks = [_SleepyCheck("slow", 0.2), _SleepyCheck("fast", 0)]
+        console = MagicMock()
+
+        report = _run_maas_meta_checks(checks, console)
+
+        assert len(report) == 4
+        assert console.print.call_count == 2
+
+    def test_checks_run_concurrently(self):
+        checks = [_SleepyCheck(f"check-{i}", 0.3) for i in range(4)]
+
+        start = time.monotonic()
+        _run_maas_checks(checks, MagicMock())
+
+        assert time.monotonic() - start < 1.2
+
+
 class TestValidateMachineCommand:
     def test_exit_nonzero_on_failed_checks(self, mocker):
         runner = CliRunner()
@@ -872,6 +935,102 @@ class TestIpRangesCheck:
         get_ip_ranges_from_space_mock.assert_any_call(client, "public_space")
         get_ip_ranges_from_space_mock.assert_any_call(client, "internal_space")
 
+    def test_run_with_inventory(self, mocker):
+        client = Mock()
+        deployment = Mock()
+        deployment.network_mapping = {
+            Networks.PUBLIC.value: "public_space",
+            Networks.INTERNAL.value: "internal_space",
+        }
+        deployment.public_api_label = "public_api"
+        deployment.internal_api_label = "internal_api"
+        inventory = MaasInventory(
+            machines=[],
+            spaces=[{"name": "public_space"}, {"name": "internal_space"}],
+            subnets=[
+                {"id": 1, "cidr": "192.168.0.0/24", "space": "public_space"},
+                {"id": 2, "cidr": "10.0.0.0/24", "space": "internal_space"},
+            ],
+            ip_ranges={
+                1: [
+                    {
+                        "comment": "public_api",
+                        "start_ip": "192.168.0.1",
+                        "end_ip": "192.168.0.10",
+                    }
+                ],
+                2: [
+                    {
+                        "comment": "internal_api",
+                        "start_ip": "10.0.0.1",
+                        "end_ip": "10.0.0.10",
+                    }
+                ],
+            },
+        )
+        get_ip_ranges_from_space_mock = mocker.patch(
+            "sunbeam.provider.maas.client.get_ip_ranges_from_space"
+        )
+        check = IpRangesCheck(client, deployment, inventory)
+        result = check.run()
+        assert result.passed is DiagnosticResultType.SUCCESS
+        get_ip_ranges_from_space_mock.assert_not_called()
+
+
+class TestMaasInventory:
+    def test_get_ip_ranges_from_space(self):
+        inventory = MaasInventory(
+            machines=[],
+            spaces=[{"name": "alpha"}, {"name": "beta"}],
+            subnets=[
+                {"id": 1, "cidr": "10.0.0.0/24", "space": "alpha"},
+                {"id": 2, "cidr": "10.0.1.0/24", "space": "alpha"},
+                {"id": 3, "cidr": "10.0.2.0/24", "space": "beta"},
+            ],
+            ip_ranges={
+                1: [{"comment": "a", "start_ip": "10.0.0.1", "end_ip": "10.0.0.9"}],
+                3: [{"comment": "b", "start_ip": "10.0.2.1", "end_ip": "10.0.2.9"}],
+            },
+        )
+        assert inventory.get_ip_ranges_from_space("alpha") == {
+            "10.0.0.0/24": [{"label": "a", "start": "10.0.0.1", "end": "10.0.0.9"}]
+        }
+
+    def test_get_subnets_unknown_space(self):
+        inventory = MaasInventory([], [{"name": "alpha"}], [], {})
+        with pytest.raises(ValueError, match="not found"):
+            inventory.get_subnets("beta")
+
+    def test_fetch_inventory_lists_each_object_once(self, mocker):
+        client = Mock()
+        client.list_machines.return_value = [{"system_id": "a"}, {"system_id": "b"}]
+        client.list_spaces.return_value = [{"name": "alpha"}]
+        client.get_subnets.return_value = [{"id": 1, "space": "alpha"}]
+        client.list_ip_ranges_by_subnet.return_value = {}
+        mocker.patch(
+            "sunbeam.provider.maas.client._find_root_devices", return_value=None
+        )
+        mocker.patch(
+            "sunbeam.provider.maas.client._convert_raw_machine",
+            side_effect=lambda machine, root_disk: machine["system_id"],
+        )
+
+        inventory = fetch_inventory(client)
+
+        assert inventory.machines == ["a", "b"]
+        assert inventory.spaces == [{"name": "alpha"}]
+        client.list_machines.assert_called_once_with()
+        client.list_spaces.assert_called_once_with()
+        client.get_subnets.assert_called_once_with()
+        client.list_ip_ranges_by_subnet.assert_called_once_with()
+
+    def test_concurrent_map_keeps_order(self):
+        def _delayed(item: int) -> int:
+            time.sleep(0.01 * (5 - item))
+            return item * 2
+
+        assert concurrent_map(_delayed, range(5)) == [0, 2, 4, 6, 8]
+
 
 class TestMaasBootstrapJujuStep:
     def test_is_skip_with_no_machines(self, snap, mocker, step_context):
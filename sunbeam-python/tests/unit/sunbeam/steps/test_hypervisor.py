@@ -173,6 +173,39 @@ class TestRemoveHypervisorUnitStep:
         result = step.is_skip(step_context)
         assert result.result_type == ResultType.FAILED
 
+    def test_run_action_on_units_uses_worker_helpers(
+        self,
+        basic_client,
+        basic_jhelper,
+        test_model,
+        basic_deployment,
+    ):
+        workers = [Mock(), Mock()]
+        for worker in workers:
+            worker.run_action.return_value = {"result": "[]"}
+        basic_jhelper.for_worker.side_effect = workers
+        step = RemoveHypervisorUnitStep(
+            basic_client,
+            basic_jhelper,
+            basic_deployment,
+            ["node-0", "node-1"],
+            test_model,
+        )
+        step.units = {"node-0": "unit/0", "node-1": "unit/1"}
+
+        results = step._run_action_on_units("running-guests")
+
+        assert results == {"unit/0": {"result": "[]"}, "unit/1": {"result": "[]"}}
+        # Each unit runs through a worker helper, never the shared one
+        basic_jhelper.run_action.assert_not_called()
+        targeted = sorted(
+            call.args for worker in workers for call in worker.run_action.call_args_list
+        )
+        assert targeted == [
+            ("unit/0", test_model, "running-guests"),
+            ("unit/1", test_model, "running-guests"),
+        ]
+
     @patch("sunbeam.steps.hypervisor.remove_hypervisor")
     def test_run(
         self,
@@ -192,7 +225,7 @@ class TestRemoveHypervisorUnitStep:
             test_name,
             test_model,
         )
-        step.unit = "unit/1"
+        step.units = {test_name: "unit/1"}
         result = step.run(step_context)
         assert result.result_type == ResultType.COMPLETED
         remove_hypervisor.assert_called_once_with(
@@ -243,7 +276,7 @@ class TestRemoveHypervisorUnitStep:
             test_model,
             True,
         )
-        step.unit = "unit/1"
+        step.units = {test_name: "unit/1"}
         result = step.run(step_context)
         assert result.result_type == ResultType.COMPLETED
         remove_hypervisor.assert_called_once_with(
@@ -263,7 +296,7 @@ class TestRemoveHypervisorUnitStep:
         step_context,
     ):
         basic_jhelper.run_action.return_value = {"result": "[]"}
-        basic_jhelper.remove_unit.side_effect = ApplicationNotFoundException(
+        basic_jhelper.remove_units.side_effect = ApplicationNotFoundException(
             "Application missing..."
         )
 
@@ -274,10 +307,10 @@ class TestRemoveHypervisorUnitStep:
             test_name,
             test_model,
         )
-        step.unit = "unit/1"
+        step.units = {test_name: "unit/1"}
         result = step.run(step_context)
 
-        basic_jhelper.remove_unit.assert_called_once()
+        basic_jhelper.remove_units.assert_called_once()
         assert result.result_type == ResultType.FAILED
         assert result.message == "Application missing..."
 
@@ -303,13 +336,83 @@ class TestRemoveHypervisorUnitStep:
             test_name,
             test_model,
         )
-        step.unit = "unit/1"
+        step.units = {test_name: "unit/1"}
         result = step.run(step_context)
 
         basic_jhelper.wait_application_ready.assert_called_once()
         assert result.result_type == ResultType.FAILED
         assert result.message == "timed out"
 
+    def test_is_skip_multiple_nodes(
+        self, basic_client, basic_jhelper, basic_deployment, step_context
+    ):
+        basic_client.cluster.get_node_info.side_effect = [
+            {"machineid": 1},
+            NodeNotExistInClusterException("Node missing..."),
+            {"machineid": 3},
+        ]
+        basic_jhelper.get_application.return_value = Mock(
+            units={
+                "hypervisor/1": Mock(machine="1"),
+                "hypervisor/2": Mock(machine="2"),
+                "hypervisor/3": Mock(machine="3"),
+            }
+        )
+        basic_jhelper.run_action.return_value = {"result": "[]"}
+
+        step = RemoveHypervisorUnitStep(
+            basic_client,
+            basic_jhelper,
+            basic_deployment,
+            ["node-1", "node-2", "node-3"],
+            "test-model",
+        )
+        result = step.is_skip(step_context)
+
+        assert result.result_type == ResultType.COMPLETED
+        assert step.units == {"node-1": "hypervisor/1", "node-3": "hypervisor/3"}
+        basic_jhelper.get_application.assert_called_once()
+        assert sorted(
+            call.args[0] for call in basic_jhelper.run_action.call_args_list
+        ) == ["hypervisor/1", "hypervisor/3"]
+
+    @patch("sunbeam.steps.hypervisor.update_config")
+    @patch("sunbeam.steps.hypervisor.remove_hypervisor")
+    def test_run_multiple_nodes(
+        self,
+        remove_hypervisor,
+        update_config,
+        basic_client,
+        basic_jhelper,
+        basic_deployment,
+        read_config_patch,
+        step_context,
+    ):
+        read_config_patch.return_value = {"machine_ids": ["1", "2", "3"]}
+        step = RemoveHypervisorUnitStep(
+            basic_client,
+            basic_jhelper,
+            basic_deployment,
+            ["node-1", "node-3"],
+            "test-model",
+        )
+        step.machine_ids = {"node-1": "1", "node-3": "3"}
+        step.units = {"node-1": "hypervisor/1", "node-3": "hypervisor/3"}
+
+        result = step.run(step_context)
+
+        assert result.result_type == ResultType.COMPLETED
+        assert basic_jhelper.run_action.call_count == 2
+        basic_jhelper.remove_units.assert_called_once_with(
+            ["hypervisor/1", "hypervisor/3"], "test-model"
+        )
+        basic_jhelper.wait_units_gone.assert_called_once()
+        basic_jhelper.wait_application_ready.assert_called_once()
+        update_config.assert_called_once_with(
+            basic_client, "TerraformVarsHypervisor", {"machine_ids": ["2"]}
+        )
+        assert remove_hypervisor.call_count == 2
+
 
 class TestReapplyHypervisorTerraformPlanStep:
     @pytest.fixture
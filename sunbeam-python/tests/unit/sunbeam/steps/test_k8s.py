@@ -1248,6 +1248,34 @@ class TestGetKubeClient:
         )
         assert "Error creating k8s client" in str(context.value)
 
+    @patch("sunbeam.steps.k8s.read_config")
+    @patch("sunbeam.steps.k8s.l_kubeconfig.KubeConfig.from_dict")
+    @patch("sunbeam.steps.k8s.l_client.Client", side_effect=lambda *a, **kw: Mock())
+    def test_get_kube_client_pooled(
+        self,
+        mock_client,
+        mock_kubeconfig_from_dict,
+        mock_read_config,
+        client,
+        namespace,
+    ):
+        mock_read_config.return_value = {"apiVersion": "v1"}
+
+        first = get_kube_client(client, namespace)
+        assert get_kube_client(client, namespace) is first
+        other_namespace = get_kube_client(client, "other")
+        assert other_namespace is not first
+        mock_kubeconfig_from_dict.assert_called_with({"apiVersion": "v1"})
+        assert mock_client.call_count == 2
+
+        # A new kubeconfig invalidates the clients built from the previous one
+        mock_read_config.return_value = {"apiVersion": "v1", "clusters": []}
+        assert get_kube_client(client, namespace) is not first
+        assert mock_client.call_count == 3
+
+        mock_read_config.return_value = {"apiVersion": "v1"}
+        assert get_kube_client(client, "other") is not other_namespace
+
 
 _get_machines_space_ips_tests_cases = {
     "match_ip_in_space_and_network": (
@@ -228,6 +228,7 @@ class TestRunWatcherAuditStep:
             audit=mock_audit,
             client=mock_watcher_client,
             status=step_context.status,
+            reporter=step_context.reporter,
         )
         mock_watcher_helper.get_actions.assert_called_once_with(
             client=mock_watcher_client, audit=mock_audit
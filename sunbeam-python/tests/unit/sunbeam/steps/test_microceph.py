@@ -5,7 +5,11 @@ from unittest.mock import Mock
 
 from sunbeam.core.common import ResultType
 from sunbeam.core.juju import ActionFailedException
-from sunbeam.steps.microceph import ConfigureMicrocephOSDStep, SetCephMgrPoolSizeStep
+from sunbeam.steps.microceph import (
+    CheckMicrocephDistributionStep,
+    ConfigureMicrocephOSDStep,
+    SetCephMgrPoolSizeStep,
+)
 
 
 class TestConfigureMicrocephOSDStep:
@@ -121,3 +125,46 @@ class TestSetCephMgrPoolSizeStep:
         expected_message = "Action failed..."
         assert result.result_type == ResultType.FAILED
         assert result.message == expected_message
+
+
+class TestCheckMicrocephDistributionStep:
+    def _setup(self, cclient, jhelper, nb_storage_nodes):
+        cclient.cluster.get_node_info.side_effect = lambda name: {
+            "machineid": int(name.split("-")[1]),
+            "role": ["storage"],
+        }
+        cclient.cluster.list_nodes_by_role.return_value = [
+            {"name": f"node-{i}"} for i in range(nb_storage_nodes)
+        ]
+        jhelper.get_application.return_value = Mock(
+            units={
+                f"microceph/{i}": Mock(machine=str(i)) for i in range(nb_storage_nodes)
+            }
+        )
+
+    def test_is_skip_batch_keeps_replica_scale(self, cclient, jhelper, step_context):
+        self._setup(cclient, jhelper, 5)
+        step = CheckMicrocephDistributionStep(
+            cclient, ["node-0", "node-1"], jhelper, "test-model"
+        )
+
+        assert step.is_skip(step_context).result_type == ResultType.COMPLETED
+
+    def test_is_skip_batch_breaks_replica_scale(self, cclient, jhelper, step_context):
+        self._setup(cclient, jhelper, 5)
+        step = CheckMicrocephDistributionStep(
+            cclient, ["node-0", "node-1", "node-2"], jhelper, "test-model"
+        )
+
+        assert step.is_skip(step_context).result_type == ResultType.FAILED
+
+    def test_is_skip_batch_removes_all_nodes(self, cclient, jhelper, step_context):
+        self._setup(cclient, jhelper, 2)
+        step = CheckMicrocephDistributionStep(
+            cclient, ["node-0", "node-1"], jhelper, "test-model", force=False
+        )
+
+        result = step.is_skip(step_context)
+
+        assert result.result_type == ResultType.FAILED
+        assert "last storage node" in result.message
@@ -5,7 +5,6 @@ import json
 from unittest.mock import Mock, patch
 
 import pytest
-import tenacity
 
 from sunbeam.clusterd.service import ConfigItemNotFoundException
 from sunbeam.core.common import ResultType
@@ -804,9 +803,6 @@ class PatchLoadBalancerServicesIPPoolStepTest:
             new=Mock(return_value=Mock(get=kube_get_mock)),
         ):
             step = OpenStackPatchLoadBalancerServicesIPPoolStep(pool_client, pool_name)
-            step._wait_for_ip_allocated_from_pool_annotation_update.retry.wait = (
-                tenacity.wait_none()
-            )
             result = step.run(step_context)
         assert result.result_type == ResultType.COMPLETED
         # Verify apply was called instead of patch
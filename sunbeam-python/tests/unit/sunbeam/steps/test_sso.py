@@ -524,7 +524,7 @@ class TestUpdateExternalProviderStep:
             "TerraformVarsOpenstack",
             config_store["TerraformVarsOpenstack"],
         )
-        step.tfhelper.apply.assert_called_once()
+        step.tfhelper.apply_waiting_for_lock.assert_called_once()
 
     def test_update_saml2_provider_has_no_secrets(
         self, read_config, update_config, step_context
@@ -697,7 +697,7 @@ class TestSetKeystoneSAMLCertAndKeyStep:
 
         # Verify terraform config update
         update_config.assert_called()
-        self.tfhelper.apply.assert_called_once()
+        self.tfhelper.apply_waiting_for_lock.assert_called_once()
 
     @patch("sunbeam.steps.sso.cert_and_key_match")
     def test_run_cert_key_mismatch_fails(
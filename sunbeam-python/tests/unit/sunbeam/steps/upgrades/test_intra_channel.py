@@ -2,12 +2,18 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import sys
+import time
 from unittest.mock import Mock, call, patch
 
+import pytest
+
+from sunbeam.clusterd.service import ConfigItemNotFoundException
 from sunbeam.core.common import Result, ResultType, Role
 from sunbeam.core.juju import (
     ActionFailedException,
     ApplicationNotFoundException,
+    JujuController,
+    JujuHelper,
     JujuWaitException,
 )
 from sunbeam.core.openstack import OPENSTACK_MODEL
@@ -27,7 +33,10 @@ from sunbeam.steps.upgrades.intra_channel import (
     LatestInChannel,
     LatestInChannelCoordinator,
     ReapplyInfraModelConfigStep,
+    RefreshProgress,
     RefreshSnapStep,
+    group_apps_for_refresh,
+    refresh_progress_key,
 )
 
 _INTRA_CHANNEL = "sunbeam.steps.upgrades.intra_channel"
@@ -38,6 +47,7 @@ class TestLatestInChannel:
         """Set up test fixtures."""
         self.deployment = Mock()
         self.jhelper = Mock()
+        self.jhelper.for_worker.return_value = self.jhelper
         self.manifest = Mock()
 
         # Set up default manifest structure
@@ -682,6 +692,25 @@ class TestIsTrackChanged:
 class TestLatestInChannelRun:
     """Tests for LatestInChannel.run(step_context), including MAAS infra model."""
 
+    @pytest.fixture(autouse=True)
+    def read_config(self):
+        with patch(
+            f"{_INTRA_CHANNEL}.read_config",
+            side_effect=ConfigItemNotFoundException("not found"),
+        ) as p:
+            yield p
+
+    @pytest.fixture(autouse=True)
+    def delete_config(self):
+        with patch(f"{_INTRA_CHANNEL}.delete_config") as p:
+            yield p
+
+    @pytest.fixture(autouse=True)
+    def snap(self):
+        with patch(f"{_INTRA_CHANNEL}.Snap") as p:
+            p.return_value.revision = "2"
+            yield p
+
     def setup_method(self):
         """Set up test fixtures."""
         self.deployment = Mock()
@@ -875,6 +904,210 @@ class TestLatestInChannelRun:
         # refresh_apps called for infra (empty), k8s, machines
         assert self.upgrader.refresh_apps.call_count == 3
 
+    @patch(f"{_INTRA_CHANNEL}.is_maas_deployment", return_value=False)
+    def test_run_clears_progress_when_completed(
+        self, mock_is_maas, step_context, delete_config
+    ):
+        self.upgrader.get_charm_deployed_versions = Mock(side_effect=[{}, {}])
+        self.upgrader.refresh_apps = Mock(return_value=Result(ResultType.COMPLETED))
+
+        result = self.upgrader.run(step_context)
+
+        assert result.result_type == ResultType.COMPLETED
+        delete_config.assert_called_once_with(
+            self.deployment.get_client.return_value, "IntraChannelRefreshProgress"
+        )
+
+    @patch(f"{_INTRA_CHANNEL}.is_maas_deployment", return_value=False)
+    def test_run_keeps_progress_when_failed(
+        self, mock_is_maas, step_context, delete_config
+    ):
+        self.upgrader.get_charm_deployed_versions = Mock(side_effect=[{}, {}])
+        self.upgrader.refresh_apps = Mock(
+            return_value=Result(ResultType.FAILED, "failed")
+        )
+
+        result = self.upgrader.run(step_context)
+
+        assert result.result_type == ResultType.FAILED
+        delete_config.assert_not_called()
+
+
+class TestRefreshScheduling:
+    def setup_method(self):
+        self.deployment = Mock()
+        self.jhelper = Mock()
+        self.jhelper.for_worker.return_value = self.jhelper
+        self.manifest = Mock()
+        self.manifest.find_charm = Mock(return_value=None)
+        self.upgrader = LatestInChannel(self.deployment, self.jhelper, self.manifest)
+        self.apps = {
+            "horizon": ("horizon-k8s", "2024.1/stable", 1),
+            "keystone": ("keystone-k8s", "2024.1/stable", 2),
+            "rabbitmq": ("rabbitmq-k8s", "3.12/stable", 3),
+            "traefik": ("traefik-k8s", "latest/stable", 4),
+            "mysql": ("mysql-k8s", "8.0/stable", 5),
+        }
+
+    def test_group_apps_for_refresh(self):
+        assert group_apps_for_refresh(self.apps) == [
+            ["rabbitmq"],
+            ["keystone"],
+            ["horizon", "traefik", "mysql"],
+        ]
+
+    def test_groups_waited_in_order(self):
+        events = []
+        self.jhelper.charm_refresh.side_effect = lambda app, *a, **kw: events.append(
+            ("refresh", app)
+        )
+        self.upgrader._wait_after_refresh = Mock(
+            side_effect=lambda apps, *args: (
+                events.append(("wait", sorted(apps))) or Result(ResultType.COMPLETED)
+            )
+        )
+
+        result = self.upgrader.refresh_apps(self.apps, OPENSTACK_MODEL)
+
+        assert result.result_type == ResultType.COMPLETED
+        # Infra apps are still skipped
+        assert ("refresh", "mysql") not in events
+        assert events.index(("wait", ["rabbitmq"])) < events.index(
+            ("refresh", "keystone")
+        )
+        assert events.index(("wait", ["keystone"])) < events.index(
+            ("refresh", "horizon")
+        )
+        assert events[-1] == ("wait", ["horizon", "traefik"])
+
+    def test_failed_group_stops_refresh(self):
+        self.upgrader._wait_after_refresh = Mock(
+            return_value=Result(ResultType.FAILED, "timed out")
+        )
+
+        result = self.upgrader.refresh_apps(self.apps, OPENSTACK_MODEL)
+
+        assert result.result_type == ResultType.FAILED
+        self.jhelper.charm_refresh.assert_called_once_with(
+            "rabbitmq", OPENSTACK_MODEL, trust=False
+        )
+
+    @patch(f"{_INTRA_CHANNEL}.update_config")
+    @patch(
+        f"{_INTRA_CHANNEL}.read_config",
+        return_value={
+            "key": "2:abc",
+            "refreshed": {OPENSTACK_MODEL: ["rabbitmq", "keystone"]},
+        },
+    )
+    def test_resume_skips_refreshed_apps(self, read_config, update_config):
+        self.upgrader._wait_after_refresh = Mock(
+            return_value=Result(ResultType.COMPLETED)
+        )
+        self.upgrader._progress = RefreshProgress(Mock(), "2:abc")
+        self.upgrader._progress.load()
+
+        result = self.upgrader.refresh_apps(self.apps, OPENSTACK_MODEL)
+
+        assert result.result_type == ResultType.COMPLETED
+        refreshed = {c.args[0] for c in self.jhelper.charm_refresh.call_args_list}
+        assert refreshed == {"horizon", "traefik"}
+        update_config.assert_called_once_with(
+            self.upgrader._progress.client,
+            "IntraChannelRefreshProgress",
+            {
+                "key": "2:abc",
+                "refreshed": {
+                    OPENSTACK_MODEL: ["rabbitmq", "keystone", "horizon", "traefik"]
+                },
+            },
+        )
+
+    @patch(f"{_INTRA_CHANNEL}.update_config")
+    @patch(
+        f"{_INTRA_CHANNEL}.read_config",
+        return_value={
+            "key": "1:abc",
+            "refreshed": {OPENSTACK_MODEL: ["rabbitmq", "keystone"]},
+        },
+    )
+    def test_resume_discards_progress_of_other_key(self, read_config, update_config):
+        self.upgrader._wait_after_refresh = Mock(
+            return_value=Result(ResultType.COMPLETED)
+        )
+        self.upgrader._progress = RefreshProgress(Mock(), "2:abc")
+        self.upgrader._progress.load()
+
+        result = self.upgrader.refresh_apps(self.apps, OPENSTACK_MODEL)
+
+        assert result.result_type == ResultType.COMPLETED
+        refreshed = {c.args[0] for c in self.jhelper.charm_refresh.call_args_list}
+        assert refreshed == {"rabbitmq", "keystone", "horizon", "traefik"}
+
+    @patch(f"{_INTRA_CHANNEL}.update_config")
+    def test_record_does_not_duplicate_apps(self, update_config):
+        progress = RefreshProgress(Mock(), "2:abc")
+
+        progress.record(OPENSTACK_MODEL, ["rabbitmq"])
+        progress.record(OPENSTACK_MODEL, ["rabbitmq", "keystone"])
+
+        assert progress.refreshed == {OPENSTACK_MODEL: ["rabbitmq", "keystone"]}
+
+    @patch(f"{_INTRA_CHANNEL}.Snap")
+    def test_refresh_progress_key(self, snap):
+        snap.return_value.revision = "2"
+        manifest = Mock()
+        manifest.core.software.charms = {
+            "keystone-k8s": Mock(channel="2024.1/stable", revision=None)
+        }
+        manifest.get_features.return_value = []
+        key = refresh_progress_key(manifest)
+
+        assert key.startswith("2:")
+        snap.return_value.revision = "3"
+        assert refresh_progress_key(manifest) != key
+        snap.return_value.revision = "2"
+        manifest.core.software.charms["keystone-k8s"].revision = 10
+        assert refresh_progress_key(manifest) != key
+
+    def test_concurrent_refreshes_target_their_model(self):
+        jhelper = JujuHelper(
+            JujuController(name="test", api_endpoints=[], ca_cert="", is_external=False)
+        )
+        jhelper.models = Mock(  # type: ignore[method-assign]
+            return_value=[
+                {
+                    "short-name": OPENSTACK_MODEL,
+                    "name": f"admin/{OPENSTACK_MODEL}",
+                    "model-uuid": "1234",
+                }
+            ]
+        )
+        jhelper.snapshot_workload_status = Mock(  # type: ignore[method-assign]
+            return_value={}
+        )
+        targets = []
+
+        def refresh(juju, app_name, **kwargs):
+            # Give other workers the chance to switch models meanwhile
+            time.sleep(0.001)
+            targets.append((app_name, juju.model))
+
+        apps = {f"app{i}": (f"charm{i}-k8s", "2024.1/stable", i) for i in range(64)}
+        upgrader = LatestInChannel(self.deployment, jhelper, self.manifest)
+        upgrader._wait_after_refresh = Mock(  # type: ignore[method-assign]
+            return_value=Result(ResultType.COMPLETED)
+        )
+
+        with patch("jubilant.Juju.refresh", new=refresh):
+            result = upgrader.refresh_apps(apps, OPENSTACK_MODEL)
+
+        assert result.result_type == ResultType.COMPLETED
+        assert sorted(targets) == sorted(
+            (app_name, f"test:admin/{OPENSTACK_MODEL}") for app_name in apps
+        )
+        assert jhelper._juju.model is None
+
 
 class TestLatestInChannelCoordinator:
     """Tests for the LatestInChannelCoordinator.get_plan() method."""
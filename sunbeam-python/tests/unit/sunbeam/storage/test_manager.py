@@ -7,9 +7,19 @@ from unittest.mock import Mock, patch
 
 import click
 import pytest
+from click.testing import CliRunner
 
 from sunbeam.storage.manager import StorageBackendManager
 from sunbeam.storage.models import StorageBackendInfo
+from sunbeam.storage.registry import BackendEntry
+
+
+def _registered(group, name):
+    """Return the command named name added to a mocked group."""
+    for call in group.add_command.call_args_list:
+        if call[0][0].name == name:
+            return call[0][0]
+    raise AssertionError(f"{name} was not registered")
 
 
 @pytest.fixture
@@ -25,11 +35,14 @@ def mock_backend():
 
 
 @pytest.fixture
-def manager(mock_backend):
+def manager(mock_backend, monkeypatch):
     """Create a fresh manager instance."""
     # Reset the class-level state before each test
-    StorageBackendManager._backends = {mock_backend.backend_type: mock_backend}
-    StorageBackendManager._loaded = True
+    monkeypatch.setattr(
+        StorageBackendManager,
+        "_backends",
+        {mock_backend.backend_type: mock_backend},
+    )
     return StorageBackendManager()
 
 
@@ -47,158 +60,61 @@ def mock_deployment():
 class TestStorageBackendManager:
     """Tests for StorageBackendManager."""
 
-    def test_init_loads_backends(self, manager):
-        """Test that initialization triggers backend loading."""
-        with patch.object(manager, "_load_backends") as mock_load:
-            # Create a new manager
-            new_manager = StorageBackendManager()
-            # _load_backends should be called if backends are empty
-            if not new_manager._backends:
-                mock_load.assert_called_once()
-
-    def test_load_backends_sets_loaded_flag(self, manager):
-        """Test that _load_backends sets the loaded flag."""
-        # Reset the loaded flag
-        manager._loaded = False
-        assert not manager._loaded
-        with patch("importlib.import_module"):
-            with patch("pathlib.Path.iterdir", return_value=[]):
-                manager._load_backends()
-                assert manager._loaded
-
-    def test_load_backends_only_once(self, manager):
-        """Test that backends are only loaded once."""
-        with patch("importlib.import_module"):
-            with patch("pathlib.Path.iterdir", return_value=[]):
-                manager._load_backends()
-                manager._load_backends()
-                # Should only load once due to _loaded flag
-                # But init also calls it, so check the total is reasonable
-
-    def test_load_backends_skips_non_directories(self, manager):
-        """Test that non-directory items are skipped."""
-        mock_file = Mock()
-        mock_file.is_dir.return_value = False
-        mock_file.name = "test.py"
-
-        with patch("pathlib.Path.iterdir", return_value=[mock_file]):
-            with patch("importlib.import_module"):
-                manager._load_backends()
-                # Should not attempt to import non-directories
-
-    def test_load_backends_skips_special_directories(self, manager):
-        """Test that special directories are skipped."""
-        special_dirs = ["__pycache__", "_internal", "etc"]
-        mock_paths = []
-
-        for name in special_dirs:
-            mock_path = Mock()
-            mock_path.is_dir.return_value = True
-            mock_path.name = name
-            mock_paths.append(mock_path)
-
-        with patch("pathlib.Path.iterdir", return_value=mock_paths):
-            with patch("importlib.import_module") as mock_import:
-                manager._load_backends()
-                # Should not attempt to import special directories
-                mock_import.assert_not_called()
-
-    def test_load_backends_skips_missing_backend_file(self, manager):
-        """Test that directories without backend.py are skipped."""
-        mock_dir = Mock()
-        mock_dir.is_dir.return_value = True
-        mock_dir.name = "test-backend"
-        mock_dir.__truediv__ = Mock(return_value=Mock(exists=Mock(return_value=False)))
-
-        with patch("pathlib.Path.iterdir", return_value=[mock_dir]):
-            with patch("importlib.import_module") as mock_import:
-                manager._load_backends()
-                # Should not attempt to import if backend.py is missing
-                mock_import.assert_not_called()
-
-    def test_load_backends_registers_valid_backend(self, manager):
-        """Test that valid backends are registered."""
-        from sunbeam.storage.base import StorageBackendBase
-
-        # Create a mock backend class
-        class TestBackend(StorageBackendBase):
-            backend_type = "test"
-            display_name = "Test Backend"
-
-            @property
-            def charm_name(self):
-                return "test-charm"
-
-            def config_type(self):
-                from sunbeam.core.manifest import StorageBackendConfig
-
-                return StorageBackendConfig
-
-        # Create mock module with backend class
+    def test_init_does_not_load_backends(self, manager):
+        """Test that initialization does not import any backend."""
+        with patch("importlib.import_module") as mock_import:
+            StorageBackendManager()
+            mock_import.assert_not_called()
+
+    def test_entries_lists_index_without_loading(self, manager, mock_backend):
+        """Test that entries are enumerated from the index."""
+        with patch("importlib.import_module") as mock_import:
+            entries = manager.entries()
+            mock_import.assert_not_called()
+
+        assert entries["test-backend"] is mock_backend
+        assert isinstance(entries["purestorage"], BackendEntry)
+        assert entries["purestorage"].generally_available
+        assert "purestorage" not in manager._backends
+
+    def test_get_backend_loads_from_index(self, manager):
+        """Test that a backend is imported when it is selected."""
         mock_module = Mock()
-        mock_module.TestBackend = TestBackend
-
-        mock_dir = Mock()
-        mock_dir.is_dir.return_value = True
-        mock_dir.name = "test"
-        backend_py = Mock()
-        backend_py.exists.return_value = True
-        mock_dir.__truediv__ = Mock(return_value=backend_py)
-
-        with patch("pathlib.Path.iterdir", return_value=[mock_dir]):
-            with patch("importlib.import_module", return_value=mock_module):
-                with patch("pathlib.Path.exists", return_value=True):
-                    # Clear existing backends and reset loaded flag
-                    manager._backends = {}
-                    manager._loaded = False
-                    manager._load_backends()
-                    # Backend should be registered
-                    assert "test" in manager._backends
-
-    def test_load_backends_handles_import_error(self, manager):
-        """Test that import errors are handled gracefully."""
-        mock_dir = Mock()
-        mock_dir.is_dir.return_value = True
-        mock_dir.name = "broken-backend"
-        backend_py = Mock()
-        backend_py.exists.return_value = True
-        mock_dir.__truediv__ = Mock(return_value=backend_py)
-
-        with patch("pathlib.Path.iterdir", return_value=[mock_dir]):
-            with patch(
-                "importlib.import_module", side_effect=ImportError("Test error")
-            ):
-                # Should not raise, just log warning
-                manager._load_backends()
+        with patch("importlib.import_module", return_value=mock_module) as mock_import:
+            backend = manager.get_backend("purestorage")
+            assert manager.get_backend("purestorage") is backend
+
+        mock_import.assert_called_once_with(
+            "sunbeam.storage.backends.purestorage.backend"
+        )
+        assert backend is mock_module.PureStorageBackend.return_value
+        assert manager._backends["purestorage"] is backend
 
     def test_get_backend_success(self, manager, mock_backend):
         """Test getting a backend by name."""
         manager._backends["test-backend"] = mock_backend
-        manager._loaded = True
 
         backend = manager.get_backend("test-backend")
         assert backend == mock_backend
 
     def test_get_backend_not_found(self, manager):
         """Test getting a non-existent backend."""
-        manager._loaded = True
-
         with pytest.raises(ValueError, match="Storage backend .* not found"):
             manager.get_backend("nonexistent")
 
     def test_backends_property(self, manager, mock_backend):
         """Test backends property returns all backends."""
         manager._backends["test-backend"] = mock_backend
-        manager._loaded = True
 
         backends = manager.backends()
         assert "test-backend" in backends
+        assert "purestorage" in backends
         assert backends["test-backend"] == mock_backend
+        assert backends.get("nonexistent") is None
 
     def test_get_all_storage_manifests(self, manager, mock_backend):
         """Test getting all storage manifests."""
         manager._backends["test-backend"] = mock_backend
-        manager._loaded = True
 
         manifests = manager.get_all_storage_manifests()
         assert isinstance(manifests, dict)
@@ -226,31 +142,66 @@ class TestStorageBackendManager:
     def test_register_cli_commands(self, manager, mock_backend, mock_deployment):
         """Test CLI command registration."""
         manager._backends["test-backend"] = mock_backend
-        manager._loaded = True
 
         mock_storage_group = Mock(spec=click.Group)
 
-        manager.register_cli_commands(mock_storage_group, mock_deployment)
-
-        # Verify that backend's register_add_cli was called
-        mock_backend.register_add_cli.assert_called_once()
+        with patch("importlib.import_module") as mock_import:
+            manager.register_cli_commands(mock_storage_group, mock_deployment)
+            mock_import.assert_not_called()
 
         # Verify that commands were added to the group
         assert mock_storage_group.add_command.called
+        add_group = _registered(mock_storage_group, "add")
+        assert "test-backend" in add_group.list_commands(Mock())
+        assert "purestorage" in add_group.list_commands(Mock())
+        # Backend commands are registered on first lookup
+        mock_backend.register_add_cli.assert_not_called()
+        add_group.get_command(Mock(), "test-backend")
+        mock_backend.register_add_cli.assert_called_once_with(add_group)
 
     def test_register_cli_commands_handles_backend_errors(
         self, manager, mock_backend, mock_deployment
     ):
         """Test that CLI registration handles backend errors."""
         manager._backends["test-backend"] = mock_backend
-        manager._loaded = True
         mock_backend.register_add_cli.side_effect = ValueError("Backend error")
 
         mock_storage_group = Mock(spec=click.Group)
 
+        manager.register_cli_commands(mock_storage_group, mock_deployment)
+        add_group = _registered(mock_storage_group, "add")
         with pytest.raises(ValueError):
+            add_group.get_command(Mock(), "test-backend")
+
+    def test_register_cli_commands_skips_disabled_backends(
+        self, manager, mock_backend, mock_deployment
+    ):
+        """Test that gated backends are not listed."""
+        mock_backend.check_enabled.return_value = False
+        mock_storage_group = Mock(spec=click.Group)
+
+        with patch.object(BackendEntry, "check_enabled", return_value=False):
             manager.register_cli_commands(mock_storage_group, mock_deployment)
 
+        add_group = _registered(mock_storage_group, "add")
+        assert add_group.list_commands(Mock()) == []
+        assert add_group.get_command(Mock(), "test-backend") is None
+
+    def test_add_group_help_does_not_load_backends(
+        self, manager, mock_backend, mock_deployment
+    ):
+        """Test that the help of the add group is built from the index."""
+        storage_group = click.Group("storage")
+        with patch("importlib.import_module") as mock_import:
+            manager.register_cli_commands(storage_group, mock_deployment)
+            result = CliRunner().invoke(storage_group, ["add", "--help"])
+            mock_import.assert_not_called()
+
+        assert result.exit_code == 0
+        assert "Add Pure Storage FlashArray backend." in result.output
+        assert "Add Test Backend backend." in result.output
+        mock_backend.register_add_cli.assert_not_called()
+
     def test_display_backends_table_empty(self, manager):
         """Test displaying empty backend list."""
         from rich.console import Console
@@ -305,7 +256,6 @@ class TestStorageCLICommands:
             "sunbeam.storage.manager.StorageBackendService", return_value=mock_service
         ):
             with patch.object(manager, "_display_backends_table"):
-                manager._loaded = True
                 mock_storage_group = Mock(spec=click.Group)
                 manager.register_cli_commands(mock_storage_group, mock_deployment)
 
@@ -323,7 +273,6 @@ class TestStorageCLICommands:
         """Test the remove command with successful removal."""
         mock_backend = Mock()
         manager._backends["test-backend"] = mock_backend
-        manager._loaded = True
 
         mock_storage_group = Mock(spec=click.Group)
 
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the static storage backend index."""
+
+import pathlib
+
+import pytest
+
+import sunbeam.storage.backends
+from sunbeam.storage.base import StorageBackendBase
+from sunbeam.storage.registry import BACKENDS
+
+BACKENDS_DIR = pathlib.Path(sunbeam.storage.backends.__file__).parent
+
+
+def test_index_covers_backend_directories():
+    """Every backend package must be declared in the index."""
+    directories = {
+        path.name
+        for path in BACKENDS_DIR.iterdir()
+        if path.is_dir() and (path / "backend.py").exists()
+    }
+
+    assert {entry.backend_type for entry in BACKENDS} == directories
+
+
+@pytest.mark.parametrize("entry", BACKENDS, ids=lambda entry: entry.backend_type)
+def test_index_matches_backend(entry):
+    """Index metadata must match the backend implementation."""
+    backend = entry.load()
+
+    assert isinstance(backend, StorageBackendBase)
+    assert backend.backend_type == entry.backend_type
+    assert backend.display_name == entry.display_name
+    assert backend.generally_available == entry.generally_available
+    assert backend.gate_key == entry.gate_key
@@ -1,17 +1,22 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import base64
 import json
 import logging
 import subprocess
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, Mock, patch
 
+import httpx
 import pytest
 from requests.exceptions import HTTPError
 
 import sunbeam.clusterd.service as service
 import sunbeam.core.questions
-from sunbeam.clusterd.cluster import ClusterService
+from sunbeam.clusterd import aio, client, models
+from sunbeam.clusterd.cluster import WATCH_TIMEOUT_MARGIN, ClusterService
 from sunbeam.clusterd.service import ConfigItemNotFoundException
 from sunbeam.core.common import ResultType
 from sunbeam.core.juju import ApplicationNotFoundException
@@ -26,8 +31,10 @@ from sunbeam.steps.clusterd import (
     ClusterUpdateJujuUserStep,
     ClusterUpdateNodeStep,
     DeploySunbeamClusterdApplicationStep,
+    JoinCoalescer,
     PromptCheckNodeExistStep,
     SaveManagementCidrStep,
+    WaitForJoinCoalescingStep,
 )
 
 
@@ -802,6 +809,203 @@ class TestClusterService:
         cs = ClusterService(mock_session, "http+unix://mock")
         cs.update_node_info("node-2", ["control"], 2)
 
+    def test_lock_terraform_plan_conflict(self):
+        held_lock = {"ID": "other-id", "Who": "node-1"}
+        encoded_lock = base64.b64encode(json.dumps(held_lock).encode()).decode()
+        mock_response = self._mock_response(status=409, json_data=encoded_lock)
+        mock_response.raise_for_status.side_effect = HTTPError(
+            "Conflict", response=mock_response
+        )
+
+        mock_session = MagicMock()
+        mock_session.request.return_value = mock_response
+
+        cs = ClusterService(mock_session, "http+unix://mock")
+        with pytest.raises(service.TerraformLockConflictException) as e:
+            cs.lock_terraform_plan("plan", {"ID": "my-id", "Who": "node-2"})
+        assert e.value.lock == held_lock
+
+    def test_lock_terraform_plan_already_held(self):
+        mock_response = self._mock_response(status=423, json_data="e30=")
+        mock_response.raise_for_status.side_effect = HTTPError(
+            "Locked", response=mock_response
+        )
+
+        mock_session = MagicMock()
+        mock_session.request.return_value = mock_response
+
+        cs = ClusterService(mock_session, "http+unix://mock")
+        cs.lock_terraform_plan("plan", {"ID": "my-id", "Who": "node-2"})
+
+    def test_get_terraform_state(self):
+        state = {"serial": 1, "lineage": "abc", "resources": []}
+        mock_response = self._mock_response(status=200, json_data=state)
+        mock_response.headers = {"ETag": '"digest"'}
+        mock_session = MagicMock()
+        mock_session.request.return_value = mock_response
+
+        cs = ClusterService(mock_session, "http+unix://mock")
+        assert cs.get_terraform_state("plan") == (state, '"digest"')
+        mock_session.request.assert_called_once_with(
+            method="get",
+            url="http+unix://mock/1.0/terraformstate/plan",
+            cert=None,
+            timeout=None,
+            headers={},
+            allow_redirects=True,
+        )
+
+    def test_get_terraform_state_not_modified(self):
+        mock_response = self._mock_response(status=304)
+        mock_session = MagicMock()
+        mock_session.request.return_value = mock_response
+
+        cs = ClusterService(mock_session, "http+unix://mock")
+        assert cs.get_terraform_state("plan", '"digest"') == (None, '"digest"')
+        assert mock_session.request.call_args.kwargs["headers"] == {
+            "If-None-Match": '"digest"'
+        }
+        mock_response.json.assert_not_called()
+
+    def _revisions_response(self, revision, **tables):
+        return self._mock_response(
+            json_data={"metadata": {"revision": revision, "tables": tables}}
+        )
+
+    def test_get_revisions(self):
+        mock_session = MagicMock()
+        mock_session.request.return_value = self._revisions_response(
+            4, config=4, nodes=2
+        )
+
+        cs = ClusterService(mock_session, "http+unix://mock")
+        revisions = cs.get_revisions()
+
+        assert revisions.revision == 4
+        assert revisions.tables == {"config": 4, "nodes": 2}
+
+    def test_watch(self):
+        mock_session = MagicMock()
+        mock_session.request.side_effect = [
+            self._revisions_response(4, config=4, nodes=2),
+            # Long-poll timed out without changes
+            self._revisions_response(4, config=4, nodes=2),
+            self._revisions_response(5, config=4, nodes=5),
+        ]
+
+        cs = ClusterService(mock_session, "http+unix://mock")
+        watch = cs.watch(timeout=5)
+        revisions = next(watch)
+
+        assert revisions.revision == 5
+        assert mock_session.request.call_count == 3
+        call = mock_session.request.call_args
+        assert call.kwargs["params"] == {"since": 4, "timeout": 5}
+        assert call.kwargs["timeout"] == 5 + WATCH_TIMEOUT_MARGIN
+
+    def test_revisions_changed_since(self):
+        previous = models.Revisions(revision=4, tables={"config": 4, "nodes": 2})
+        current = models.Revisions(
+            revision=6, tables={"config": 4, "nodes": 5, "manifest": 6}
+        )
+
+        assert current.changed_since(previous) == {"nodes", "manifest"}
+
+
+class TestClientCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        client.clear_client_cache()
+        yield
+        client.clear_client_cache()
+
+    def test_from_http_is_cached(self):
+        with (
+            patch.object(client, "MTLSAdapter"),
+            patch.object(client, "to_file_path_certs") as to_file_path_certs,
+        ):
+            to_file_path_certs.return_value = ("cert", "key")
+            first = client.Client.from_http("https://10.0.0.1:7000", "ca", "c", "k")
+            second = client.Client.from_http("https://10.0.0.1:7000", "ca", "c", "k")
+            other = client.Client.from_http("https://10.0.0.2:7000", "ca", "c", "k")
+
+        assert first is second
+        assert other is not first
+        # Certificates are templated once per client.
+        assert to_file_path_certs.call_count == 2
+
+    def test_clear_client_cache(self):
+        first = client.Client.from_http("http+unix://mock")
+        client.clear_client_cache()
+        assert client.Client.from_http("http+unix://mock") is not first
+
+
+def _async_cluster(handler) -> aio.AsyncClusterService:
+    return aio.AsyncClusterService(
+        httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="http://clusterd"
+        )
+    )
+
+
+class TestAsyncClusterService:
+    def test_get_nodes_info_concurrently(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            name = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={"metadata": {"name": name}})
+
+        cluster = _async_cluster(handler)
+        nodes = asyncio.run(cluster.get_nodes_info(["node-1", "node-2", "node-3"]))
+
+        assert [node["name"] for node in nodes] == ["node-1", "node-2", "node-3"]
+        assert max_in_flight == 3
+
+    def test_list_nodes_by_role(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.query == b"role=control&role=compute"
+            return httpx.Response(200, json={"metadata": [{"name": "node-1"}]})
+
+        cluster = _async_cluster(handler)
+        nodes = asyncio.run(cluster.list_nodes_by_role(["control", "compute"]))
+
+        assert nodes == [{"name": "node-1"}]
+
+    def test_error_translated(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                404, json={"type": "error", "error": "ConfigItem not found"}
+            )
+
+        cluster = _async_cluster(handler)
+        with pytest.raises(ConfigItemNotFoundException):
+            asyncio.run(cluster.get_config("missing"))
+
+    def test_unknown_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500, json={"type": "error", "error": "boom"})
+
+        cluster = _async_cluster(handler)
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(cluster.get_config("key"))
+
+    def test_socket_not_found(self, tmp_path):
+        async def get_config():
+            async with aio.AsyncClient(
+                aio.UNIX_SCHEME + str(tmp_path / "missing.socket")
+            ) as async_client:
+                await async_client.cluster.get_config("key")
+
+        with pytest.raises(service.ClusterServiceUnavailableException):
+            asyncio.run(get_config())
+
 
 class TestClusterUpdateJujuControllerStep:
     """Unit tests for sunbeam clusterd steps."""
@@ -955,3 +1159,173 @@ class TestSaveManagementCidrStep:
         step.variables = {"bootstrap": {}}
         result = step.run(step_context)
         assert result.result_type == ResultType.FAILED
+
+
+class TestJoinCoalescer:
+    @pytest.fixture(autouse=True)
+    def sleep(self, mocker):
+        yield mocker.patch("sunbeam.steps.clusterd.time.sleep")
+
+    def _batch(self, id, nodes, status="completed"):
+        return json.dumps({"id": id, "nodes": nodes, "status": status})
+
+    def _stored(self, cclient, coalescer):
+        """Make clusterd report the lock of coalescer as the stored one."""
+        cclient.cluster.get_terraform_lock.side_effect = lambda plan: dict(
+            coalescer.lock
+        )
+
+    def _lock(self, who, age):
+        created = datetime.now(tz=timezone.utc) - timedelta(seconds=age)
+        return {"ID": f"{who}-lock", "Who": who, "Created": created.isoformat()}
+
+    def test_wait_elected_leader(self, cclient):
+        cclient.cluster.get_config.side_effect = ConfigItemNotFoundException
+        coalescer = JoinCoalescer(cclient, "node-2", 30)
+        self._stored(cclient, coalescer)
+
+        assert coalescer.wait() is True
+        assert coalescer.is_leader
+        cclient.cluster.lock_terraform_plan.assert_called_once_with(
+            "join-coalescing", coalescer.lock
+        )
+
+    def test_wait_reconciled_by_leader(self, cclient):
+        cclient.cluster.get_config.side_effect = [
+            self._batch("old", ["node-1"]),
+            self._batch("old", ["node-1"]),
+            self._batch("new", ["node-1", "node-2"], status="running"),
+            self._batch("new", ["node-1", "node-2"]),
+        ]
+        cclient.cluster.lock_terraform_plan.side_effect = (
+            service.TerraformLockConflictException("locked", {"Who": "node-1"})
+        )
+        coalescer = JoinCoalescer(cclient, "node-2", 30)
+
+        assert coalescer.wait() is False
+        assert not coalescer.is_leader
+        cclient.cluster.unlock_terraform_plan.assert_not_called()
+
+    def test_wait_previous_batch_ignored(self, cclient):
+        # A batch completed before registration does not account for the node
+        cclient.cluster.get_config.return_value = self._batch("old", ["node-2"])
+        coalescer = JoinCoalescer(cclient, "node-2", 30)
+        self._stored(cclient, coalescer)
+
+        assert coalescer.wait() is True
+
+    def test_wait_lock_stored_by_other_node(self, cclient):
+        # Concurrent requests all got the lock, only the stored one leads
+        cclient.cluster.get_config.side_effect = [
+            self._batch("old", ["node-1"]),
+            self._batch("old", ["node-1"]),
+            self._batch("new", ["node-1", "node-2"]),
+        ]
+        cclient.cluster.get_terraform_lock.return_value = self._lock("node-1", 0)
+        coalescer = JoinCoalescer(cclient, "node-2", 30)
+
+        assert coalescer.wait() is False
+        assert not coalescer.is_leader
+
+    def test_wait_conflict_without_holder(self, cclient):
+        cclient.cluster.get_config.side_effect = ConfigItemNotFoundException
+        cclient.cluster.lock_terraform_plan.side_effect = (
+            service.TerraformLockConflictException("locked", None)
+        )
+        coalescer = JoinCoalescer(cclient, "node-2", 30, timeout=0)
+
+        with pytest.raises(TimeoutError):
+            coalescer.wait()
+        assert not coalescer.is_leader
+
+    def test_wait_breaks_stale_lock(self, cclient):
+        cclient.cluster.get_config.side_effect = ConfigItemNotFoundException
+        stale = self._lock("node-1", 7200)
+        cclient.cluster.lock_terraform_plan.side_effect = [
+            service.TerraformLockConflictException("locked", stale),
+            None,
+        ]
+        coalescer = JoinCoalescer(cclient, "node-2", 30, stale_age=3600)
+        self._stored(cclient, coalescer)
+
+        assert coalescer.wait() is True
+        cclient.cluster.unlock_terraform_plan.assert_called_once_with(
+            "join-coalescing", stale
+        )
+
+    def test_wait_keeps_recent_lock(self, cclient):
+        cclient.cluster.get_config.side_effect = ConfigItemNotFoundException
+        cclient.cluster.lock_terraform_plan.side_effect = (
+            service.TerraformLockConflictException("locked", self._lock("node-1", 60))
+        )
+        coalescer = JoinCoalescer(cclient, "node-2", 30, timeout=0, stale_age=3600)
+
+        with pytest.raises(TimeoutError):
+            coalescer.wait()
+        cclient.cluster.unlock_terraform_plan.assert_not_called()
+
+    def test_wait_stale_lock_broken_by_other_node(self, cclient):
+        cclient.cluster.get_config.side_effect = ConfigItemNotFoundException
+        cclient.cluster.lock_terraform_plan.side_effect = (
+            service.TerraformLockConflictException("locked", self._lock("node-1", 7200))
+        )
+        cclient.cluster.unlock_terraform_plan.side_effect = HTTPError("conflict")
+        coalescer = JoinCoalescer(cclient, "node-2", 30, timeout=0, stale_age=3600)
+
+        with pytest.raises(TimeoutError):
+            coalescer.wait()
+
+    def test_wait_timeout(self, cclient):
+        cclient.cluster.get_config.side_effect = ConfigItemNotFoundException
+        cclient.cluster.lock_terraform_plan.side_effect = (
+            service.TerraformLockConflictException("locked", {"Who": "node-1"})
+        )
+        coalescer = JoinCoalescer(cclient, "node-2", 30, timeout=0)
+
+        with pytest.raises(TimeoutError):
+            coalescer.wait()
+
+    def test_reconcile_records_batch(self, cclient):
+        cclient.cluster.list_nodes.return_value = [
+            {"name": "node-2", "machineid": 2},
+            {"name": "node-1", "machineid": 1},
+            {"name": "node-3", "machineid": -1},
+        ]
+        coalescer = JoinCoalescer(cclient, "node-2", 30)
+        coalescer.is_leader = True
+
+        with coalescer.reconcile() as nodes:
+            assert nodes == ["node-1", "node-2"]
+
+        last_batch = json.loads(cclient.cluster.update_config.call_args.args[1])
+        assert last_batch["status"] == "completed"
+        assert last_batch["nodes"] == ["node-1", "node-2"]
+        cclient.cluster.unlock_terraform_plan.assert_called_once_with(
+            "join-coalescing", coalescer.lock
+        )
+        assert not coalescer.is_leader
+
+    def test_reconcile_failure_recorded(self, cclient):
+        cclient.cluster.list_nodes.return_value = [{"name": "node-2", "machineid": 2}]
+        coalescer = JoinCoalescer(cclient, "node-2", 30)
+
+        with pytest.raises(RuntimeError):
+            with coalescer.reconcile():
+                raise RuntimeError("apply failed")
+
+        last_batch = json.loads(cclient.cluster.update_config.call_args.args[1])
+        assert last_batch["status"] == "failed"
+        cclient.cluster.unlock_terraform_plan.assert_called_once()
+
+    def test_step_completed(self, step_context):
+        coalescer = Mock()
+        coalescer.wait.return_value = True
+        result = WaitForJoinCoalescingStep(coalescer).run(step_context)
+        assert result.result_type == ResultType.COMPLETED
+        assert result.message == ""
+
+    def test_step_timeout(self, step_context):
+        coalescer = Mock()
+        coalescer.wait.side_effect = TimeoutError("timed out")
+        result = WaitForJoinCoalescingStep(coalescer).run(step_context)
+        assert result.result_type == ResultType.FAILED
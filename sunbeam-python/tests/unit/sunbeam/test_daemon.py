@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import os
+import subprocess
+import sys
+import time
+import types
+from unittest.mock import patch
+
+import pytest
+
+from sunbeam import daemon
+
+
+@pytest.fixture
+def daemon_env(monkeypatch, tmp_path):
+    monkeypatch.setenv(daemon.DAEMON_ENV, "1")
+    monkeypatch.setenv("SNAP_USER_COMMON", str(tmp_path))
+    monkeypatch.setenv("SNAP_REVISION", "42")
+    yield tmp_path
+
+
+class TestForward:
+    def test_disabled(self, monkeypatch):
+        monkeypatch.delenv(daemon.DAEMON_ENV, raising=False)
+        with patch.object(daemon, "socket") as mock_socket:
+            assert daemon.forward(["sunbeam", "plans"]) is None
+        mock_socket.socket.assert_not_called()
+
+    def test_interactive(self, daemon_env):
+        with (
+            patch.object(daemon.os, "isatty", return_value=True),
+            patch.object(daemon, "socket") as mock_socket,
+        ):
+            assert daemon.forward(["sunbeam", "plans"]) is None
+        mock_socket.socket.assert_not_called()
+
+    def test_no_daemon_spawns_one(self, daemon_env):
+        with (
+            patch.object(daemon.os, "isatty", return_value=False),
+            patch.object(daemon, "_spawn_daemon") as mock_spawn,
+        ):
+            assert daemon.forward(["sunbeam", "plans"]) is None
+        mock_spawn.assert_called_once_with(daemon_env / daemon.DAEMON_SOCKET)
+
+
+_FAKE_MAIN = """
+import os, sys, types
+from pathlib import Path
+
+def main():
+    print("ran", os.environ["FOO"], os.environ.get("SUNBEAM_DAEMON"))
+    sys.exit(3)
+
+sys.modules["sunbeam.main"] = types.SimpleNamespace(main=main)
+from sunbeam import daemon
+daemon.PRELOAD_MODULES = []
+daemon.serve(Path(sys.argv[1]), idle_timeout=1)
+"""
+
+
+def _serve(path) -> subprocess.Popen:
+    """Start a daemon serving requests with a fake CLI entrypoint."""
+    process = subprocess.Popen(
+        [sys.executable, "-c", _FAKE_MAIN, str(path)], env=dict(os.environ)
+    )
+    for _ in range(100):
+        if path.exists():
+            break
+        time.sleep(0.05)
+    return process
+
+
+def _forward(env: dict) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from sunbeam import daemon; "
+            "sys.exit(100 if (rc := daemon.forward(['sunbeam'])) is None else rc)",
+        ],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_daemon_round_trip(daemon_env):
+    path = daemon_env / daemon.DAEMON_SOCKET
+    process = _serve(path)
+
+    result = _forward({**os.environ, "FOO": "bar"})
+    assert result.returncode == 3
+    assert result.stdout == "ran bar None\n"
+
+    # A client from another snap revision runs in-process, the daemon exits.
+    result = _forward({**os.environ, "SNAP_REVISION": "43"})
+    assert result.returncode == 100
+    assert process.wait(timeout=10) == 0
+    assert not path.exists()
+
+
+def test_entry_forwards_without_importing_cli(daemon_env):
+    path = daemon_env / daemon.DAEMON_SOCKET
+    process = _serve(path)
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from sunbeam import _entry\n"
+            "try:\n"
+            "    _entry.main()\n"
+            "finally:\n"
+            "    print('sunbeam.main' in sys.modules, file=sys.stderr)",
+        ],
+        env={**os.environ, "FOO": "bar"},
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 3
+    assert result.stdout == "ran bar None\n"
+    assert result.stderr == "False\n"
+    process.terminate()
+    process.wait(timeout=10)
+
+
+def test_redetect_consoles(monkeypatch):
+    from rich.color import ColorSystem
+    from rich.console import Console
+
+    console = Console(file=io.StringIO())
+    assert console.color_system is None
+    module = types.ModuleType("sunbeam.fake_commands")
+    module.console = console  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "sunbeam.fake_commands", module)
+
+    # The forked child writes to the client's terminal.
+    with patch.object(
+        Console, "_detect_color_system", return_value=ColorSystem.TRUECOLOR
+    ):
+        daemon._redetect_consoles()
+    assert console.color_system == "truecolor"
+
+
+def test_preload_failure_is_left_to_the_child(monkeypatch):
+    monkeypatch.setattr(daemon, "PRELOAD_MODULES", ["sunbeam.fake_cli"])
+    with patch.object(
+        daemon.importlib, "import_module", side_effect=RuntimeError("not a snap")
+    ):
+        daemon._preload()
@@ -120,7 +120,7 @@ class TestListFeatureGates:
 
         # Mock storage and feature managers
         storage_manager = Mock()
-        storage_manager.backends.return_value = {}
+        storage_manager.entries.return_value = {}
         deployment.get_storage_manager.return_value = storage_manager
 
         feature_manager = Mock()
@@ -159,7 +159,7 @@ class TestListFeatureGates:
 
         # Mock storage and feature managers
         storage_manager = Mock()
-        storage_manager.backends.return_value = {}
+        storage_manager.entries.return_value = {}
         deployment.get_storage_manager.return_value = storage_manager
 
         feature_manager = Mock()
@@ -197,7 +197,7 @@ class TestListFeatureGates:
 
         # Mock storage and feature managers
         storage_manager = Mock()
-        storage_manager.backends.return_value = {}
+        storage_manager.entries.return_value = {}
         deployment.get_storage_manager.return_value = storage_manager
 
         feature_manager = Mock()
@@ -237,7 +237,7 @@ class TestListFeatureGates:
         mock_backend.backend_type = "test-backend"
 
         storage_manager = Mock()
-        storage_manager.backends.return_value = {"test-backend": mock_backend}
+        storage_manager.entries.return_value = {"test-backend": mock_backend}
         deployment.get_storage_manager.return_value = storage_manager
 
         feature_manager = Mock()
@@ -273,7 +273,7 @@ class TestListFeatureGates:
         mock_feature.name = "test-feature"
 
         storage_manager = Mock()
-        storage_manager.backends.return_value = {}
+        storage_manager.entries.return_value = {}
         deployment.get_storage_manager.return_value = storage_manager
 
         feature_manager = Mock()
@@ -309,7 +309,7 @@ class TestListFeatureGates:
 
         # Mock storage and feature managers
         storage_manager = Mock()
-        storage_manager.backends.return_value = {}
+        storage_manager.entries.return_value = {}
         deployment.get_storage_manager.return_value = storage_manager
 
         feature_manager = Mock()
@@ -348,7 +348,7 @@ class TestListFeatureGates:
 
         # Mock storage and feature managers
         storage_manager = Mock()
-        storage_manager.backends.return_value = {}
+        storage_manager.entries.return_value = {}
         deployment.get_storage_manager.return_value = storage_manager
 
         feature_manager = Mock()
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import gzip
+import logging
+
+from sunbeam import log
+
+
+def _record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.DEBUG, __file__, 1, msg, None, None)
+
+
+def test_rotating_file_handler_compresses_backups(tmp_path):
+    logfile = tmp_path / "sunbeam.log"
+    handler = log.rotating_file_handler(logfile, max_bytes=100, backup_count=2)
+    try:
+        for i in range(10):
+            handler.emit(_record(f"line {i} " + "x" * 40))
+    finally:
+        handler.close()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "sunbeam.log",
+        "sunbeam.log.1.gz",
+        "sunbeam.log.2.gz",
+    ]
+    with gzip.open(tmp_path / "sunbeam.log.1.gz", "rt") as f:
+        assert "line 8" in f.read()
+
+
+def test_queue_handler_writes_on_close(tmp_path):
+    logfile = tmp_path / "sunbeam.log"
+    file_handler = log.rotating_file_handler(logfile)
+    handler = log.QueueHandler(file_handler)
+
+    for i in range(100):
+        handler.handle(_record(f"line {i}"))
+    handler.close()
+    handler.close()
+    file_handler.close()
+
+    lines = logfile.read_text().splitlines()
+    assert len(lines) == 100
+    assert lines[-1].endswith("test DEBUG line 99")
+    assert handler.listener is None
+
+
+def test_prepare_logfile_removes_rotated_backups(tmp_path, monkeypatch):
+    monkeypatch.setattr(log, "MAX_LOG_FILES", 2)
+    old = tmp_path / "sunbeam-20250101-000000.000000.log"
+    recent = tmp_path / "sunbeam-20250102-000000.000000.log"
+    for path in (old, recent):
+        path.touch()
+        (tmp_path / f"{path.name}.1.gz").touch()
+
+    logfile = log.prepare_logfile(tmp_path, "sunbeam")
+
+    assert logfile.parent == tmp_path
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        recent.name,
+        f"{recent.name}.1.gz",
+    ]
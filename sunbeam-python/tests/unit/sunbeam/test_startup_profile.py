@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2025 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import subprocess
+import sys
+
+from sunbeam import startup_profile
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      3049 |     875221 | sunbeam.main
+import time:      6438 |     458917 |   sunbeam.commands.configure
+some unrelated stderr line
+"""
+
+# Import the CLI entrypoint the way the snap does, without a snapd to answer
+# the feature gate lookups done at import time.
+IMPORT_CLI = """
+import json, sys
+import snaphelpers._conf
+snaphelpers._conf.SnapConfig.get = lambda self, key, default=None: default
+import sunbeam.main
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def test_parse_importtime():
+    records = startup_profile.parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert records == [
+        startup_profile.ImportRecord("_io", 120, 120, 1),
+        startup_profile.ImportRecord("sunbeam.main", 3049, 875221, 0),
+        startup_profile.ImportRecord("sunbeam.commands.configure", 6438, 458917, 1),
+    ]
+
+
+def test_format_report_ranks_by_cumulative_time():
+    records = startup_profile.parse_importtime(IMPORTTIME_OUTPUT)
+
+    report = startup_profile.format_report(records, top=2).splitlines()
+
+    assert len(report) == 3
+    assert report[1].endswith("sunbeam.main")
+    assert report[2].endswith("sunbeam.commands.configure")
+
+
+def test_heavy_imports():
+    modules = ["openstack", "openstack.compute", "openstackclient", "lightkube"]
+
+    assert startup_profile.heavy_imports(modules) == [
+        "openstack",
+        "openstack.compute",
+    ]
+
+
+def test_cli_import_budget(snap_env):
+    process = subprocess.run(
+        [sys.executable, "-c", IMPORT_CLI],
+        env=dict(snap_env),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules = json.loads(process.stdout.splitlines()[-1])
+    assert "sunbeam.main" in modules
+    assert startup_profile.heavy_imports(modules) == []